@@ -39,12 +39,52 @@ config = {
         "img_host_8": "dalexni",
         "img_host_9": "zipline",
 
+        # Start an upload on the next image host in the list when the current one takes longer than hedge_latency
+        # seconds (or a few times its usual upload time) or fails, keeping whichever finishes first. Hosts that
+        # keep failing or being slow during the run are tried last. Custom image lists are never hedged.
+        # "hedged_uploads": False,
+        # "hedge_latency": 15,
+
+        # Remember which URL every screenshot was uploaded to per image host (by SHA-256 of the image, in
+        # data/cache/uploads), and reuse it instead of uploading the same image to the same host again.
+        # Entries older than image_upload_cache_days are uploaded again, in case the host pruned the image.
+        # "image_upload_cache": True,
+        # "image_upload_cache_days": 30,
+
         # Number of screenshots to capture
         "screens": "6",
 
         # Tonemap HDR screenshots
         "tone_map": False,
 
+        # Tonemap with a 3D LUT rendered once per set of HDR metadata (cached in data/cache/tonemap) instead of
+        # running the zscale/tonemap chain on every frame. The LUT is an approximation of the chain, and its peak
+        # comes from the first frame's HDR metadata only, while the chain reads each frame's own side data.
+        # Check the difference before enabling with: python -m src.takescreens <video> 6 --tonemap
+        # "tonemap_lut": False,
+
+        # Capture all screenshots of a file with a single ffmpeg process instead of one per image.
+        # Any image the batched capture misses is retried one at a time.
+        # "batch_screenshots": True,
+
+        # Pick screenshot timestamps on keyframes, so ffmpeg does not have to decode forward from the
+        # previous keyframe for each image. The keyframe index is built with ffprobe and cached per file.
+        # "keyframe_index": False,
+
+        # Sample a few candidate frames per screenshot at low resolution and capture the best looking ones,
+        # skipping black frames, fades and credits before any full size image is made.
+        # Costs an extra decode per candidate, so it is off by default.
+        # "screenshot_precheck": False,
+
+        # Output profile per image host. Screenshots are stored as PNGs, optimized with oxipng at level (0-6) for
+        # PNG hosts. Hosts set to another lossless format (webp, or jxl with pillow-jxl-plugin installed) skip
+        # oxipng and get a re-encoded, smaller file at upload, with effort setting the encoder effort.
+        # Only use formats your image host and trackers accept. max_size is in bytes.
+        # "image_encoder_profiles": {
+        #     "ptscreens": {"format": "webp", "effort": 4},
+        #     "imgbb": {"format": "png", "level": 4, "max_size": 31000000},
+        # },
+
         # Number of cutoff screenshots
         # If there are at least this many screenshots already, perhaps pulled from existing
         # description, skip creating and uploading any further screenshots.
@@ -128,6 +168,38 @@ config = {
         # set true to use mkbrr for torrent creation
         "mkbrr": False,
 
+        # Number of processes used to hash pieces when creating torrents without mkbrr. Defaults to the CPU count (max 8).
+        # Set to 1 to use torf's built in hasher instead. Compare the two with: python -m src.piecehasher <path>
+        # "hash_processes": 4,
+
+        # Piece hashes are cached in data/cache/pieces.db so re-hashing unchanged content (--rehash, a deleted BASE.torrent) is near instant.
+        # Maximum size of the cache in MiB, 0 disables it. --cleanup empties it.
+        # "piece_cache_size": 64,
+
+        # When using --queue-pipeline, the maximum number of queue items allowed inside each stage at once.
+        # Items flow prep -> screens -> images -> hash -> upload, so one item can be hashing while the next takes screenshots.
+        # prep is always limited to 1 unless running unattended, since it asks for confirmation.
+        # "pipeline_stage_limits": {"prep": 1, "screens": 1, "images": 2, "hash": 1, "upload": 1},
+
+        # TMDb, IMDb and TVmaze responses are cached in data/cache/metadata.db so repeated uploads of the same title skip the lookups.
+        # Time to live per source in seconds, and the maximum number of cached responses before the least recently used are dropped.
+        # Use --no-cache to bypass the cache, or --refresh-cache to fetch fresh data and update it.
+        # "metadata_cache_ttl": {"tmdb": 604800, "imdb": 604800, "tvmaze": 86400},
+        # "metadata_cache_size": 5000,
+
+        # All trackers and metadata lookups share one pool of keep-alive HTTP connections (HTTP/2 if the h2 package is installed).
+        # Maximum concurrent requests to a single host, and how many times to retry connection failures or 429/5xx responses.
+        # "http_host_limit": 6,
+        # "http_retries": 2,
+
+        # Number of trackers to upload to at the same time, 1 uploads to each tracker in turn. Can also be set with --concurrent-uploads.
+        # Each tracker works on its own copy of meta, and a table of results is shown once all uploads finish.
+        # "concurrent_uploads": 1,
+
+        # Seconds to wait after uploading to a tracker before adding the torrent to the client.
+        # Uploads to the same tracker are never overlapped, so this also spaces out uploads to that tracker.
+        # "tracker_upload_delays": {"SN": 16, "PTP": 5},
+
     },
 
     # these are used for DB links on AR
@@ -23,6 +23,8 @@ class Args():
         parser.add_argument('path', nargs='*', help="Path to file/directory")
         parser.add_argument('--queue', nargs='*', required=False, help="(--queue queue_name) Process an entire folder (files/subfolders) in a queue")
         parser.add_argument('-lq', '--limit-queue', dest='limit_queue', nargs='?', required=False, help="Limit the amount of queue files procesed", type=int, default=0)
+        parser.add_argument('-qp', '--queue-pipeline', dest='queue_pipeline', nargs='?', const=2, required=False, help="Overlap prep, screenshots, image uploads, hashing and tracker uploads across this many queue items (default 2)", type=int, default=0)
+        parser.add_argument('-cu', '--concurrent-uploads', dest='concurrent_uploads', nargs='?', const=4, required=False, help="Upload to this many trackers at once (default 4)", type=int, default=0)
         parser.add_argument('--unit3d', action='store_true', required=False, help="[parse a txt output file from UNIT3D-Upload-Checker]")
         parser.add_argument('-s', '--screens', nargs='*', required=False, help="Number of screenshots", default=int(self.config['DEFAULT']['screens']))
         parser.add_argument('-mf', '--manual_frames', required=False, help="Comma-separated frame numbers to use as screenshots", type=str, default=None)
@@ -105,7 +107,9 @@ class Args():
         parser.add_argument('-ua', '--unattended', action='store_true', required=False, help=argparse.SUPPRESS)
         parser.add_argument('-uac', '--unattended-confirm', action='store_true', required=False, help=argparse.SUPPRESS)
         parser.add_argument('-vs', '--vapoursynth', action='store_true', required=False, help="Use vapoursynth for screens (requires vs install)")
-        parser.add_argument('-cleanup', '--cleanup', action='store_true', required=False, help="Clean up tmp directory")
+        parser.add_argument('-cleanup', '--cleanup', action='store_true', required=False, help="Clean up tmp directory and the piece hash cache")
+        parser.add_argument('-nc', '--no-cache', action='store_true', required=False, dest='no_cache', help="Do not read or write the TMDb/IMDb/TVmaze metadata cache")
+        parser.add_argument('-rc', '--refresh-cache', action='store_true', required=False, dest='refresh_cache', help="Ignore cached TMDb/IMDb/TVmaze metadata and store fresh responses")
         parser.add_argument('-dm', '--delete-meta', action='store_true', required=False, dest='delete_meta', help="Delete only meta.json from tmp directory")
         parser.add_argument('-fl', '--freeleech', nargs='*', required=False, help="Freeleech Percentage", default=0, dest="freeleech")
         parser.add_argument('--infohash', nargs='*', required=False, help="V1 Info Hash")
@@ -1,4 +1,5 @@
 import httpx
+from src.httpclient import http_service
 import uuid
 from src.bbcode import BBCODE
 
@@ -23,7 +24,7 @@ async def get_btn_torrents(btn_api, btn_id, meta):
 
     headers = {"Content-Type": "application/json"}
 
-    async with httpx.AsyncClient() as client:
+    async with http_service.session(timeout=5.0) as client:
         response = await client.post(post_query_url, headers=headers, json=post_data)
         data = response.json()
 
@@ -60,7 +61,7 @@ async def get_bhd_torrents(bhd_api, bhd_rss_key, info_hash, meta, only_id=False)
     headers = {"Content-Type": "application/json"}
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_service.session(timeout=5.0) as client:
             response = await client.post(post_query_url, headers=headers, json=post_data, timeout=10)
             response.raise_for_status()
             data = response.json()
@@ -3,16 +3,16 @@ import sys
 import asyncio
 import shutil
 import traceback
-from glob import glob
+from glob import glob, escape
 from pymediainfo import MediaInfo
 from collections import OrderedDict
-import json
 from pyparsebluray import mpls
 from xml.etree import ElementTree as ET
 import re
 from langcodes import Language
 from collections import defaultdict
 from src.console import console
+from src.mediainfo import parse_mediainfo
 from data.config import config
 
 
@@ -384,8 +384,7 @@ class DiscParse():
     async def get_dvdinfo(self, discs):
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
+            files = [os.path.basename(file) for file in glob(os.path.join(escape(path), "VTS_*.VOB"))]
             files.sort()
             filesdict = OrderedDict()
             main_set = []
@@ -397,8 +396,7 @@ class DiscParse():
             main_set_duration = 0
             for vob_set in filesdict.values():
                 try:
-                    vob_set_mi = MediaInfo.parse(f"VTS_{vob_set[0][:2]}_0.IFO", output='JSON')
-                    vob_set_mi = json.loads(vob_set_mi)
+                    vob_set_mi = parse_mediainfo(os.path.join(path, f"VTS_{vob_set[0][:2]}_0.IFO")).data
                     tracks = vob_set_mi.get('media', {}).get('track', [])
                     if len(tracks) > 1:
                         vob_set_duration = tracks[1].get('Duration', "Unknown")
@@ -426,12 +424,16 @@ class DiscParse():
             set = main_set[0][:2]
             each['vob'] = vob = f"{path}/VTS_{set}_1.VOB"
             each['ifo'] = ifo = f"{path}/VTS_{set}_0.IFO"
-            each['vob_mi'] = MediaInfo.parse(os.path.basename(vob), output='STRING', full=False).replace('\r\n', '\n')
-            each['ifo_mi'] = MediaInfo.parse(os.path.basename(ifo), output='STRING', full=False).replace('\r\n', '\n')
-            each['vob_mi_full'] = MediaInfo.parse(vob, output='STRING', full=False).replace('\r\n', '\n')
-            each['ifo_mi_full'] = MediaInfo.parse(ifo, output='STRING', full=False).replace('\r\n', '\n')
-
-            size = sum(os.path.getsize(f) for f in os.listdir('.') if os.path.isfile(f)) / float(1 << 30)
+            # Parse each file once, the short versions only differ by the complete name
+            vob_mi = parse_mediainfo(vob).text.replace('\r\n', '\n')
+            ifo_mi = parse_mediainfo(ifo).text.replace('\r\n', '\n')
+            each['vob_mi'] = vob_mi.replace(vob, os.path.basename(vob))
+            each['ifo_mi'] = ifo_mi.replace(ifo, os.path.basename(ifo))
+            each['vob_mi_full'] = vob_mi
+            each['ifo_mi_full'] = ifo_mi
+
+            files = [os.path.join(path, f) for f in os.listdir(path)]
+            size = sum(os.path.getsize(f) for f in files if os.path.isfile(f)) / float(1 << 30)
             if size <= 7.95:
                 dvd_size = "DVD9"
                 if size <= 4.37:
@@ -443,7 +445,6 @@ class DiscParse():
         use_largest = int(self.config['DEFAULT'].get('use_largest_playlist', False))
         for each in discs:
             path = each.get('path')
-            os.chdir(path)
 
             try:
                 # Define the playlist path
@@ -691,7 +692,7 @@ class DiscParse():
                 console.print(f"Playlist processing failed: {e}. Falling back to largest EVO file detection.")
 
                 # Fallback to largest .EVO file
-                files = glob("*.EVO")
+                files = glob(os.path.join(escape(path), "*.EVO"))
                 if not files:
                     console.print("No EVO files found in the directory.")
                     continue
@@ -707,8 +708,8 @@ class DiscParse():
                         size = file_size
 
                 # Generate MediaInfo for the largest EVO file
-                each['evo_mi'] = MediaInfo.parse(os.path.basename(largest), output='STRING', full=False)
-                each['largest_evo'] = os.path.abspath(f"{path}/{largest}")
+                each['evo_mi'] = MediaInfo.parse(largest, output='STRING', full=False).replace(largest, os.path.basename(largest))
+                each['largest_evo'] = os.path.abspath(largest)
 
         return discs
 
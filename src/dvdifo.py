@@ -0,0 +1,115 @@
+import os
+import bisect
+import struct
+
+# DVD sectors are 2048 bytes, every address in the IFO is counted in sectors
+sector_size = 2048
+
+
+def _bcd(value):
+    return (value >> 4) * 10 + (value & 0x0F)
+
+
+def _playback_time(data):
+    """Seconds in a 4 byte BCD dvd_time (hours, minutes, seconds, frames with the rate in the top bits)."""
+    hours, minutes, seconds, frames = data[:4]
+    fps = {1: 25.0, 3: 30000 / 1001}.get(frames >> 6, 25.0)
+    return _bcd(hours) * 3600 + _bcd(minutes) * 60 + _bcd(seconds) + _bcd(frames & 0x3F) / fps
+
+
+def _u16(data, offset):
+    return struct.unpack_from('>H', data, offset)[0]
+
+
+def _u32(data, offset):
+    return struct.unpack_from('>I', data, offset)[0]
+
+
+class DvdTitle:
+    """
+    Cell timing of the longest program chain in a VTS, mapped onto its title VOB files.
+
+    cells holds (start time, duration, first sector, last sector) in playback order, with sectors
+    relative to the start of VTS_xx_1.VOB. vobu_starts is the sorted VOBU address map, so a seek can
+    be snapped to the start of a VOBU, which always begins with a navigation pack and an I frame.
+    """
+
+    def __init__(self, cells, vobu_starts, vob_files):
+        self.cells = cells
+        self.vobu_starts = vobu_starts
+        self.vob_files = []
+        first_sector = 0
+        for vob_file in vob_files:
+            sectors = os.path.getsize(vob_file) // sector_size
+            self.vob_files.append((first_sector, sectors, vob_file))
+            first_sector += sectors
+        self.duration = sum(duration for _, duration, _, _ in cells)
+
+    def sector_at(self, seek_time):
+        """VOBU start sector playing at seek_time, interpolated inside the cell it falls in."""
+        seek_time = min(max(seek_time, 0), self.duration)
+        for start, duration, first_sector, last_sector in self.cells:
+            if seek_time <= start + duration:
+                break
+        fraction = (seek_time - start) / duration if duration else 0
+        sector = first_sector + int((last_sector - first_sector) * fraction)
+        if not self.vobu_starts:
+            return sector
+        position = bisect.bisect_right(self.vobu_starts, sector) - 1
+        if position >= 0 and self.vobu_starts[position] >= first_sector:
+            return self.vobu_starts[position]
+        return first_sector
+
+    def locate(self, seek_time):
+        """(VOB file, byte offset) to start reading from to capture the frame at seek_time."""
+        sector = self.sector_at(seek_time)
+        for first_sector, sectors, vob_file in self.vob_files:
+            if sector < first_sector + sectors:
+                return vob_file, (sector - first_sector) * sector_size
+        first_sector, sectors, vob_file = self.vob_files[-1]
+        return vob_file, max(0, sectors - 1) * sector_size
+
+
+def read_dvd_title(ifo_path, vob_files):
+    """
+    Parse VTS_xx_0.IFO into a DvdTitle for the title VOB files of that set (VTS_xx_1.VOB onwards).
+
+    Only the tables needed for seeking are read: the program chain table for cell timing and
+    sectors, and the VOBU address map. Returns None when the IFO has no usable program chain.
+    """
+    with open(ifo_path, 'rb') as f:
+        ifo = f.read()
+    if ifo[:12] != b'DVDVIDEO-VTS':
+        raise ValueError(f"{ifo_path} is not a VTS IFO")
+
+    pgcit = _u32(ifo, 0xCC) * sector_size
+    vobu_admap = _u32(ifo, 0xE4) * sector_size
+
+    longest = []
+    for n in range(_u16(ifo, pgcit)):
+        pgc = pgcit + _u32(ifo, pgcit + 8 + n * 8 + 4)
+        cell_count = ifo[pgc + 3]
+        cell_playback = _u16(ifo, pgc + 0xE8)
+        if not cell_count or not cell_playback:
+            continue
+        cells = []
+        start = 0.0
+        for c in range(cell_count):
+            cell = pgc + cell_playback + c * 24
+            block_mode, block_type = ifo[cell] >> 6, (ifo[cell] >> 4) & 0x03
+            # Only the first angle of a multi angle block is part of the normal playback
+            if block_type == 1 and block_mode in (2, 3):
+                continue
+            duration = _playback_time(ifo[cell + 4:cell + 8])
+            cells.append((start, duration, _u32(ifo, cell + 8), _u32(ifo, cell + 20)))
+            start += duration
+        if sum(duration for _, duration, _, _ in cells) > sum(duration for _, duration, _, _ in longest):
+            longest = cells
+    if not longest:
+        return None
+
+    vobu_starts = []
+    if vobu_admap:
+        end = vobu_admap + _u32(ifo, vobu_admap) + 1
+        vobu_starts = sorted(_u32(ifo, offset) for offset in range(vobu_admap + 4, min(end, len(ifo)) - 3, 4))
+    return DvdTitle(longest, vobu_starts, vob_files)
@@ -1,5 +1,6 @@
 from src.console import console
-from pymediainfo import MediaInfo
+from src.mediainfo import parse_mediainfo
+import asyncio
 import json
 import os
 
@@ -222,13 +223,16 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text):
                 })
         return filtered
 
-    if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt") and export_text:
+    export_mi_text = not os.path.exists(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt") and export_text
+    export_mi_json = not os.path.exists(f"{base_dir}/tmp/{folder_id}/MediaInfo.json.txt")
+    if export_mi_text or export_mi_json:
+        # Both outputs come from the same parse of the file
+        report = await asyncio.to_thread(parse_mediainfo, video)
+
+    if export_mi_text:
         console.print("[bold yellow]Exporting MediaInfo...")
-        if not isdir:
-            os.chdir(os.path.dirname(video))
-        media_info = MediaInfo.parse(video, output="STRING", full=False)
         filtered_media_info = "\n".join(
-            line for line in media_info.splitlines()
+            line for line in report.text.splitlines()
             if not line.strip().startswith("ReportBy") and not line.strip().startswith("Report created by ")
         )
         with open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt", 'w', newline="", encoding='utf-8') as export:
@@ -237,10 +241,8 @@ async def exportInfo(video, isdir, folder_id, base_dir, export_text):
             export_cleanpath.write(filtered_media_info.replace(video, os.path.basename(video)))
         console.print("[bold green]MediaInfo Exported.")
 
-    if not os.path.exists(f"{base_dir}/tmp/{folder_id}/MediaInfo.json.txt"):
-        media_info_json = MediaInfo.parse(video, output="JSON")
-        media_info_dict = json.loads(media_info_json)
-        filtered_info = filter_mediainfo(media_info_dict)
+    if export_mi_json:
+        filtered_info = filter_mediainfo(report.data)
         with open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", 'w', encoding='utf-8') as export:
             json.dump(filtered_info, export, indent=4)
 
@@ -0,0 +1,183 @@
+import asyncio
+import weakref
+import httpx
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from contextlib import asynccontextmanager
+from src.console import console
+from data.config import config
+
+try:
+    import h2  # noqa: F401
+    http2_available = True
+except ImportError:
+    http2_available = False
+
+# Server responses worth another try for idempotent requests
+retry_status_codes = (429, 502, 503, 504)
+idempotent_methods = ('GET', 'HEAD', 'OPTIONS')
+
+
+class HttpSession:
+    """
+    Lightweight view over the shared client, with default timeout and headers.
+
+    Mirrors the parts of httpx.AsyncClient the trackers use, so existing
+    `async with ... as client:` blocks keep working unchanged.
+    """
+
+    def __init__(self, service, timeout=None, headers=None):
+        self.service = service
+        self.timeout = timeout
+        self.headers = headers
+
+    async def request(self, method, url, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        if self.headers:
+            kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {})}
+        return await self.service.request(method, url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request('HEAD', url, **kwargs)
+
+
+class HttpService:
+    """
+    Process wide HTTP service: pooled keep-alive connections (HTTP/2 when h2 is installed),
+    a concurrency limit per host and retries with exponential backoff for transient failures.
+
+    httpx clients and asyncio semaphores are bound to an event loop, so one set is kept per loop.
+    """
+
+    def __init__(self, per_host_limit=6, retries=2, backoff=0.5, timeout=30.0):
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.retries = max(0, int(retries))
+        self.backoff = float(backoff)
+        self.timeout = timeout
+        self._clients = weakref.WeakKeyDictionary()
+        self._host_limits = weakref.WeakKeyDictionary()
+
+    def client(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                # The pool is shared by every tracker, so never store cookies on it
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=http2_available,
+            )
+            self._clients[loop] = client
+        return client
+
+    def _host_semaphore(self, url):
+        loop = asyncio.get_running_loop()
+        semaphores = self._host_limits.setdefault(loop, {})
+        host = httpx.URL(url).host
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return semaphores[host]
+
+    async def request(self, method, url, retries=None, **kwargs):
+        method = method.upper()
+        retries = self.retries if retries is None else retries
+        if isinstance(kwargs.get('data'), dict):
+            kwargs['data'] = self._form_fields(kwargs['data'])
+        client = self.client()
+        semaphore = self._host_semaphore(url)
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                # Nothing reached the server, so this is safe to repeat for any method
+                if attempt >= retries:
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                console.print(f"[yellow]Connection to {httpx.URL(url).host} failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in retry_status_codes or method not in idempotent_methods or attempt >= retries:
+                    return response
+                delay = self._retry_after(response) or self.backoff * (2 ** attempt)
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _form_fields(data):
+        """Form values as requests sends them: str() of each value, None left out, lists as repeated fields."""
+        fields = {}
+        for key, value in data.items():
+            if isinstance(value, (list, tuple)):
+                fields[key] = [v if isinstance(v, (str, bytes)) else str(v) for v in value if v is not None]
+            elif value is not None:
+                fields[key] = value if isinstance(value, (str, bytes)) else str(value)
+        return fields
+
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return min(float(response.headers.get('Retry-After', 0)), 30.0)
+        except ValueError:
+            return 0
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def get_prefix(self, url, length, **kwargs):
+        """
+        GET the first length bytes of url with a range request, returns (response, bytes).
+
+        The body is streamed and the response closed after length bytes, so a server that ignores
+        the range does not get the whole file downloaded.
+        """
+        headers = {**(kwargs.pop('headers', None) or {}), 'Range': f"bytes=0-{length - 1}"}
+        data = bytearray()
+        async with self._host_semaphore(url):
+            async with self.client().stream('GET', url, headers=headers, **kwargs) as response:
+                async for chunk in response.aiter_bytes():
+                    data += chunk
+                    if len(data) >= length:
+                        break
+        return response, bytes(data[:length])
+
+    @asynccontextmanager
+    async def session(self, timeout=None, headers=None, cookies=None):
+        """
+        Yield a client for a block of requests.
+
+        Requests carrying cookies get their own short lived client, so one tracker's
+        cookie jar never leaks into the shared pool.
+        """
+        if cookies is not None:
+            async with httpx.AsyncClient(cookies=cookies, timeout=timeout if timeout is not None else self.timeout, headers=headers) as client:
+                yield client
+        else:
+            yield HttpSession(self, timeout=timeout, headers=headers)
+
+    async def close(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        client = self._clients.pop(loop, None)
+        self._host_limits.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+http_service = HttpService(
+    per_host_limit=config['DEFAULT'].get('http_host_limit', 6),
+    retries=config['DEFAULT'].get('http_retries', 2),
+)
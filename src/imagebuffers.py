@@ -0,0 +1,123 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Saved images kept in memory for the uploaders, images not written to disk yet are never evicted
+max_buffer_bytes = 512 * 1024 * 1024
+
+
+class ImageBuffers:
+    """
+    Screenshot bytes keyed by the path they are (or will be) stored at.
+
+    Captures are put() in memory, optimized from memory and save()d to disk once, after which
+    the uploaders get() the same bytes without reading the file again. A saved buffer is only
+    trusted while the file on disk still has the size and mtime it was written with.
+    """
+
+    def __init__(self, max_bytes=max_buffer_bytes):
+        self.max_bytes = max_bytes
+        self._buffers = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    @staticmethod
+    def _stat(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def put(self, path, data):
+        """Keep data for path in memory only, until it is saved."""
+        with self._lock:
+            self._buffers[self._key(path)] = (bytes(data), None)
+            self._buffers.move_to_end(self._key(path))
+
+    def save(self, path, data=None):
+        """Write data (or the pending buffer) to path and keep it in memory."""
+        key = self._key(path)
+        if data is None:
+            with self._lock:
+                data = self._buffers[key][0]
+        data = bytes(data)
+        with open(path, 'wb') as f:
+            f.write(data)
+        with self._lock:
+            self._buffers[key] = (data, self._stat(path))
+            self._buffers.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        total = sum(len(data) for data, _ in self._buffers.values())
+        for key in list(self._buffers):
+            if total <= self.max_bytes:
+                break
+            data, stat = self._buffers[key]
+            if stat is not None:
+                del self._buffers[key]
+                total -= len(data)
+
+    def _buffer(self, path):
+        key = self._key(path)
+        with self._lock:
+            entry = self._buffers.get(key)
+            if entry is None:
+                return None
+            data, stat = entry
+            if stat is not None:
+                try:
+                    if self._stat(path) != stat:
+                        del self._buffers[key]
+                        return None
+                except OSError:
+                    del self._buffers[key]
+                    return None
+            self._buffers.move_to_end(key)
+            return data
+
+    def get(self, path):
+        """Bytes for path, from memory when possible and from disk otherwise."""
+        data = self._buffer(path)
+        if data is not None:
+            return data
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def exists(self, path):
+        return self._buffer(path) is not None or os.path.exists(path)
+
+    def size(self, path):
+        data = self._buffer(path)
+        return len(data) if data is not None else os.path.getsize(path)
+
+    def discard(self, path):
+        with self._lock:
+            self._buffers.pop(self._key(path), None)
+
+
+image_buffers = ImageBuffers()
+
+
+def split_png_stream(data):
+    """Split concatenated PNG files (eg. ffmpeg image2pipe output) into a list of PNGs."""
+    signature = b'\x89PNG\r\n\x1a\n'
+    images = []
+    position = 0
+    while position < len(data):
+        if data[position:position + 8] != signature:
+            raise ValueError(f"No PNG signature at offset {position}")
+        offset = position + 8
+        while True:
+            if offset + 8 > len(data):
+                raise ValueError("Truncated PNG stream")
+            length = int.from_bytes(data[offset:offset + 4], 'big')
+            chunk_type = data[offset + 4:offset + 8]
+            # length, type, data and crc
+            offset += 12 + length
+            if chunk_type == b'IEND':
+                break
+        images.append(data[position:offset])
+        position = offset
+    return images
@@ -0,0 +1,439 @@
+import os
+import abc
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+import httpx
+import pyimgbox
+from src.console import console
+from src.httpclient import http_service
+from src.takescreens import encode_for_host
+from src.imagebuffers import image_buffers
+from src.uploadcache import use_upload_cache, image_digest, get_cached_upload, store_upload
+from data.config import config
+
+# Race a per image upload on the next healthy host once the current one is over its latency budget
+hedged_uploads = config['DEFAULT'].get('hedged_uploads', False)
+try:
+    hedge_latency = float(config['DEFAULT'].get('hedge_latency', 15))
+except (TypeError, ValueError):
+    hedge_latency = 15.0
+
+
+class ImageHostError(Exception):
+    """An image host answered, but not with a usable upload."""
+
+
+class ImageHost(abc.ABC):
+    """
+    Async client for one image host.
+
+    upload() sends the screenshot bytes as a multipart body over the shared http_service pool and
+    returns (img_url, raw_url, web_url), raising ImageHostError when the host rejects the upload.
+    limit caps concurrent uploads to the host across the whole process, None means no cap.
+    encoded hosts get the bytes from encode_for_host, the others upload the stored file themselves.
+    """
+    name = None
+    limit = None
+    encoded = True
+    timeout = 60
+
+    async def post(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return await http_service.post(url, **kwargs)
+
+    @abc.abstractmethod
+    async def upload(self, image, filename, data, meta):
+        pass
+
+
+class PtpImg(ImageHost):
+    name = "ptpimg"
+
+    async def upload(self, image, filename, data, meta):
+        response = await self.post(
+            "https://ptpimg.me/upload.php",
+            headers={'referer': 'https://ptpimg.me/index.php'},
+            data={'format': 'json', 'api_key': config['DEFAULT']['ptpimg_api']},
+            files=[('file-upload[0]', (filename, data))],
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        if not response_data or not isinstance(response_data, list) or 'code' not in response_data[0]:
+            raise ImageHostError("Invalid JSON response from ptpimg")
+        img_url = f"https://ptpimg.me/{response_data[0]['code']}.{response_data[0]['ext']}"
+        return img_url, img_url, img_url
+
+
+class ImgBB(ImageHost):
+    name = "imgbb"
+    url = "https://api.imgbb.com/1/upload"
+    api_key = "imgbb_api"
+    label = "imgbb"
+
+    async def upload(self, image, filename, data, meta):
+        # The image field takes a binary file as well as base64, so the bytes go out as they are
+        response = await self.post(
+            self.url,
+            data={'key': config['DEFAULT'][self.api_key]},
+            files={'image': (filename, data)},
+        )
+        response_data = response.json()
+        if response.status_code != 200 or not response_data.get('success'):
+            console.print(f"[yellow]{self.label} failed, trying next image host")
+            raise ImageHostError(f"{self.label} upload failed")
+        img_url = response_data['data'].get('medium', {}).get('url') or response_data['data']['thumb']['url']
+        return img_url, response_data['data']['image']['url'], response_data['data']['url_viewer']
+
+
+class Dalexni(ImgBB):
+    name = "dalexni"
+    url = "https://dalexni.com/1/upload"
+    api_key = "dalexni_api"
+    label = "DALEXNI"
+
+
+class Chevereto(ImageHost):
+    """Chevereto API hosts, which take the file as the multipart source field."""
+    url = None
+    api_key = None
+    label = None
+
+    async def upload(self, image, filename, data, meta):
+        response = await self.post(
+            self.url,
+            headers={'X-API-Key': config['DEFAULT'][self.api_key]},
+            files={'source': (filename, data)},
+        )
+        response_data = response.json()
+        if response.status_code != 200 or not self.succeeded(response_data):
+            console.print(f"[yellow]{self.label} failed, trying next image host")
+            raise ImageHostError(f"{self.label} upload failed")
+        return self.urls(response_data)
+
+    def succeeded(self, response_data):
+        return response_data.get('status_code') == 200
+
+    def urls(self, response_data):
+        return response_data['data']['image']['url'], response_data['data']['image']['url'], response_data['data']['url_viewer']
+
+
+class PtScreens(Chevereto):
+    name = "ptscreens"
+    limit = 1
+    url = "https://ptscreens.com/api/1/upload"
+    api_key = "ptscreens_api"
+    label = "ptscreens"
+
+    def urls(self, response_data):
+        return response_data['image']['medium']['url'], response_data['image']['url'], response_data['image']['url_viewer']
+
+
+class OeImg(Chevereto):
+    name = "oeimg"
+    limit = 6
+    url = "https://imgoe.download/api/1/upload"
+    api_key = "oeimg_api"
+    label = "OEimg"
+
+    def succeeded(self, response_data):
+        return bool(response_data.get('success'))
+
+
+class Lensdump(Chevereto):
+    name = "lensdump"
+    limit = 1
+    url = "https://lensdump.com/api/1/upload"
+    api_key = "lensdump_api"
+    label = "lensdump"
+
+
+class PixHost(ImageHost):
+    name = "pixhost"
+
+    async def upload(self, image, filename, data, meta):
+        response = await self.post(
+            "https://api.pixhost.to/images",
+            data={'content_type': '0', 'max_th_size': 350},
+            files={'img': (filename, data)},
+        )
+        if response.status_code != 200:
+            raise ImageHostError(f"pixhost upload failed with status {response.status_code}")
+        response_data = response.json()
+        raw_url = response_data['th_url'].replace('https://t', 'https://img').replace('/thumbs/', '/images/')
+        return response_data['th_url'], raw_url, response_data['show_url']
+
+
+class Zipline(ImageHost):
+    name = "zipline"
+
+    async def upload(self, image, filename, data, meta):
+        url = config['DEFAULT'].get('zipline_url')
+        api_key = config['DEFAULT'].get('zipline_api_key')
+        if not url or not api_key:
+            console.print("[red]Error: Missing Zipline URL or API key in config.")
+            raise ImageHostError('Missing Zipline URL or API key')
+
+        response = await self.post(url, headers={'Authorization': f'{api_key}'}, files={'file': (filename, data)})
+        if response.status_code != 200:
+            raise ImageHostError(f"Zipline upload failed: {response.text}")
+        response_data = response.json()
+        if 'files' not in response_data:
+            raise ImageHostError('No valid URL returned from Zipline')
+        img_url = response_data['files'][0]
+        return img_url, img_url.replace('/u/', '/r/'), img_url.replace('/u/', '/r/')
+
+
+class ImgBox(ImageHost):
+    name = "imgbox"
+    encoded = False
+
+    async def upload(self, image, filename, data, meta):
+        image_list = await imgbox_upload([image], meta, return_dict={})
+        if not image_list or not all('img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list):
+            raise ImageHostError("Imgbox upload failed. No valid URLs returned.")
+        return image_list[0]['img_url'], image_list[0]['raw_url'], image_list[0]['web_url']
+
+
+image_hosts = {host.name: host() for host in (PtpImg, ImgBB, Dalexni, PtScreens, OeImg, Lensdump, PixHost, Zipline, ImgBox)}
+
+# Trackers uploading concurrently each run their own event loop, so the limits are thread semaphores
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def host_semaphore(host):
+    """Process wide upload limit for host, shared by every event loop, None if the host has no limit."""
+    if host.limit is None:
+        return None
+    with _host_semaphores_lock:
+        if host.name not in _host_semaphores:
+            _host_semaphores[host.name] = threading.BoundedSemaphore(host.limit)
+        return _host_semaphores[host.name]
+
+
+@asynccontextmanager
+async def host_slot(host):
+    """
+    Hold one of host's upload slots.
+
+    The slot is only ever taken without blocking, polling until one is free, so waiting uploads
+    neither block their loop nor tie up worker threads, and a cancelled wait never holds a slot.
+    """
+    semaphore = host_semaphore(host)
+    if semaphore is None:
+        yield
+        return
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(0.05)
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+class HostHealth:
+    """
+    Upload latency and failures per image host over the whole run.
+
+    latency is a moving average of successful uploads, plus the time spent on uploads that were
+    cancelled for being too slow, so a host that keeps losing races stops being picked first.
+    """
+
+    def __init__(self, alpha=0.3, min_uploads=3, max_error_rate=0.5):
+        self.alpha = alpha
+        self.min_uploads = min_uploads
+        self.max_error_rate = max_error_rate
+        self._hosts = {}
+
+    def _stats(self, host):
+        return self._hosts.setdefault(host, {'uploads': 0, 'failures': 0, 'latency': None})
+
+    def record(self, host, elapsed, ok):
+        stats = self._stats(host)
+        stats['uploads'] += 1
+        if ok:
+            self.record_latency(host, elapsed)
+        else:
+            stats['failures'] += 1
+
+    def record_latency(self, host, elapsed):
+        stats = self._stats(host)
+        stats['latency'] = elapsed if stats['latency'] is None else self.alpha * elapsed + (1 - self.alpha) * stats['latency']
+
+    def latency(self, host):
+        return self._stats(host)['latency']
+
+    def error_rate(self, host):
+        stats = self._stats(host)
+        return stats['failures'] / stats['uploads'] if stats['uploads'] else 0.0
+
+    def healthy(self, host, budget):
+        stats = self._stats(host)
+        if stats['uploads'] >= self.min_uploads and self.error_rate(host) > self.max_error_rate:
+            return False
+        return stats['latency'] is None or stats['latency'] <= budget * 2
+
+    def budget(self, host, limit):
+        """Seconds to wait on host before hedging, a few times its usual latency but never over limit."""
+        latency = self.latency(host)
+        return limit if latency is None else min(limit, max(2.0, latency * 3))
+
+
+host_health = HostHealth()
+
+
+def configured_image_hosts():
+    """img_host_1, img_host_2, ... from the config, in order."""
+    hosts = []
+    while f"img_host_{len(hosts) + 1}" in config['DEFAULT']:
+        hosts.append(config['DEFAULT'][f"img_host_{len(hosts) + 1}"])
+    return hosts
+
+
+async def upload_image(image, img_host, meta):
+    """Upload the stored screenshot image to img_host, returns the same status dicts upload_screens expects."""
+    host = image_hosts.get(img_host)
+    if host is None:
+        return {'status': 'failed', 'reason': f"Unknown image host {img_host}"}
+
+    digest = None
+    if use_upload_cache:
+        try:
+            digest = await asyncio.to_thread(image_digest, image)
+        except OSError as e:
+            console.print(f"[yellow]Could not hash {image} for the upload cache: {e}")
+        cached = get_cached_upload(img_host, digest) if digest else None
+        if cached:
+            if meta['debug']:
+                console.print(f"[cyan]{os.path.basename(image)} was already uploaded to {img_host} as {cached['raw_url']}")
+            return {
+                'status': 'success',
+                'img_url': cached['img_url'],
+                'raw_url': cached['raw_url'],
+                'web_url': cached['web_url'],
+                'local_file_path': image
+            }
+
+    start = time.monotonic()
+    try:
+        async with host_slot(host):
+            result = await _upload_image(host, image, meta)
+    except asyncio.CancelledError:
+        host_health.record_latency(img_host, time.monotonic() - start)
+        raise
+    host_health.record(img_host, time.monotonic() - start, result['status'] == 'success')
+    if digest and result['status'] == 'success':
+        try:
+            store_upload(img_host, digest, result, image_buffers.size(image))
+        except OSError as e:
+            console.print(f"[yellow]Could not save {image} to the upload cache: {e}")
+    return result
+
+
+async def hedged_upload(image, img_host, meta, hosts=None):
+    """
+    Upload image to img_host, racing it on the next healthy host whenever the running uploads go over
+    their latency budget or fail. The first success wins and the other uploads are cancelled.
+    """
+    hosts = [img_host] + [host for host in (hosts or configured_image_hosts()) if host != img_host and host in image_hosts]
+    # Hosts that have been failing or slow this run are only tried after the healthy ones
+    fallbacks = sorted(hosts[1:], key=lambda host: not host_health.healthy(host, hedge_latency))
+    running = {}
+    result = {'status': 'failed', 'reason': f"No image host accepted {image}"}
+
+    def start(host):
+        running[asyncio.create_task(upload_image(image, host, meta))] = host
+
+    start(img_host)
+    try:
+        while running:
+            # With nothing left to hedge with, just wait for what is running
+            budget = min(host_health.budget(host, hedge_latency) for host in running.values()) if fallbacks else None
+            done, _ = await asyncio.wait(running, timeout=budget, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                host = running.pop(task)
+                result = task.result()
+                if result.get('status') == 'success':
+                    if host != img_host and meta['debug']:
+                        console.print(f"[cyan]{os.path.basename(image)} uploaded to {host} instead of {img_host}")
+                    return {**result, 'img_host': host}
+            # Over budget or failed, bring in the next host while any slow upload keeps going
+            if fallbacks:
+                next_host = fallbacks.pop(0)
+                if meta['debug']:
+                    console.print(f"[yellow]Hedging upload of {os.path.basename(image)} on {next_host}")
+                start(next_host)
+        return result
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+async def _upload_image(host, image, meta):
+    try:
+        filename, data = await encode_for_host(image, host.name) if host.encoded else (None, None)
+        img_url, raw_url, web_url = await host.upload(image, filename, data, meta)
+    except ImageHostError as e:
+        return {'status': 'failed', 'reason': str(e)}
+    except httpx.TimeoutException:
+        console.print("[red]Request timed out. The server took too long to respond.")
+        return {'status': 'failed', 'reason': 'Request timed out'}
+    except httpx.HTTPError as e:
+        console.print(f"[red]Request failed with error: {e}")
+        return {'status': 'failed', 'reason': f"Request failed: {str(e)}"}
+    except ValueError as e:
+        # Over the host's size limit, or a response that is not JSON
+        console.print(f"[red]{host.name} upload failed: {e}")
+        return {'status': 'failed', 'reason': str(e)}
+    except Exception as e:
+        return {'status': 'failed', 'reason': str(e)}
+
+    if not (img_url and raw_url and web_url):
+        return {'status': 'failed', 'reason': f"Failed to upload image to {host.name}. No URLs received."}
+    if meta['debug']:
+        console.print(f"[green]Image URLs: img_url={img_url}, raw_url={raw_url}, web_url={web_url}")
+    return {
+        'status': 'success',
+        'img_url': img_url,
+        'raw_url': raw_url,
+        'web_url': web_url,
+        'local_file_path': image
+    }
+
+
+async def imgbox_upload(image_glob, meta, return_dict):
+    try:
+        image_list = []
+
+        async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
+            for image in image_glob:
+                try:
+                    async for submission in gallery.add([image]):
+                        if not submission['success']:
+                            console.print(f"[red]Error uploading to imgbox: [yellow]{submission['error']}[/yellow][/red]")
+                        else:
+                            web_url = submission.get('web_url')
+                            img_url = submission.get('thumbnail_url')
+                            raw_url = submission.get('image_url')
+                            if web_url and img_url and raw_url:
+                                image_dict = {
+                                    'web_url': web_url,
+                                    'img_url': img_url,
+                                    'raw_url': raw_url
+                                }
+                                image_list.append(image_dict)
+                            else:
+                                console.print(f"[red]Incomplete URLs received for image: {image}")
+                except Exception as e:
+                    console.print(f"[red]Error during upload for {image}: {str(e)}")
+
+        return_dict['image_list'] = image_list
+        return image_list
+
+    except Exception as e:
+        console.print(f"[red]An error occurred while uploading images to imgbox: {str(e)}")
+        return []
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import concurrent.futures
+import psutil
+from src.console import console
+from data.config import config
+
+
+class ImagePool:
+    """
+    Process pool for image work (oxipng), shared by every screenshot run in the process.
+
+    Workers are started on first use and kept for the rest of the run, so a queue of items does
+    not fork and import oxipng again for each of them. terminate() only touches the pool's own
+    workers, after which the next submission starts a fresh pool.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max(1, int(max_workers))
+        self._executor = None
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    async def run(self, fn, *args):
+        future = self.executor().submit(fn, *args)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def _discard(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def pids(self):
+        """Process ids of the pool's current workers."""
+        with self._lock:
+            if self._executor is None:
+                return set()
+            return set((getattr(self._executor, '_processes', None) or {}).keys())
+
+    def cancel(self):
+        """Cancel queued work, anything already running is left to finish."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def terminate(self):
+        """Stop the pool's workers immediately, the next run() starts a new pool."""
+        self.cancel()
+        pids = self.pids()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        workers = []
+        for pid in pids:
+            try:
+                worker = psutil.Process(pid)
+                worker.terminate()
+                workers.append(worker)
+            except psutil.NoSuchProcess:
+                continue
+        gone, still_alive = psutil.wait_procs(workers, timeout=3)
+        for worker in still_alive:
+            console.print(f"[red]Force killing stubborn image worker: {worker.pid}[/red]")
+            worker.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Let running work finish and stop the workers, at the end of the run."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+try:
+    process_limit = int(config['DEFAULT'].get('process_limit', 1))
+except (TypeError, ValueError):
+    process_limit = 1
+image_pool = ImagePool(process_limit)
+
+# A VapourSynth render holds its worker for a whole disc, so it gets its own worker
+# instead of a slot image optimization is waiting on
+vs_pool = ImagePool(1)
@@ -1,7 +1,8 @@
-import requests
 from difflib import SequenceMatcher
 from imdb import Cinemagoer
 from src.console import console
+from src.metacache import metadata_cache
+from src.httpclient import http_service
 from datetime import datetime
 import json
 
@@ -38,11 +39,15 @@ async def get_imdb_aka_api(imdb_id, meta):
         "Content-Type": "application/json",
     }
 
-    response = requests.post(url, headers=headers, json=query)
-    data = response.json()
+    async def fetch_aka():
+        response = await http_service.post(url, headers=headers, json=query)
+        return response.json()
+
+    data = await metadata_cache.fetch('imdb', imdb_id, 'aka', fetch_aka, meta,
+                                      should_cache=lambda d: (d.get("data") or {}).get("title") is not None)
 
     # Check if `data` and `title` exist
-    title_data = data.get("data", {}).get("title")
+    title_data = (data or {}).get("data", {}).get("title")
     if title_data is None:
         console.print("Title data is missing from response")
         return "", None
@@ -190,10 +195,15 @@ async def get_imdb_info_api(imdbID, meta):
         url = "https://api.graphql.imdb.com/"
         headers = {"Content-Type": "application/json"}
 
-        response = requests.post(url, json=query, headers=headers)
-        data = response.json()
+        async def fetch_info():
+            response = await http_service.post(url, json=query, headers=headers)
+            if response.status_code != 200:
+                return None
+            return response.json()
 
-        if response.status_code != 200:
+        data = await metadata_cache.fetch('imdb', imdbID, 'info', fetch_info, meta,
+                                          should_cache=lambda d: (d.get("data") or {}).get("title") is not None)
+        if not data:
             return imdb_info
 
         title_data = await safe_get(data, ["data", "title"], {})
@@ -287,12 +297,16 @@ async def get_imdb_info_api(imdbID, meta):
     return imdb_info
 
 
-async def search_imdb(filename, search_year):
+async def search_imdb(filename, search_year, meta):
+    def fetch_search():
+        ia = Cinemagoer()
+        search = ia.search_movie(filename)
+        return [{'title': movie.get('title', ''), 'year': movie.get('year'), 'id': str(movie.movieID)} for movie in search]
+
     imdbID = '0'
-    ia = Cinemagoer()
-    search = ia.search_movie(filename)
+    search = await metadata_cache.fetch('imdb', f"{filename}|{search_year}", 'search', fetch_search, meta) or []
     for movie in search:
         if filename in movie.get('title', ''):
             if movie.get('year') == search_year:
-                imdbID = int(str(movie.movieID).replace('tt', '').strip())
+                imdbID = int(movie['id'].replace('tt', '').strip())
     return imdbID
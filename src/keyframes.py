@@ -0,0 +1,90 @@
+import os
+import json
+import random
+import asyncio
+import hashlib
+from src.console import console
+
+keyframe_cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'keyframes')
+
+# Number of seek points probed when building an index, spread over the part of the file screenshots come from
+probe_points = 120
+
+
+def _cache_path(path):
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return os.path.join(keyframe_cache_dir, f"{hashlib.sha1(key.encode('utf-8', 'surrogateescape')).hexdigest()}.json")
+
+
+async def scan_keyframes(path, seek_times):
+    """
+    Return the sorted keyframe timestamps (in seconds from the start of the file) found at seek_times.
+
+    A demuxer seek lands on the keyframe at or before the requested time, so reading just the first
+    video packet after each seek finds a keyframe without decoding anything or reading whole GOPs.
+    """
+    intervals = ",".join(f"{seek_time:.3f}%+#1" for seek_time in seek_times)
+    process = await asyncio.create_subprocess_exec(
+        'ffprobe', '-v', 'error', '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags:format=start_time',
+        '-read_intervals', intervals, '-of', 'json', path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode(errors='replace').strip())
+
+    probe = json.loads(stdout)
+    try:
+        # ffmpeg -ss is relative to the start time, which is not 0 for eg. transport streams
+        start_time = float(probe.get('format', {}).get('start_time', 0))
+    except ValueError:
+        start_time = 0
+    keyframes = set()
+    for packet in probe.get('packets', []):
+        if 'K' not in packet.get('flags', ''):
+            continue
+        try:
+            keyframes.add(round(float(packet['pts_time']) - start_time, 6))
+        except (KeyError, ValueError):
+            continue
+    return sorted(keyframe for keyframe in keyframes if keyframe >= 0)
+
+
+async def get_keyframes(path, length, debug=False):
+    """
+    Keyframe index for the middle of path, built on first use and cached per file.
+
+    The probe points are jittered when the index is built, so the index does not always contain
+    the same keyframes for a given length. Returns an empty list if the index can not be built.
+    """
+    try:
+        cache_path = _cache_path(path)
+        if os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                keyframes = json.load(f).get('keyframes', [])
+            if keyframes:
+                if debug:
+                    console.print(f"[cyan]Using cached keyframe index with {len(keyframes)} keyframes")
+                return keyframes
+
+        start = length / 5
+        step = (4 * length / 5 - start) / probe_points
+        seek_times = [start + (i + random.random()) * step for i in range(probe_points)]
+        keyframes = await scan_keyframes(path, seek_times)
+        if debug:
+            console.print(f"[cyan]Built keyframe index with {len(keyframes)} keyframes")
+        if keyframes:
+            os.makedirs(keyframe_cache_dir, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'keyframes': keyframes}, f)
+        return keyframes
+    except Exception as e:
+        console.print(f"[yellow]Could not build keyframe index, using random timestamps: {e}")
+        return []
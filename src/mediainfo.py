@@ -0,0 +1,91 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from pymediainfo import MediaInfo
+
+# Parsed reports kept in memory, keyed by (path, size, mtime, header_only)
+max_cached_reports = 32
+_reports = OrderedDict()
+_reports_lock = threading.Lock()
+
+
+class MediaInfoReport:
+    """Text, JSON and XML output of a single libmediainfo parse."""
+
+    def __init__(self, text, json_text, xml):
+        self.text = text
+        self.json = json_text
+        self.xml = xml
+
+    @property
+    def data(self):
+        return json.loads(self.json)
+
+    @property
+    def media_info(self):
+        return MediaInfo(self.xml)
+
+
+def _parse(path, parse_speed):
+    """Open the file once and ask libmediainfo for every output we need from that one parse."""
+    try:
+        lib, handle, lib_version_str, lib_version = MediaInfo._get_library()
+    except (AttributeError, TypeError, ValueError):
+        # _get_library is private and its signature and return value changed between pymediainfo
+        # releases, so anything unexpected falls back to one public parse per output
+        return MediaInfoReport(
+            MediaInfo.parse(path, output="STRING", full=False, parse_speed=parse_speed),
+            MediaInfo.parse(path, output="JSON", parse_speed=parse_speed),
+            MediaInfo.parse(path, output="OLDXML", parse_speed=parse_speed),
+        )
+
+    # The XML option was renamed in 17.10, and cover data is only skipped by default since 18.03
+    xml_option = "OLDXML" if lib_version >= (17, 10) else "XML"
+    if lib_version >= (18, 3):
+        lib.MediaInfo_Option(handle, "Cover_Data", "")
+    lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+    lib.MediaInfo_Option(handle, "ParseSpeed", str(parse_speed))
+    lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+    try:
+        if lib.MediaInfo_Open(handle, os.fspath(path)) == 0:
+            if not os.path.exists(path):
+                raise FileNotFoundError(path)
+            raise RuntimeError(f"An error occured while opening {path} with libmediainfo")
+        lib.MediaInfo_Option(handle, "Complete", "")
+        lib.MediaInfo_Option(handle, "Inform", "STRING")
+        text = lib.MediaInfo_Inform(handle, 0)
+        lib.MediaInfo_Option(handle, "Complete", "1")
+        lib.MediaInfo_Option(handle, "Inform", "JSON")
+        json_text = lib.MediaInfo_Inform(handle, 0)
+        lib.MediaInfo_Option(handle, "Inform", xml_option)
+        xml = lib.MediaInfo_Inform(handle, 0)
+    finally:
+        lib.MediaInfo_Close(handle)
+        lib.MediaInfo_Delete(handle)
+    return MediaInfoReport(text, json_text, xml)
+
+
+def parse_mediainfo(path, header_only=False):
+    """
+    Return a MediaInfoReport for path, parsing the file at most once while it is unchanged.
+
+    header_only uses ParseSpeed 0, which stops after the container headers. That is enough for
+    probing duration, dimensions and frame rate, and avoids reading deep into large files on
+    network mounts. A full report also satisfies header only requests.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _reports_lock:
+        for cached_key in ((*key, False), (*key, True)) if header_only else ((*key, False),):
+            if cached_key in _reports:
+                _reports.move_to_end(cached_key)
+                return _reports[cached_key]
+
+    report = _parse(path, 0 if header_only else 0.5)
+
+    with _reports_lock:
+        _reports[(*key, header_only)] = report
+        while len(_reports) > max_cached_reports:
+            _reports.popitem(last=False)
+    return report
@@ -0,0 +1,143 @@
+import os
+import json
+import time
+import sqlite3
+import inspect
+import threading
+from src.console import console
+from data.config import config
+
+# Default time to live (in seconds) for each metadata source
+default_cache_ttl = {
+    'tmdb': 7 * 24 * 60 * 60,
+    'imdb': 7 * 24 * 60 * 60,
+    'tvmaze': 24 * 60 * 60,
+}
+default_cache_entries = 5000
+
+
+class MetadataCache:
+    """
+    Small persistent cache for remote metadata responses, stored in SQLite.
+
+    Entries are keyed by (source, id, endpoint), expire after the per-source TTL and the
+    least recently used entries are evicted once the cache grows past max_entries.
+    """
+
+    def __init__(self, path, ttl=None, max_entries=default_cache_entries):
+        self.path = path
+        self.ttl = dict(default_cache_ttl)
+        if isinstance(ttl, dict):
+            for source, seconds in ttl.items():
+                try:
+                    self.ttl[source] = int(seconds)
+                except (TypeError, ValueError):
+                    console.print(f"[yellow]Ignoring invalid metadata cache TTL for {source}: {seconds}")
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "source TEXT NOT NULL, id TEXT NOT NULL, endpoint TEXT NOT NULL, "
+                "value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "PRIMARY KEY (source, id, endpoint))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS metadata_accessed ON metadata (accessed)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, source, id, endpoint):
+        """Return the cached value, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created FROM metadata WHERE source = ? AND id = ? AND endpoint = ?",
+                    (source, str(id), endpoint)
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl.get(source, 0):
+                    self.misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE metadata SET accessed = ? WHERE source = ? AND id = ? AND endpoint = ?",
+                    (now, source, str(id), endpoint)
+                )
+                conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+            except (sqlite3.Error, ValueError) as e:
+                console.print(f"[yellow]Metadata cache read failed: {e}")
+                self.misses += 1
+                return None
+
+    def set(self, source, id, endpoint, value):
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (source, id, endpoint, value, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                    (source, str(id), endpoint, json.dumps(value), now, now)
+                )
+                self._evict(conn)
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                console.print(f"[yellow]Metadata cache write failed: {e}")
+
+    def _evict(self, conn):
+        count = conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM metadata WHERE rowid IN (SELECT rowid FROM metadata ORDER BY accessed ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    async def fetch(self, source, id, endpoint, loader, meta, should_cache=None):
+        """
+        Return the cached response for (source, id, endpoint), calling loader() on a miss.
+
+        loader may be a plain callable or a coroutine function. Falsy responses are never
+        cached, and should_cache(value) can veto storing anything else (eg. empty searches).
+        meta['no_cache'] bypasses the cache completely, meta['refresh_cache'] skips the
+        lookup but still stores the fresh response.
+        """
+        if meta.get('no_cache', False):
+            return await _call(loader)
+        if not meta.get('refresh_cache', False):
+            value = self.get(source, id, endpoint)
+            if value is not None:
+                if meta.get('debug', False):
+                    console.print(f"[cyan]Metadata cache hit: {source} {id} {endpoint}")
+                return value
+        else:
+            self.misses += 1
+        value = await _call(loader)
+        if value and (should_cache is None or should_cache(value)):
+            self.set(source, id, endpoint, value)
+        return value
+
+    def stats(self):
+        return f"Metadata cache: {self.hits} hits, {self.misses} misses"
+
+
+async def _call(loader):
+    value = loader()
+    if inspect.isawaitable(value):
+        value = await value
+    return value
+
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+metadata_cache = MetadataCache(
+    os.path.join(base_dir, 'data', 'cache', 'metadata.db'),
+    ttl=config['DEFAULT'].get('metadata_cache_ttl', {}),
+    max_entries=config['DEFAULT'].get('metadata_cache_size', default_cache_entries),
+)
@@ -0,0 +1,287 @@
+import os
+import sys
+import time
+import sqlite3
+import hashlib
+import itertools
+import threading
+import concurrent.futures
+from src.console import console
+
+# Amount of content each worker hashes per task, rounded to whole pieces
+task_target_size = 128 * 1024 * 1024
+
+piece_cache_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'pieces.db')
+piece_cache = None
+
+# Set in every worker process by _init_worker
+_files = None
+_offsets = None
+
+
+def _init_worker(files):
+    global _files, _offsets
+    _files = files
+    _offsets = list(itertools.accumulate([0] + [size for _, size in files]))
+
+
+def _locate(offset):
+    """Return (file index, offset in file) for an offset into the concatenated content."""
+    for index in range(len(_files)):
+        if _offsets[index] <= offset < _offsets[index + 1]:
+            return index, offset - _offsets[index]
+    return len(_files), 0
+
+
+def _hash_range(first_piece, piece_count, piece_size):
+    """SHA-1 piece_count pieces starting at first_piece, reading each piece with one large read where possible."""
+    start = first_piece * piece_size
+    remaining = min(piece_count * piece_size, _offsets[-1] - start)
+    file_index, file_offset = _locate(start)
+    buffer = bytearray(piece_size)
+    view = memoryview(buffer)
+    hashes = bytearray()
+    handle = None
+    try:
+        while remaining > 0:
+            want = min(piece_size, remaining)
+            filled = 0
+            while filled < want:
+                if handle is None:
+                    if file_index >= len(_files):
+                        raise OSError(f"Content ended early while hashing piece {first_piece}")
+                    handle = open(_files[file_index][0], 'rb', buffering=0)
+                    handle.seek(file_offset)
+                read = handle.readinto(view[filled:want])
+                if not read:
+                    # Pieces run across file boundaries, carry on with the next file
+                    handle.close()
+                    handle = None
+                    file_index += 1
+                    file_offset = 0
+                    continue
+                filled += read
+            hashes += hashlib.sha1(view[:want]).digest()
+            remaining -= want
+    finally:
+        if handle is not None:
+            handle.close()
+    return bytes(hashes)
+
+
+class PieceCache:
+    """
+    On-disk cache of piece digests for contiguous piece ranges.
+
+    A range is keyed by the piece size and the (path, size, mtime, inode, offset, length) of every
+    file segment it covers, so unchanged content is never hashed twice while any change to a
+    file only invalidates the ranges touching it. Least recently used ranges are dropped once the
+    stored digests exceed max_size bytes.
+    """
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pieces (key TEXT PRIMARY KEY, digests BLOB NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, keys):
+        """Return {key: digests} for the keys that are cached."""
+        found = {}
+        with self._lock:
+            try:
+                conn = self._connect()
+                for key in keys:
+                    row = conn.execute("SELECT digests FROM pieces WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        found[key] = bytes(row[0])
+                if found:
+                    conn.executemany("UPDATE pieces SET accessed = ? WHERE key = ?", [(time.time(), key) for key in found])
+                    conn.commit()
+            except sqlite3.Error as e:
+                console.print(f"[yellow]Piece cache read failed: {e}")
+        return found
+
+    def set(self, key, digests):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("INSERT OR REPLACE INTO pieces (key, digests, accessed) VALUES (?, ?, ?)", (key, digests, time.time()))
+                total = conn.execute("SELECT COALESCE(SUM(LENGTH(digests)), 0) FROM pieces").fetchone()[0]
+                while total > self.max_size:
+                    row = conn.execute("SELECT key, LENGTH(digests) FROM pieces ORDER BY accessed ASC LIMIT 1").fetchone()
+                    if row is None:
+                        break
+                    conn.execute("DELETE FROM pieces WHERE key = ?", (row[0],))
+                    total -= row[1]
+                conn.commit()
+            except sqlite3.Error as e:
+                console.print(f"[yellow]Piece cache write failed: {e}")
+
+    def purge(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+                return True
+        return False
+
+
+def _range_key(files, offsets, start, end, piece_size):
+    """Cache key for the content between start and end of the concatenated files."""
+    segments = []
+    for index, (path, size, mtime, inode) in enumerate(files):
+        file_start, file_end = offsets[index], offsets[index + 1]
+        if file_end <= start or file_start >= end:
+            continue
+        segment_start = max(start, file_start) - file_start
+        segment_end = min(end, file_end) - file_start
+        segments.append(f"{path}|{size}|{mtime}|{inode}|{segment_start}|{segment_end - segment_start}")
+    return hashlib.sha1((f"{piece_size}\n" + "\n".join(segments)).encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def get_piece_cache(config):
+    """The shared piece cache, or None when piece_cache_size is 0."""
+    global piece_cache
+    try:
+        max_size = int(config['DEFAULT'].get('piece_cache_size', 64)) * 1024 * 1024
+    except (TypeError, ValueError):
+        max_size = 64 * 1024 * 1024
+    if max_size <= 0:
+        return None
+    if piece_cache is None:
+        piece_cache = PieceCache(piece_cache_path, max_size)
+    return piece_cache
+
+
+def purge_piece_cache():
+    """Remove the piece cache from disk, returns True if there was one."""
+    if piece_cache is not None:
+        return piece_cache.purge()
+    if os.path.exists(piece_cache_path):
+        os.remove(piece_cache_path)
+        return True
+    return False
+
+
+def get_hash_processes(config):
+    """Number of processes to hash with, 1 or less means torf's own hasher."""
+    default = min(os.cpu_count() or 1, 8)
+    try:
+        return int(config['DEFAULT'].get('hash_processes', default))
+    except (TypeError, ValueError):
+        return default
+
+
+def hash_pieces(filepaths, piece_size, processes, callback=None, interval=5, cache=None):
+    """
+    Hash the concatenated content of filepaths into the torrent `pieces` string.
+
+    Contiguous piece ranges are handed to a process pool and the digests are joined in order.
+    Ranges found in cache are reused without reading the content, and freshly hashed ranges are stored.
+    callback(filepath, pieces_done, pieces_total) is called at most every interval seconds and once at the end.
+    """
+    stats = [os.stat(path) for path in filepaths]
+    files = [(str(path), stat.st_size) for path, stat in zip(filepaths, stats)]
+    offsets = list(itertools.accumulate([0] + [size for _, size in files]))
+    total_size = offsets[-1]
+    pieces_total = -(-total_size // piece_size)
+    pieces_per_task = max(1, task_target_size // piece_size)
+    firsts = list(range(0, pieces_total, pieces_per_task))
+    counts = [min(pieces_per_task, pieces_total - first) for first in firsts]
+
+    keys = []
+    cached = {}
+    if cache is not None:
+        key_files = [(path, size, stat.st_mtime_ns, stat.st_ino) for (path, size), stat in zip(files, stats)]
+        keys = [
+            _range_key(key_files, offsets, first * piece_size, min((first + count) * piece_size, total_size), piece_size)
+            for first, count in zip(firsts, counts)
+        ]
+        cached = cache.get(keys)
+        if cached:
+            console.print(f"[cyan]Reusing cached hashes for {len(cached)}/{len(keys)} piece ranges")
+
+    pieces = bytearray()
+    pieces_done = 0
+    last_callback = 0
+    if callback:
+        callback(files[0][0] if files else None, 0, pieces_total)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(files,)) as executor:
+        futures = {}
+        for index, (first, count) in enumerate(zip(firsts, counts)):
+            if not keys or keys[index] not in cached:
+                futures[index] = executor.submit(_hash_range, first, count, piece_size)
+        for index in range(len(firsts)):
+            if index in futures:
+                digest = futures[index].result()
+                if cache is not None:
+                    cache.set(keys[index], digest)
+            else:
+                digest = cached[keys[index]]
+            pieces += digest
+            pieces_done += len(digest) // 20
+            if callback and (time.time() - last_callback >= interval or pieces_done == pieces_total):
+                last_callback = time.time()
+                callback(None, pieces_done, pieces_total)
+    return bytes(pieces)
+
+
+def hash_torrent(torrent, processes, callback=None, interval=5, cache=None):
+    """Drop-in for torrent.generate() that fills in info['pieces'] using hash_pieces."""
+    def progress(filepath, pieces_done, pieces_total):
+        callback(torrent, filepath, pieces_done, pieces_total)
+
+    filepaths = list(torrent.filepaths)
+    torrent.metainfo['info']['pieces'] = hash_pieces(
+        filepaths, torrent.piece_size, processes, callback=progress if callback else None, interval=interval, cache=cache
+    )
+    return torrent
+
+
+def benchmark(path, piece_size, processes):
+    """Hash path with torf and with hash_pieces, report throughput and check both agree."""
+    import torf
+
+    torrent = torf.Torrent(path=path, piece_size=piece_size)
+    size_mb = torrent.size / (1024 * 1024)
+
+    start = time.time()
+    torrent.generate()
+    torf_time = time.time() - start
+    torf_pieces = torrent.metainfo['info']['pieces']
+    console.print(f"torf: {torf_time:.2f}s ({size_mb / torf_time:.2f} MB/s)")
+
+    start = time.time()
+    pieces = hash_pieces(list(torrent.filepaths), piece_size, processes)
+    our_time = time.time() - start
+    console.print(f"hash_pieces x{processes}: {our_time:.2f}s ({size_mb / our_time:.2f} MB/s)")
+
+    if pieces == torf_pieces:
+        console.print(f"[green]Pieces match, {torf_time / our_time:.2f}x speedup")
+    else:
+        console.print("[bold red]Pieces do not match torf!")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    # python -m src.piecehasher <path> [piece size in MiB] [processes]
+    if len(sys.argv) < 2:
+        console.print("Usage: python -m src.piecehasher <path> [piece size MiB] [processes]")
+        sys.exit(1)
+    benchmark_piece_size = int(sys.argv[2]) * 1024 * 1024 if len(sys.argv) > 2 else 16 * 1024 * 1024
+    benchmark_processes = int(sys.argv[3]) if len(sys.argv) > 3 else min(os.cpu_count() or 1, 8)
+    sys.exit(0 if benchmark(sys.argv[1], benchmark_piece_size, benchmark_processes) else 1)
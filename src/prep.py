@@ -6,10 +6,12 @@ from data.config import config
 from src.trackersetup import tracker_class_map
 from src.tvmaze import search_tvmaze
 from src.imdb import get_imdb_info_api, search_imdb
+from src.metacache import metadata_cache
 from src.trackermeta import update_metadata_from_tracker
 from src.tmdb import tmdb_other_meta, get_tmdb_imdb_from_mediainfo, get_tmdb_from_imdb, get_tmdb_id
 from src.region import get_region, get_distributor, get_service
 from src.exportmi import exportInfo, mi_resolution
+from src.mediainfo import parse_mediainfo
 from src.getseasonep import get_season_episode
 from src.btnid import get_btn_torrents, get_bhd_torrents
 
@@ -26,7 +28,6 @@ try:
     import json
     import glob
     import requests
-    from pymediainfo import MediaInfo
     import tmdbsimple as tmdb
     import time
     import itertools
@@ -324,10 +325,12 @@ class Prep():
         meta['tvmaze'] = meta.get('tvmaze_id', 0)
         # If no imdb, search for it
         if meta.get('imdb_id') == 0:
-            meta['imdb_id'] = await search_imdb(filename, meta['search_year'])
+            meta['imdb_id'] = await search_imdb(filename, meta['search_year'], meta)
         # Get imdb data
         if meta.get('imdb_info', None) is None and int(meta['imdb_id']) != 0:
             meta['imdb_info'] = await get_imdb_info_api(meta['imdb_id'], meta)
+        if meta['debug']:
+            console.print(f"[cyan]{metadata_cache.stats()}")
         if meta.get('tag', None) is None:
             meta['tag'] = await self.get_tag(video, meta)
         else:
@@ -935,9 +938,9 @@ class Prep():
             if is_disc == "DVD" or source in ("DVD", "dvd"):
                 try:
                     if is_disc == "DVD":
-                        mediainfo = MediaInfo.parse(f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_0.IFO")
+                        mediainfo = parse_mediainfo(f"{meta['discs'][0]['path']}/VTS_{meta['discs'][0]['main_set'][0][:2]}_0.IFO").media_info
                     else:
-                        mediainfo = MediaInfo.parse(video)
+                        mediainfo = parse_mediainfo(video).media_info
                     for track in mediainfo.tracks:
                         if track.track_type == "Video":
                             system = track.standard
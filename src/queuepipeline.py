@@ -0,0 +1,106 @@
+import asyncio
+import time
+import traceback
+from src.console import console
+
+# Default number of queue items allowed inside each stage at the same time.
+# The prep stage asks questions (confirmation, dupes), so keep it serial unless unattended.
+default_stage_limits = {
+    'prep': 1,
+    'screens': 1,
+    'images': 2,
+    'hash': 1,
+    'upload': 1,
+}
+
+
+def get_stage_limits(config, meta):
+    """Merge the configured per-stage limits over the defaults."""
+    stage_limits = dict(default_stage_limits)
+    configured = config['DEFAULT'].get('pipeline_stage_limits', {})
+    if isinstance(configured, dict):
+        for stage, limit in configured.items():
+            try:
+                stage_limits[stage] = max(1, int(limit))
+            except (TypeError, ValueError):
+                console.print(f"[yellow]Ignoring invalid pipeline limit for {stage}: {limit}")
+    if not meta.get('unattended', False):
+        stage_limits['prep'] = 1
+    return stage_limits
+
+
+def get_prompt_stages(meta):
+    """Stages that may ask questions and must not overlap each other, none when unattended."""
+    if meta.get('unattended', False):
+        return ()
+    return ('prep', 'upload')
+
+
+async def run_queue_pipeline(items, stages, stage_limits, max_in_flight, on_item_done, debug=False, prompt_stages=()):
+    """
+    Push queue items through a list of (name, coroutine) stages.
+
+    Each stage is guarded by its own semaphore so that, for example, one item can be
+    hashing while the next one is taking screenshots and a third is still in prep.
+    A stage returning False stops that item from entering the later stages.
+    on_item_done(index, meta, completed) is awaited in queue order, regardless of the
+    order in which items actually finish.
+    Stages listed in prompt_stages also share one lock, so a prompt from one item's prep
+    never interleaves with the upload confirmation or dupe prompts of another item.
+    """
+    stage_semaphores = {name: asyncio.Semaphore(stage_limits.get(name, 1)) for name, _ in stages}
+    prompt_lock = asyncio.Lock()
+    in_flight = asyncio.Semaphore(max(1, max_in_flight))
+    finished = {}
+    next_index = 0
+    done_lock = asyncio.Lock()
+
+    async def flush_finished():
+        nonlocal next_index
+        async with done_lock:
+            while next_index in finished:
+                meta, completed = finished.pop(next_index)
+                await on_item_done(next_index, meta, completed)
+                next_index += 1
+
+    async def run_item(index, meta):
+        completed = True
+        try:
+            for name, stage in stages:
+                async with stage_semaphores[name]:
+                    if debug:
+                        stage_start = time.time()
+                        console.print(f"[cyan]Pipeline: item {index + 1} entering {name}")
+                    if name in prompt_stages:
+                        async with prompt_lock:
+                            proceed = await stage(meta)
+                    else:
+                        proceed = await stage(meta)
+                    if debug:
+                        console.print(f"[cyan]Pipeline: item {index + 1} finished {name} in {time.time() - stage_start:.4f} seconds")
+                if not proceed:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            completed = False
+            console.print(f"[bold red]Pipeline item {meta.get('path')} failed: {e}")
+            if debug:
+                console.print(traceback.format_exc())
+        finally:
+            in_flight.release()
+
+        finished[index] = (meta, completed)
+        await flush_finished()
+
+    tasks = []
+    try:
+        for index, meta in enumerate(items):
+            await in_flight.acquire()
+            tasks.append(asyncio.create_task(run_item(index, meta)))
+        await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -1,10 +1,13 @@
 import glob
 import os
 import json
+import asyncio
+import itertools
 from src.console import console
 from urllib.parse import urlparse
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
 from src.uploadscreens import upload_screens
+from src.imagehosts import image_hosts, configured_image_hosts
 from data.config import config
 
 
@@ -15,7 +18,95 @@ def match_host(hostname, approved_hosts):
     return hostname
 
 
+def image_host_of(url, url_host_mapping):
+    """Image host name of url, per a tracker's url_host_mapping."""
+    mapped_host = match_host(urlparse(url).netloc, url_host_mapping.keys())
+    return url_host_mapping.get(mapped_host, mapped_host)
+
+
+def plan_image_hosts(requirements, hosts):
+    """
+    Smallest set of hosts to upload to so every tracker gets images from a host it approves.
+
+    requirements maps each tracker to its approved hosts, hosts is the image hosts that can be
+    uploaded to, in order of preference. Among equally small sets the most preferred one wins.
+    Returns {host: [trackers]}, each tracker assigned to the most preferred planned host it
+    approves. Trackers no host in hosts can satisfy are left out.
+    """
+    requirements = {tracker: set(approved) & set(hosts) for tracker, approved in requirements.items()}
+    requirements = {tracker: approved for tracker, approved in requirements.items() if approved}
+    if not requirements:
+        return {}
+    candidates = [host for host in hosts if any(host in approved for approved in requirements.values())]
+    for size in range(1, len(candidates) + 1):
+        # combinations() keeps the order of candidates, so the first cover found is the most preferred
+        for planned in itertools.combinations(candidates, size):
+            if all(approved & set(planned) for approved in requirements.values()):
+                plan = {host: [] for host in planned}
+                for tracker, approved in requirements.items():
+                    plan[next(host for host in planned if host in approved)].append(tracker)
+                return plan
+    return {}
+
+
+async def plan_rehosts(meta, tracker_classes):
+    """
+    Upload the screenshots once to the fewest image hosts that satisfy every tracker about to upload.
+
+    tracker_classes maps tracker names to tracker classes, those with approved_image_hosts and url_host_mapping are planned for.
+    Trackers whose hosts the current image_list already satisfies are left alone. The others get
+    {tracker}_images_key set to the images on their planned host, which check_hosts then uses as is.
+    Any tracker whose planned upload comes up short falls back to its own check_hosts round.
+    """
+    if meta.get('skip_imghost_upload', False):
+        return {}
+
+    requirements = {}
+    for tracker, tracker_class in tracker_classes.items():
+        approved = getattr(tracker_class, 'approved_image_hosts', None)
+        if not approved:
+            continue
+        mapping = tracker_class.url_host_mapping
+        if meta.get('image_list') and all(image_host_of(image['raw_url'], mapping) in approved for image in meta['image_list']):
+            continue
+        requirements[tracker] = approved
+
+    hosts = [host for host in configured_image_hosts() if host in image_hosts]
+    plan = plan_image_hosts(requirements, hosts)
+    if not plan:
+        return {}
+
+    multi_screens = int(config['DEFAULT'].get('screens', 6))
+    all_screenshots = await collect_screenshots(meta, multi_screens)
+    if not all_screenshots:
+        return {}
+    console.print(f"[green]Uploading screenshots to {', '.join(plan)} for {', '.join(t for trackers in plan.values() for t in trackers)}")
+
+    async def upload_to(host):
+        # A shallow copy, so concurrent uploads each see their own image host
+        host_meta = {**meta, 'imghost': host}
+        uploaded_images, _ = await upload_screens(
+            host_meta, multi_screens, configured_image_hosts().index(host) + 1, 0, multi_screens, all_screenshots, {}
+        )
+        return uploaded_images or []
+
+    results = await asyncio.gather(*[upload_to(host) for host in plan], return_exceptions=True)
+    for (host, trackers), uploaded_images in zip(plan.items(), results):
+        if isinstance(uploaded_images, Exception) or len(uploaded_images) < min(multi_screens, len(all_screenshots)):
+            console.print(f"[yellow]Upload to {host} came up short, {', '.join(trackers)} will rehost on their own.")
+            continue
+        for tracker in trackers:
+            meta[f'{tracker}_images_key'] = list(uploaded_images)
+    return plan
+
+
 async def check_hosts(meta, tracker, url_host_mapping, img_host_index=1, approved_image_hosts=None):
+    planned_images = meta.get(f'{tracker}_images_key')
+    if planned_images and all(image_host_of(image['raw_url'], url_host_mapping) in approved_image_hosts for image in planned_images):
+        if meta['debug']:
+            console.print(f"[green]Using the {len(planned_images)} images planned for {tracker}.")
+        return
+
     reuploaded_images_path = os.path.join(meta['base_dir'], "tmp", meta['uuid'], "reuploaded_images.json")
     reuploaded_images = []
 
@@ -82,22 +173,15 @@ async def check_hosts(meta, tracker, url_host_mapping, img_host_index=1, approve
             return
 
 
-async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_hosts=None, img_host_index=1, file=None):
-    retry_mode = False
-    images_reuploaded = False
-    new_images_key = f'{tracker}_images_key'
-    discs = meta.get('discs', [])  # noqa F841
+async def collect_screenshots(meta, multi_screens):
+    """Screenshots in the tmp folder to rehost, taking new ones when there are fewer than multi_screens."""
     filelist = meta.get('video', [])
     filename = meta['title']
     path = meta['path']
     if isinstance(filelist, str):
         filelist = [filelist]
-
-    multi_screens = int(config['DEFAULT'].get('screens', 6))
     base_dir = meta['base_dir']
     folder_id = meta['uuid']
-    meta[new_images_key] = []
-
     screenshots_dir = os.path.join(base_dir, 'tmp', folder_id)
     all_screenshots = []
 
@@ -138,6 +222,22 @@ async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_ho
                 existing_screens = glob.glob(os.path.join(screenshots_dir, filename_pattern))
 
         all_screenshots.extend(existing_screens)
+    return all_screenshots
+
+
+async def handle_image_upload(meta, tracker, url_host_mapping, approved_image_hosts=None, img_host_index=1, file=None):
+    retry_mode = False
+    images_reuploaded = False
+    new_images_key = f'{tracker}_images_key'
+    discs = meta.get('discs', [])  # noqa F841
+
+    multi_screens = int(config['DEFAULT'].get('screens', 6))
+    base_dir = meta['base_dir']
+    folder_id = meta['uuid']
+    meta[new_images_key] = []
+
+    screenshots_dir = os.path.join(base_dir, 'tmp', folder_id)
+    all_screenshots = await collect_screenshots(meta, multi_screens)
 
     if not all_screenshots:
         console.print("[red]No screenshots were generated or found. Please check the screenshot generation process.")
@@ -4,18 +4,27 @@ import glob
 import time
 import ffmpeg
 import random
+import io
 import json
+import math
 import platform
 import asyncio
 import oxipng
-import psutil
 import sys
-import concurrent.futures
 import signal
+import threading
 import gc
 import traceback
+import contextlib
+import contextvars
 from pymediainfo import MediaInfo
 from src.console import console
+from src.mediainfo import parse_mediainfo
+from src.keyframes import get_keyframes
+from src.dvdifo import read_dvd_title
+from src.tonemap import tonemap_chain, lut_tonemap, get_tonemap_lut, compare_tonemap
+from src.imagebuffers import image_buffers, split_png_stream
+from src.imagepool import image_pool, vs_pool
 from data.config import config
 
 img_host = [
@@ -33,6 +42,10 @@ except ValueError:
     task_limit = 1
 tone_map = config['DEFAULT'].get('tone_map', False)
 optimize_images = config['DEFAULT'].get('optimize_images', True)
+batch_screenshots = config['DEFAULT'].get('batch_screenshots', True)
+keyframe_index = config['DEFAULT'].get('keyframe_index', False)
+screenshot_precheck = config['DEFAULT'].get('screenshot_precheck', False)
+tonemap_lut = config['DEFAULT'].get('tonemap_lut', False)
 
 
 async def sanitize_filename(filename):
@@ -40,7 +53,82 @@ async def sanitize_filename(filename):
     return re.sub(r'[<>:"/\\|?*]', '_', filename)
 
 
-async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs, image_list, ffdebug, num_screens=None, force_screenshots=False):
+# Lower case file name to full path for every file under a disc path, see m2ts_index
+m2ts_indexes = {}
+
+
+def m2ts_index(path):
+    """Index the files under a BDMV path once, instead of walking the disc for every playlist file."""
+    if path not in m2ts_indexes:
+        index = {}
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                index[name.lower()] = os.path.join(root, name)
+        m2ts_indexes[path] = index
+    return m2ts_indexes[path]
+
+
+def vs_screenshot_task(source, num, dir):
+    """Runs vs_screengn in an image pool worker, VapourSynth is only imported there."""
+    from src.vs import vs_screengn
+    return vs_screengn(source=source, encode=None, filter_b_frames=False, num=num, dir=dir)
+
+
+async def run_limited(semaphore, coro):
+    """Await coro, holding semaphore if one is given."""
+    if semaphore is None:
+        return await coro
+    async with semaphore:
+        return await coro
+
+
+# ffmpeg processes started by run_ffmpeg inside the current capture_scope
+_capture_processes = contextvars.ContextVar('capture_processes', default=None)
+
+
+@contextlib.contextmanager
+def capture_scope():
+    """Collect the ffmpeg processes run_ffmpeg starts in this context (and tasks created from it) into a set."""
+    processes = set()
+    token = _capture_processes.set(processes)
+    try:
+        yield processes
+    finally:
+        _capture_processes.reset(token)
+
+
+def kill_capture_processes(processes):
+    """Kill the ffmpeg processes of a capture_scope that are still running, without waiting for them."""
+    for process in list(processes):
+        if process.returncode is None:
+            console.print(f"[red]Killing ffmpeg process: {process.pid}[/red]")
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+
+
+async def run_ffmpeg(command):
+    """Run a compiled ffmpeg command, returns (returncode, stdout, stderr). The process is killed if cancelled."""
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    processes = _capture_processes.get()
+    if processes is not None:
+        processes.add(process)
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        raise
+    finally:
+        if processes is not None:
+            processes.discard(process)
+    return process.returncode, stdout, stderr
+
+
+async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs, image_list, ffdebug, num_screens=None, force_screenshots=False, capture_semaphore=None):
     screens = meta['screens']
     if meta['debug']:
         start_time = time.time()
@@ -61,17 +149,14 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
     length = 0
     file = None
     frame_rate = None
+    disc_files = m2ts_index(bdinfo['path'])
     for each in bdinfo['files']:
         # Calculate total length in seconds, including fractional part
         int_length = sum(float(x) * 60 ** i for i, x in enumerate(reversed(each['length'].split(':'))))
 
         if int_length > length:
             length = int_length
-            for root, dirs, files in os.walk(bdinfo['path']):
-                for name in files:
-                    if name.lower() == each['file'].lower():
-                        file = os.path.join(root, name)
-                        break  # Stop searching once the file is found
+            file = disc_files.get(each['file'].lower(), file)
 
     if 'video' in bdinfo and bdinfo['video']:
         fps_string = bdinfo['video'][0].get('fps', None)
@@ -84,8 +169,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
     keyframe = 'nokey' if "VC-1" in bdinfo['video'][0]['codec'] or bdinfo['video'][0]['hdr_dv'] != "" else 'none'
     if meta['debug']:
         print(f"File: {file}, Length: {length}, Frame Rate: {frame_rate}")
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
-    existing_screens = glob.glob(f"{sanitized_filename}-*.png")
+    existing_screens = glob.glob(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-*.png")
     total_existing = len(existing_screens) + len(existing_images)
     if not force_screenshots:
         num_screens = max(0, screens - total_existing)
@@ -107,18 +191,21 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
     capture_tasks = []
     capture_results = []
     if use_vs:
-        from src.vs import vs_screengn
-        vs_screengn(source=file, encode=None, filter_b_frames=False, num=num_screens, dir=f"{base_dir}/tmp/{folder_id}/")
+        # Indexing and rendering are blocking, keep them out of the event loop
+        await vs_pool.run(vs_screenshot_task, file, num_screens, f"{base_dir}/tmp/{folder_id}/")
     else:
         if meta.get('ffdebug', False):
             loglevel = 'verbose'
         else:
             loglevel = 'quiet'
 
+        if hdr_tonemap and tonemap_lut:
+            hdr_tonemap = await get_tonemap_lut(file, desat=8.0, debug=meta['debug']) or True
+
         ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate)
         existing_indices = {int(p.split('-')[-1].split('.')[0]) for p in existing_screens}
         capture_tasks = [
-            capture_disc_task(
+            run_limited(capture_semaphore, capture_disc_task(
                 i,
                 file,
                 ss_times[i],
@@ -126,7 +213,7 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
                 keyframe,
                 loglevel,
                 hdr_tonemap
-            )
+            ))
             for i in range(num_screens + 1)
         ]
 
@@ -169,30 +256,26 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
 
         def handle_sigint(sig, frame):
             console.print("\n[red]CTRL+C detected. Cancelling optimization...[/red]")
-            executor.shutdown(wait=False)
+            image_pool.terminate()
             stop_event.set()
             for task in asyncio.all_tasks(loop):
                 task.cancel()
 
-        signal.signal(signal.SIGINT, handle_sigint)
+        # Trackers uploading concurrently run in worker threads, where signal handlers can't be set
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, handle_sigint)
 
         try:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
-                tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
+            tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task)) for image in valid_images]
 
-                optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
+            optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         except KeyboardInterrupt:
             console.print("\n[red]CTRL+C detected. Cancelling tasks...[/red]")
-            executor.shutdown(wait=False)
-            await kill_all_child_processes()
+            image_pool.terminate()
             console.print("[red]All tasks cancelled. Exiting.[/red]")
             sys.exit(1)
         finally:
-            console.print("[yellow]Shutting down optimization workers...[/yellow]")
-            executor.shutdown(wait=False)
-            await asyncio.sleep(0.1)
-            await kill_all_child_processes()
             gc.collect()
 
         optimized_results = [res for res in optimized_results if not isinstance(res, str) or not res.startswith("Error")]
@@ -236,11 +319,14 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
                             os.remove(image_path)
 
                         random_time = random.uniform(0, length)
-                        screenshot_response = await capture_disc_task(
-                            (index, file, random_time, image_path, keyframe, loglevel, hdr_tonemap)
+                        capture_result = await capture_disc_task(
+                            index, file, random_time, image_path, keyframe, loglevel, hdr_tonemap
                         )
+                        screenshot_response = capture_result[1] if isinstance(capture_result, tuple) else None
+                        if not screenshot_response:
+                            raise FileNotFoundError(f"Screenshot {image_path} was not created successfully.")
 
-                        await optimize_image_task(screenshot_response)
+                        await image_pool.run(optimize_image_task, screenshot_response)
                         new_size = os.path.getsize(screenshot_response)
                         valid_image = False
 
@@ -280,23 +366,18 @@ async def disc_screenshots(meta, filename, bdinfo, folder_id, base_dir, use_vs,
 async def capture_disc_task(index, file, ss_time, image_path, keyframe, loglevel, hdr_tonemap):
     try:
         ff = ffmpeg.input(file, ss=ss_time, skip_frame=keyframe)
-        if hdr_tonemap:
-            ff = (
-                ff
-                .filter('zscale', transfer='linear')
-                .filter('tonemap', tonemap='mobius', desat=8.0)
-                .filter('zscale', transfer='bt709')
-                .filter('format', 'rgb24')
-            )
+        if isinstance(hdr_tonemap, str):
+            ff = lut_tonemap(ff, hdr_tonemap)
+        elif hdr_tonemap:
+            ff = tonemap_chain(ff, desat=8.0)
         command = (
             ff
             .output(image_path, vframes=1, pix_fmt="rgb24")
             .overwrite_output()
             .global_args('-loglevel', loglevel)
         )
-        process = await asyncio.create_subprocess_exec(*command.compile(), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-        stdout, stderr = await process.communicate()
-        if process.returncode == 0:
+        returncode, stdout, stderr = await run_ffmpeg(command.compile())
+        if returncode == 0:
             return (index, image_path)
         else:
             console.print(f"[red]FFmpeg error capturing screenshot: {stderr.decode()}")
@@ -306,6 +387,27 @@ async def capture_disc_task(index, file, ss_time, image_path, keyframe, loglevel
         return None
 
 
+async def capture_playlist_screenshots(meta, playlists, num_screens):
+    """
+    Capture screenshots for several BDMV playlists at once.
+
+    playlists is a list of (playlist number, bdinfo). All playlists share one budget of concurrent
+    ffmpeg captures (as many as a single playlist would use) and the shared image pool, so there is
+    no idle time between playlists without running more processes than before.
+    """
+    capture_semaphore = asyncio.Semaphore(max(task_limit, num_screens + 1))
+    results = await asyncio.gather(*[
+        disc_screenshots(
+            meta, f"PLAYLIST_{i}", bdinfo, meta['uuid'], meta['base_dir'], False, [], meta.get('ffdebug', False),
+            num_screens, True, capture_semaphore=capture_semaphore
+        )
+        for i, bdinfo in playlists
+    ], return_exceptions=True)
+    for (i, _), result in zip(playlists, results):
+        if isinstance(result, Exception):
+            console.print(f"[red]Error during BDMV screenshot capture for playlist {i}: {result}")
+
+
 async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
     screens = meta['screens']
     if 'image_list' not in meta:
@@ -358,11 +460,7 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
 
         while loops < max_loops:
             try:
-                vob_mi = MediaInfo.parse(
-                    f"{meta['discs'][disc_num]['path']}/VTS_{main_set[n]}",
-                    output='JSON'
-                )
-                vob_mi = json.loads(vob_mi)
+                vob_mi = parse_mediainfo(f"{meta['discs'][disc_num]['path']}/VTS_{main_set[n]}", header_only=True).data
 
                 for track in vob_mi.get('media', {}).get('track', []):
                     duration = float(track.get('Duration', 0))
@@ -389,8 +487,22 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         return fallback_duration, 0
 
     main_set = meta['discs'][disc_num]['main_set'][1:] if len(meta['discs'][disc_num]['main_set']) > 1 else meta['discs'][disc_num]['main_set']
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
-    voblength, n = await _is_vob_good(0, 0, num_screens)
+
+    # With the IFO cell table every timestamp maps straight to a VOB and byte offset, so no VOB has to be probed
+    dvd_title = None
+    try:
+        title_vobs = [f"{meta['discs'][disc_num]['path']}/VTS_{vob}" for vob in meta['discs'][disc_num]['main_set'] if not vob.endswith('_0.VOB')]
+        if title_vobs:
+            dvd_title = await asyncio.to_thread(read_dvd_title, f"{meta['discs'][disc_num]['path']}/VTS_{meta['discs'][disc_num]['main_set'][0][:2]}_0.IFO", title_vobs)
+    except Exception as e:
+        console.print(f"[yellow]Could not read the IFO cell table, probing VOBs instead: {e}")
+    if dvd_title and dvd_title.duration > 1:
+        voblength = dvd_title.duration
+        if meta['debug']:
+            console.print(f"[cyan]Using IFO cell timing, {len(dvd_title.cells)} cells over {voblength:.1f}s")
+    else:
+        dvd_title = None
+        voblength, n = await _is_vob_good(0, 0, num_screens)
     ss_times = await valid_ss_time([], num_screens + 1, voblength, frame_rate)
     capture_tasks = []
     existing_images = 0
@@ -408,14 +520,18 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
         capture_results = existing_image_paths
         return
     else:
+        capture_semaphore = asyncio.Semaphore(task_limit)
         for i in range(num_screens + 1):
             image = f"{meta['base_dir']}/tmp/{meta['uuid']}/{meta['discs'][disc_num]['name']}-{i}.png"
             input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[i % len(main_set)]}"
             if not os.path.exists(image) or meta.get('retake', False):
+                byte_offset = None
+                if dvd_title:
+                    input_file, byte_offset = dvd_title.locate(ss_times[i])
                 capture_tasks.append(
-                    capture_dvd_screenshot(
-                        (i, input_file, image, ss_times[i], meta, width, height, w_sar, h_sar)
-                    )
+                    run_limited(capture_semaphore, capture_dvd_screenshot(
+                        (i, input_file, image, ss_times[i], meta, width, height, w_sar, h_sar), byte_offset
+                    ))
                 )
 
         capture_results = []
@@ -466,31 +582,27 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
 
         def handle_sigint(sig, frame):
             console.print("\n[red]CTRL+C detected. Cancelling optimization...[/red]")
-            executor.shutdown(wait=False)
+            image_pool.terminate()
             stop_event.set()
             for task in asyncio.all_tasks(loop):
                 task.cancel()
 
-        signal.signal(signal.SIGINT, handle_sigint)
+        # Trackers uploading concurrently run in worker threads, where signal handlers can't be set
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, handle_sigint)
 
         try:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
-                # Start all tasks in parallel using worker_wrapper()
-                tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
+            # Start all tasks in parallel using worker_wrapper()
+            tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task)) for image in valid_images]
 
-                # Wait for all tasks to complete
-                optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Wait for all tasks to complete
+            optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
         except KeyboardInterrupt:
             console.print("\n[red]CTRL+C detected. Cancelling tasks...[/red]")
-            executor.shutdown(wait=False)
-            await kill_all_child_processes()
+            image_pool.terminate()
             console.print("[red]All tasks cancelled. Exiting.[/red]")
             sys.exit(1)
         finally:
-            console.print("[yellow]Shutting down optimization workers...[/yellow]")
-            await asyncio.sleep(0.1)
-            await kill_all_child_processes()
-            executor.shutdown(wait=False)
             gc.collect()
 
         optimized_results = [res for res in optimized_results if not isinstance(res, str) or not res.startswith("Error")]
@@ -499,106 +611,114 @@ async def dvd_screenshots(meta, disc_num, num_screens=None, retry_cap=None):
             console.print("Optimized results:", optimized_results)
         console.print(f"[green]Successfully optimized {len(optimized_results)} images.")
 
-        executor.shutdown(wait=True)  # Ensure cleanup
-
         valid_results = []
         remaining_retakes = []
+        retake_images = []
 
         for image in optimized_results:
             if "Error" in image:
                 console.print(f"[red]{image}")
                 continue
 
-            retake = False
             image_size = os.path.getsize(image)
             if image_size <= 120000:
                 console.print(f"[yellow]Image {image} is incredibly small, retaking.")
-                retake = True
-
-            if retake:
-                retry_attempts = 3
-                for attempt in range(1, retry_attempts + 1):
-                    console.print(f"[yellow]Retaking screenshot for: {image} (Attempt {attempt}/{retry_attempts})[/yellow]")
+                retake_images.append(image)
+            else:
+                valid_results.append(image)
 
-                    index = int(image.rsplit('-', 1)[-1].split('.')[0])
-                    input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[index % len(main_set)]}"
-                    adjusted_time = random.uniform(0, voblength)
+        async def retake_screenshot(image):
+            """Capture image again at random times until it is big enough, returns the retaken image or None."""
+            retry_attempts = 3
+            for attempt in range(1, retry_attempts + 1):
+                console.print(f"[yellow]Retaking screenshot for: {image} (Attempt {attempt}/{retry_attempts})[/yellow]")
 
-                    if os.path.exists(image):  # Prevent unnecessary deletion error
-                        try:
-                            os.remove(image)
-                        except Exception as e:
-                            console.print(f"[red]Failed to delete {image}: {e}[/red]")
-                            break
+                index = int(image.rsplit('-', 1)[-1].split('.')[0])
+                input_file = f"{meta['discs'][disc_num]['path']}/VTS_{main_set[index % len(main_set)]}"
+                adjusted_time = random.uniform(0, voblength)
+                byte_offset = None
+                if dvd_title:
+                    input_file, byte_offset = dvd_title.locate(adjusted_time)
 
+                if os.path.exists(image):  # Prevent unnecessary deletion error
                     try:
-                        # Ensure `capture_dvd_screenshot()` always returns a tuple
-                        screenshot_response = await capture_dvd_screenshot(
-                            (index, input_file, image, adjusted_time, meta, width, height, w_sar, h_sar)
-                        )
+                        os.remove(image)
+                    except Exception as e:
+                        console.print(f"[red]Failed to delete {image}: {e}[/red]")
+                        return None
 
-                        # Ensure it is a tuple before unpacking
-                        if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
-                            console.print(f"[red]Failed to capture screenshot for {image}. Retrying...[/red]")
-                            continue
+                try:
+                    # Ensure `capture_dvd_screenshot()` always returns a tuple
+                    screenshot_response = await capture_dvd_screenshot(
+                        (index, input_file, image, adjusted_time, meta, width, height, w_sar, h_sar), byte_offset
+                    )
 
-                        index, screenshot_result = screenshot_response  # Safe unpacking
+                    # Ensure it is a tuple before unpacking
+                    if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
+                        console.print(f"[red]Failed to capture screenshot for {image}. Retrying...[/red]")
+                        continue
 
-                        if screenshot_result is None:
-                            console.print(f"[red]Failed to capture screenshot for {image}. Retrying...[/red]")
-                            continue
+                    index, screenshot_result = screenshot_response  # Safe unpacking
 
-                        await optimize_image_task(screenshot_result)
+                    if screenshot_result is None:
+                        console.print(f"[red]Failed to capture screenshot for {image}. Retrying...[/red]")
+                        continue
 
-                        retaken_size = os.path.getsize(screenshot_result)
-                        if retaken_size > 75000:
-                            console.print(f"[green]Successfully retaken screenshot for: {screenshot_result} ({retaken_size} bytes)[/green]")
-                            valid_results.append(screenshot_result)
-                            break
-                        else:
-                            console.print(f"[red]Retaken image {screenshot_result} is still too small. Retrying...[/red]")
-                    except Exception as e:
-                        console.print(f"[red]Error capturing screenshot for {input_file} at {adjusted_time}: {e}[/red]")
+                    await image_pool.run(optimize_image_task, screenshot_result)
 
-                else:
-                    console.print(f"[red]All retry attempts failed for {image}. Skipping.[/red]")
-                    remaining_retakes.append(image)
+                    retaken_size = os.path.getsize(screenshot_result)
+                    if retaken_size > 75000:
+                        console.print(f"[green]Successfully retaken screenshot for: {screenshot_result} ({retaken_size} bytes)[/green]")
+                        return screenshot_result
+                    else:
+                        console.print(f"[red]Retaken image {screenshot_result} is still too small. Retrying...[/red]")
+                except Exception as e:
+                    console.print(f"[red]Error capturing screenshot for {input_file} at {adjusted_time}: {e}[/red]")
+
+            console.print(f"[red]All retry attempts failed for {image}. Skipping.[/red]")
+            return None
+
+        # Retakes are independent captures, so they share the capture limit instead of running one by one
+        retaken = await asyncio.gather(*[run_limited(capture_semaphore, retake_screenshot(image)) for image in retake_images])
+        for image, screenshot_result in zip(retake_images, retaken):
+            if screenshot_result:
+                valid_results.append(screenshot_result)
             else:
-                valid_results.append(image)
+                remaining_retakes.append(image)
         if remaining_retakes:
             console.print(f"[red]The following images could not be retaken successfully: {remaining_retakes}[/red]")
 
     console.print(f"[green]Successfully captured {len(valid_results)} screenshots.")
 
 
-async def capture_dvd_screenshot(task):
+async def capture_dvd_screenshot(task, byte_offset=None):
+    """
+    Capture one DVD frame. With a byte_offset (a VOBU start from the IFO) reading starts right there
+    and the first frame is used, otherwise ffmpeg seeks to seek_time inside input_file.
+    """
     index, input_file, image, seek_time, meta, width, height, w_sar, h_sar = task
 
     try:
         loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-        media_info = MediaInfo.parse(input_file)
-        video_duration = next((track.duration for track in media_info.tracks if track.track_type == "Video"), None)
+        if byte_offset is not None:
+            ff = ffmpeg.input(input_file, skip_initial_bytes=byte_offset)
+        else:
+            media_info = parse_mediainfo(input_file, header_only=True).media_info
+            video_duration = next((track.duration for track in media_info.tracks if track.track_type == "Video"), None)
 
-        if video_duration and seek_time > video_duration:
-            seek_time = max(0, video_duration - 1)
+            if video_duration and seek_time > video_duration:
+                seek_time = max(0, video_duration - 1)
 
-        # Construct ffmpeg command
-        ff = ffmpeg.input(input_file, ss=seek_time)
+            # Construct ffmpeg command
+            ff = ffmpeg.input(input_file, ss=seek_time)
         if w_sar != 1 or h_sar != 1:
             ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
 
         cmd = ff.output(image, vframes=1, pix_fmt="rgb24").overwrite_output().global_args('-loglevel', loglevel, '-accurate_seek').compile()
 
-        # Run ffmpeg asynchronously
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-
-        stdout, stderr = await process.communicate()
+        returncode, stdout, stderr = await run_ffmpeg(cmd)
 
-        if process.returncode != 0:
+        if returncode != 0:
             console.print(f"[red]Error capturing screenshot for {input_file} at {seek_time}s:[/red]\n{stderr.decode()}")
             return (index, None)
 
@@ -658,7 +778,6 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         return
 
     loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
 
     if manual_frames:
         if meta['debug']:
@@ -666,7 +785,11 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         manual_frames = [int(frame) for frame in manual_frames.split(',')]
         ss_times = [frame / frame_rate for frame in manual_frames]
     else:
-        ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, exclusion_zone=500)
+        keyframes = await get_keyframes(path, length, debug=meta['debug']) if keyframe_index else None
+        if screenshot_precheck:
+            ss_times = await pick_screenshot_times(path, num_screens + 1, length, frame_rate, exclusion_zone=500, keyframes=keyframes, debug=meta['debug'])
+        else:
+            ss_times = await valid_ss_time([], num_screens + 1, length, frame_rate, exclusion_zone=500, keyframes=keyframes)
 
     if meta['debug']:
         console.print(f"[green]Final list of frames for screenshots: {ss_times}")
@@ -676,6 +799,8 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
     tone_map = meta.get('tone_map', False)
     if tone_map and "HDR" in meta['hdr']:
         hdr_tonemap = True
+        if tonemap_lut:
+            hdr_tonemap = await get_tonemap_lut(path, desat=10.0, debug=meta['debug']) or True
     else:
         hdr_tonemap = False
 
@@ -698,84 +823,99 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
     if meta['debug']:
         console.print(f"Using {num_workers} worker(s) for {num_capture} image(s)")
 
-    capture_tasks = []
+    captures = []
     for i in range(num_screens + 1):
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{i}.png")
         if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_screenshot(  # Direct async function call
-                    (i, path, ss_times[i], image_path, width, height, w_sar, h_sar, loglevel, meta.get('hdr_tonemap', False))
+            captures.append((i, ss_times[i], image_path))
+
+    with capture_scope() as capture_processes:
+        try:
+            results = []
+            if batch_screenshots and len(captures) > 1:
+                results = await capture_screenshots_batched(
+                    path, captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap
                 )
-            )
+                failed = {index for index, image in results if image is None}
+                results = [r for r in results if r[1] is not None]
+                captures = [capture for capture in captures if capture[0] in failed]
+                if captures:
+                    console.print(f"[yellow]Batched capture missed {len(captures)} screenshot(s), capturing them one at a time.")
 
-    try:
-        results = await asyncio.gather(*capture_tasks, return_exceptions=True)
-        capture_results = [r for r in results if isinstance(r, tuple) and len(r) == 2]
-        capture_results.sort(key=lambda x: x[0])
-        capture_results = [r[1] for r in capture_results if r[1] is not None]
+            capture_tasks = [
+                capture_screenshot(  # Direct async function call
+                    (i, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap)
+                )
+                for i, ss_time, image_path in captures
+            ]
+            results += await asyncio.gather(*capture_tasks, return_exceptions=True)
+            capture_results = [r for r in results if isinstance(r, tuple) and len(r) == 2]
+            capture_results.sort(key=lambda x: x[0])
+            capture_results = [r[1] for r in capture_results if r[1] is not None]
 
-    except KeyboardInterrupt:
-        console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        console.print("[red]All tasks cancelled. Exiting.[/red]")
-        gc.collect()
-        sys.exit(1)
-    except asyncio.CancelledError:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        gc.collect()
-        raise
-    except Exception as e:
-        console.print(f"[red]Error during screenshot capture: {e}[/red]")
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        gc.collect()
-        return []
-    finally:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        console.print("[yellow]All capture tasks finished. Cleaning up...[/yellow]")
+        except KeyboardInterrupt:
+            console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
+            kill_capture_processes(capture_processes)
+            console.print("[red]All tasks cancelled. Exiting.[/red]")
+            gc.collect()
+            sys.exit(1)
+        except asyncio.CancelledError:
+            kill_capture_processes(capture_processes)
+            gc.collect()
+            raise
+        except Exception as e:
+            console.print(f"[red]Error during screenshot capture: {e}[/red]")
+            kill_capture_processes(capture_processes)
+            gc.collect()
+            return []
+        finally:
+            console.print("[yellow]All capture tasks finished. Cleaning up...[/yellow]")
 
     console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
 
+    # Captures are still in memory here, they are only written once optimized
     if len(capture_results) > num_screens:
-        smallest = min(capture_results, key=os.path.getsize)
+        smallest = min(capture_results, key=image_buffers.size)
         if meta['debug']:
-            console.print(f"[yellow]Removing smallest image: {smallest} ({os.path.getsize(smallest)} bytes)")
-        os.remove(smallest)
+            console.print(f"[yellow]Removing smallest image: {smallest} ({image_buffers.size(smallest)} bytes)")
+        image_buffers.discard(smallest)
+        if os.path.exists(smallest):
+            os.remove(smallest)
         capture_results.remove(smallest)
 
     optimized_results = []
-    valid_images = [image for image in capture_results if os.path.exists(image)]
+    valid_images = [image for image in capture_results if image_buffers.exists(image)]
+    upload_host = meta.get('imghost') or (img_host[0] if img_host else None)
+    upload_profile = get_encoder_profile(upload_host)
     num_workers = min(task_limit, len(capture_results))
     console.print("[yellow]Now optimizing images...[/yellow]")
     if meta['debug']:
         console.print(f"Using {num_workers} worker(s) for {len(capture_results)} image(s)")
 
-    executor = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+    tasks = []
     try:
-        with executor:
-            # Start all tasks in parallel using worker_wrapper()
-            tasks = [asyncio.create_task(worker_wrapper(image, optimize_image_task, executor)) for image in valid_images]
-
-            # Wait for all tasks to complete
-            optimized_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Start all tasks in parallel using worker_wrapper()
+        tasks = [asyncio.create_task(worker_wrapper(image_buffers.get(image), optimize_image_data, upload_profile, label=image)) for image in valid_images]
+
+        # Wait for all tasks to complete
+        optimized_data = await asyncio.gather(*tasks, return_exceptions=True)
+        for image, data in zip(valid_images, optimized_data):
+            if isinstance(data, bytes):
+                image_buffers.save(image, data)
+            else:
+                # The capture only exists in memory, keep it unoptimized rather than losing it
+                console.print(f"[yellow]Optimizing {image} failed, keeping it unoptimized: {data}")
+                image_buffers.save(image)
+            optimized_results.append(image)
     except KeyboardInterrupt:
         console.print("\n[red]CTRL+C detected. Cancelling optimization tasks...[/red]")
-        await asyncio.sleep(0.1)
-        executor.shutdown(wait=True, cancel_futures=True)
-        await kill_all_child_processes()
+        image_pool.terminate()
         console.print("[red]All tasks cancelled. Exiting.[/red]")
         gc.collect()
         sys.exit(1)
     finally:
-        console.print("[yellow]Shutting down optimization workers...[/yellow]")
-        await asyncio.sleep(0.1)
-        executor.shutdown(wait=True, cancel_futures=True)
         for task in tasks:
             task.cancel()
-        await kill_all_child_processes()
         gc.collect()
 
     # Filter out failed results
@@ -790,20 +930,14 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
             continue
 
         retake = False
-        image_size = os.path.getsize(image_path)
+        image_size = image_buffers.size(image_path)
         if not manual_frames:
             if image_size <= 75000:
                 console.print(f"[yellow]Image {image_path} is incredibly small, retaking.")
                 retake = True
-            elif "imgbb" in img_host and image_size <= 31000000:
-                if meta['debug']:
-                    console.print(f"[green]Image {image_path} meets size requirements for imgbb.[/green]")
-            elif any(host in ["imgbox", "pixhost"] for host in img_host) and image_size <= 10000000:
-                if meta['debug']:
-                    console.print(f"[green]Image {image_path} meets size requirements for {img_host}.[/green]")
-            elif any(host in ["ptpimg", "lensdump", "ptscreens", "oeimg", "zipline"] for host in img_host):
+            elif image_size_fits_host(image_size, upload_host):
                 if meta['debug']:
-                    console.print(f"[green]Image {image_path} meets size requirements for {img_host}.[/green]")
+                    console.print(f"[green]Image {image_path} meets size requirements for {upload_host}.[/green]")
             else:
                 console.print("[red]Image size does not meet requirements for your image host, retaking.")
                 retake = True
@@ -815,28 +949,24 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
                 try:
                     index = int(image_path.rsplit('-', 1)[-1].split('.')[0])
 
+                    image_buffers.discard(image_path)
                     if os.path.exists(image_path):
                         os.remove(image_path)
 
                     random_time = random.uniform(0, length)
-                    screenshot_response = await capture_screenshot(
+                    capture_result = await capture_screenshot(
                         (index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap)
                     )
+                    screenshot_response = capture_result[1] if isinstance(capture_result, tuple) else None
 
-                    if not os.path.exists(screenshot_response):
-                        raise FileNotFoundError(f"Screenshot {screenshot_response} was not created successfully.")
+                    if not screenshot_response or not image_buffers.exists(screenshot_response):
+                        raise FileNotFoundError(f"Screenshot {image_path} was not created successfully.")
 
-                    await optimize_image_task(screenshot_response)
-                    new_size = os.path.getsize(screenshot_response)
+                    image_buffers.save(screenshot_response, await image_pool.run(optimize_image_data, image_buffers.get(screenshot_response), upload_profile))
+                    new_size = image_buffers.size(screenshot_response)
                     valid_image = False
 
-                    if "imgbb" in img_host and 75000 < new_size <= 31000000:
-                        console.print(f"[green]Successfully retaken screenshot for: {screenshot_response} ({new_size} bytes)[/green]")
-                        valid_image = True
-                    elif 75000 < new_size <= 10000000 and any(host in ["imgbox", "pixhost"] for host in img_host):
-                        console.print(f"[green]Successfully retaken screenshot for: {screenshot_response} ({new_size} bytes)[/green]")
-                        valid_image = True
-                    elif new_size > 75000 and any(host in ["ptpimg", "lensdump", "ptscreens", "oeimg"] for host in img_host):
+                    if new_size > 75000 and image_size_fits_host(new_size, upload_host):
                         console.print(f"[green]Successfully retaken screenshot for: {screenshot_response} ({new_size} bytes)[/green]")
                         valid_image = True
 
@@ -844,7 +974,7 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
                         valid_results.append(screenshot_response)
                         break  # Exit retry loop on success
                     else:
-                        console.print(f"[red]Retaken image {screenshot_response} does not meet the size requirements for {img_host}. Retrying...[/red]")
+                        console.print(f"[red]Retaken image {screenshot_response} does not meet the size requirements for {upload_host}. Retrying...[/red]")
 
                 except asyncio.CancelledError:
                     gc.collect()
@@ -883,7 +1013,71 @@ async def screenshots(path, filename, folder_id, base_dir, meta, num_screens=Non
         console.print(f"Screenshots processed in {finish_time - start_time:.4f} seconds")
 
 
+def screenshot_filters(ff, width, height, w_sar, h_sar, hdr_tonemap):
+    """
+    Apply the aspect ratio scaling and optional HDR tonemap used for every screenshot.
+
+    hdr_tonemap is False, True for the zscale/tonemap chain, or the path of a LUT from get_tonemap_lut.
+    """
+    if w_sar != 1 or h_sar != 1:
+        ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
+
+    if isinstance(hdr_tonemap, str):
+        ff = lut_tonemap(ff, hdr_tonemap)
+    elif hdr_tonemap:
+        ff = tonemap_chain(ff, desat=10.0)
+    return ff
+
+
+async def capture_screenshots_batched(path, captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap):
+    """
+    Capture several screenshots with a single ffmpeg process.
+
+    captures is a list of (index, ss_time, image_path). Each timestamp is its own fast input seek
+    with its own decoder, trimmed to one frame. The frames are concatenated and go through a single
+    scale/tonemap chain into one PNG stream on stdout, so the ffmpeg process, the filter chain and
+    the PNG encoder are set up once instead of once per image.
+    The PNGs are kept in image_buffers under their image_path, nothing is written to disk.
+    Returns [(index, image_path or None)], None marking images the caller should capture with
+    capture_screenshot instead.
+    """
+    if width <= 0 or height <= 0 or any(ss_time < 0 for _, ss_time, _ in captures):
+        return [(index, None) for index, _, _ in captures]
+
+    streams = []
+    for index, ss_time, image_path in captures:
+        streams.append(ffmpeg.input(path, ss=ss_time)['v:0'].filter('trim', end_frame=1).filter('setpts', 'PTS-STARTPTS'))
+    command = (
+        screenshot_filters(ffmpeg.concat(*streams, v=1, a=0), width, height, w_sar, h_sar, hdr_tonemap)
+        .output('pipe:', format='image2pipe', vcodec='png', pix_fmt="rgb24", vsync=0)
+        .global_args('-loglevel', loglevel)
+    )
+
+    try:
+        returncode, stdout, stderr = await run_ffmpeg(command.compile())
+    except OSError as e:
+        console.print(f"[red]Could not start ffmpeg for batched capture: {e}")
+        return [(index, None) for index, _, _ in captures]
+
+    images = []
+    if returncode != 0:
+        console.print(f"[yellow]FFmpeg error in batched capture: {stderr.decode(errors='replace').strip()[-500:]}")
+    else:
+        try:
+            images = split_png_stream(stdout)
+        except ValueError as e:
+            console.print(f"[yellow]Could not split batched capture output: {e}")
+
+    # Frames only map back to timestamps when every input produced exactly one
+    if len(images) != len(captures):
+        return [(index, None) for index, _, _ in captures]
+    for (index, _, image_path), image in zip(captures, images):
+        image_buffers.put(image_path, image)
+    return [(index, image_path) for index, _, image_path in captures]
+
+
 async def capture_screenshot(args):
+    """Capture one screenshot into image_buffers under image_path, returns (index, image_path or None)."""
     index, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap = args
 
     try:
@@ -893,40 +1087,18 @@ async def capture_screenshot(args):
         if ss_time < 0:
             return f"Error: Invalid timestamp {ss_time}"
 
-        ff = ffmpeg.input(path, ss=ss_time)
-        if w_sar != 1 or h_sar != 1:
-            ff = ff.filter('scale', int(round(width * w_sar)), int(round(height * h_sar)))
-
-        if hdr_tonemap:
-            ff = (
-                ff
-                .filter('zscale', transfer='linear')
-                .filter('tonemap', tonemap='mobius', desat=10.0)
-                .filter('zscale', transfer='bt709')
-                .filter('format', 'rgb24')
-            )
+        ff = screenshot_filters(ffmpeg.input(path, ss=ss_time), width, height, w_sar, h_sar, hdr_tonemap)
 
         command = (
             ff
-            .output(image_path, vframes=1, pix_fmt="rgb24")
-            .overwrite_output()
+            .output('pipe:', vframes=1, format='image2pipe', vcodec='png', pix_fmt="rgb24")
             .global_args('-loglevel', loglevel)
         )
 
-        process = await asyncio.create_subprocess_exec(
-            *command.compile(),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-
-        # Ensure process completes and doesn't leak
-        try:
-            stdout, stderr = await process.communicate()
-        except asyncio.CancelledError:
-            process.kill()
-            raise
+        returncode, stdout, stderr = await run_ffmpeg(command.compile())
 
-        if process.returncode == 0:
+        if returncode == 0 and stdout:
+            image_buffers.put(image_path, stdout)
             return (index, image_path)
         else:
             console.print(f"[red]FFmpeg error capturing screenshot: {stderr.decode()}")
@@ -935,7 +1107,14 @@ async def capture_screenshot(args):
         return f"Error: {str(e)}"
 
 
-async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zone=None):
+async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zone=None, keyframes=None):
+    """
+    Pick one timestamp per section, keeping every pick out of the others' exclusion zone.
+
+    With a keyframe index, picks are drawn from the keyframes inside each section so ffmpeg
+    does not have to decode forward from an earlier keyframe. Sections without a usable
+    keyframe fall back to a random frame.
+    """
     total_screens = num_screens + 1
 
     if exclusion_zone is None:
@@ -951,6 +1130,17 @@ async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zon
         start_frame = round(section_starts[section_index] * frame_rate)
         end_frame = round((section_starts[section_index] + section_size) * frame_rate)
 
+        if keyframes:
+            section_end = section_starts[section_index] + section_size
+            candidates = [
+                keyframe for keyframe in keyframes
+                if section_starts[section_index] <= keyframe <= section_end
+                and all(abs(keyframe - existing_time) > exclusion_zone for existing_time in result_times)
+            ]
+            if candidates:
+                result_times.append(random.choice(candidates))
+                continue
+
         while not valid_time and attempts < 50:
             attempts += 1
             frame = random.randint(start_frame, end_frame)
@@ -969,36 +1159,209 @@ async def valid_ss_time(ss_times, num_screens, length, frame_rate, exclusion_zon
     return result_times
 
 
-async def worker_wrapper(image, optimize_image_task, executor):
-    """ Async wrapper to run optimize_image_task in a separate process """
-    loop = asyncio.get_running_loop()
+# Size of the luma thumbnails used to judge candidate frames
+precheck_width = 64
+precheck_height = 36
+
+
+async def sample_frame_luma(path, timestamps, loglevel='quiet'):
+    """
+    Decode a tiny luma plane for every timestamp with one ffmpeg process.
+
+    Returns a list of precheck_width x precheck_height grayscale bytes per timestamp, or None if
+    ffmpeg did not produce exactly one frame for each of them.
+    """
+    streams = []
+    for timestamp in timestamps:
+        streams.append(
+            ffmpeg.input(path, ss=timestamp)['v:0']
+            .filter('scale', precheck_width, precheck_height)
+            .filter('format', 'gray')
+            .filter('trim', end_frame=1)
+            .filter('setpts', 'PTS-STARTPTS')
+        )
+    command = (
+        ffmpeg.concat(*streams, v=1, a=0)
+        .output('pipe:', format='rawvideo', pix_fmt='gray', vsync=0)
+        .global_args('-loglevel', loglevel)
+    )
     try:
-        return await loop.run_in_executor(executor, optimize_image_task, image)
+        returncode, stdout, stderr = await run_ffmpeg(command.compile())
+    except OSError as e:
+        console.print(f"[yellow]Could not start ffmpeg for frame precheck: {e}")
+        return None
+
+    frame_size = precheck_width * precheck_height
+    if returncode != 0 or len(stdout) != frame_size * len(timestamps):
+        return None
+    return [stdout[i * frame_size:(i + 1) * frame_size] for i in range(len(timestamps))]
+
+
+def luma_score(pixels):
+    """
+    Score a luma thumbnail, higher is more likely to make a useful screenshot.
+
+    Uses the entropy of a 16 bin histogram weighted by the share of pixels that are not near black,
+    so black frames, fades and credits (text on black) score close to 0.
+    """
+    histogram = [0] * 16
+    dark = 0
+    for pixel in pixels:
+        histogram[pixel >> 4] += 1
+        if pixel < 32:
+            dark += 1
+    total = len(pixels)
+    entropy = sum((count / total) * math.log2(total / count) for count in histogram if count)
+    return entropy * (1 - dark / total)
+
+
+async def pick_screenshot_times(path, num_screens, length, frame_rate, exclusion_zone=None, keyframes=None, candidates=3, debug=False):
+    """
+    Draw several candidate timestamps for each screenshot and keep the best looking one.
+
+    Each round of candidates comes from valid_ss_time, so picks stay inside their section, and
+    is judged from tiny luma thumbnails decoded in one ffmpeg process per round. Picks keep out of
+    each other's exclusion zone where possible. Falls back to the first round if nothing could be sampled.
+    """
+    rounds = [await valid_ss_time([], num_screens, length, frame_rate, exclusion_zone, keyframes) for _ in range(candidates)]
+    samples = await asyncio.gather(*[sample_frame_luma(path, times) for times in rounds])
+    if all(sample is None for sample in samples):
+        if debug:
+            console.print("[yellow]Frame precheck failed, using unchecked timestamps")
+        return rounds[0]
+
+    if exclusion_zone is None:
+        exclusion_zone = max(length / (3 * (num_screens + 1)), length / 15)
+
+    picks = []
+    for position in range(len(rounds[0])):
+        options = []
+        for times, lumas in zip(rounds, samples):
+            score = luma_score(lumas[position]) if lumas is not None else -1
+            options.append((score, times[position]))
+        options.sort(reverse=True)
+        spaced = [option for option in options if all(abs(option[1] - pick) > exclusion_zone for pick in picks)]
+        score, pick = (spaced or options)[0]
+        if debug:
+            console.print(f"[cyan]Screenshot {position}: picked {pick:.2f}s (score {score:.2f}) from {[round(option[0], 2) for option in options]}")
+        picks.append(pick)
+
+    return sorted(picks)
+
+
+async def worker_wrapper(image, optimize_image_task, *args, label=None):
+    """ Async wrapper to run optimize_image_task(image, *args) in the shared image pool, label names image in messages """
+    label = label or image
+    try:
+        return await image_pool.run(optimize_image_task, image, *args)
     except KeyboardInterrupt:
-        console.print(f"[red][{time.strftime('%X')}] Worker interrupted while processing {image}[/red]")
+        console.print(f"[red][{time.strftime('%X')}] Worker interrupted while processing {label}[/red]")
         gc.collect()
         return None
     except Exception as e:
-        console.print(f"[red][{time.strftime('%X')}] Worker error on {image}: {e}[/red]")
+        console.print(f"[red][{time.strftime('%X')}] Worker error on {label}: {e}[/red]")
         gc.collect()
         return f"Error: {e}"
     finally:
         gc.collect()
 
 
-async def kill_all_child_processes():
-    """Ensures all child processes (e.g., ProcessPoolExecutor workers) are terminated."""
-    current_process = psutil.Process()
-    children = current_process.children(recursive=True)  # Get child processes once
+def optimize_image_data(data, profile=None):
+    """
+    Optimizes PNG bytes with oxipng at the level of the upload host's profile, returns the optimized bytes.
+
+    Hosts that take another format get the capture encoded at upload time, so their PNG is left as is.
+    """
+    profile = profile or {}
+    if not optimize_images or profile.get('format', 'png') != 'png':
+        return data
+    return encode_png(data, profile)
+
+
+# Output profile per image host: format, compression level or effort, and the largest file the host takes.
+# Screenshots are always captured and stored as PNGs, optimized for PNG hosts, other formats are encoded at upload time.
+default_encoder_profiles = {
+    'imgbb': {'format': 'png', 'max_size': 31000000},
+    'imgbox': {'format': 'png', 'max_size': 10000000},
+    'pixhost': {'format': 'png', 'max_size': 10000000},
+}
+encoder_profiles = dict(default_encoder_profiles)
+for profile_host, profile in config['DEFAULT'].get('image_encoder_profiles', {}).items():
+    encoder_profiles[profile_host.lower()] = {**default_encoder_profiles.get(profile_host.lower(), {}), **profile}
+
+
+def get_encoder_profile(host):
+    profile = {'format': 'png', **encoder_profiles.get(str(host).lower(), {})}
+    profile['format'] = str(profile['format']).lower()
+    return profile
+
 
-    for child in children:
-        console.print(f"[red]Killing stuck worker process: {child.pid}[/red]")
-        child.terminate()
+def image_size_fits_host(size, host):
+    """Whether a stored PNG of size bytes can be uploaded to host, formats other than PNG shrink at upload."""
+    profile = get_encoder_profile(host)
+    return profile['format'] != 'png' or not profile.get('max_size') or size <= int(profile['max_size'])
 
-    gone, still_alive = psutil.wait_procs(children, timeout=3)  # Wait for termination
-    for process in still_alive:
-        console.print(f"[red]Force killing stubborn process: {process.pid}[/red]")
-        process.kill()
+
+def encode_png(data, profile):
+    os.environ['RAYON_NUM_THREADS'] = threads
+    level = int(profile.get('level', 6 if len(data) >= 16000000 else 2))
+    return oxipng.optimize_from_memory(data, level=level)
+
+
+def encode_webp(data, profile):
+    from PIL import Image
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(output, 'WEBP', lossless=True, quality=int(profile.get('level', 75)), method=int(profile.get('effort', 4)))
+    return output.getvalue()
+
+
+def encode_jxl(data, profile):
+    from PIL import Image
+    import pillow_jxl  # noqa: F401 registers the JXL plugin
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(output, 'JXL', lossless=True, effort=int(profile.get('effort', 7)))
+    return output.getvalue()
+
+
+# Lossless encoders by profile format, as (function, file extension)
+image_encoders = {
+    'png': (encode_png, 'png'),
+    'webp': (encode_webp, 'webp'),
+    'jxl': (encode_jxl, 'jxl'),
+}
+
+
+def encode_image(data, profile):
+    """Encode PNG bytes for an output profile, returns (bytes, extension). Runs in the image pool."""
+    encoder, extension = image_encoders[profile['format']]
+    return encoder(data, profile), extension
+
+
+async def encode_for_host(image, host):
+    """
+    Bytes and file name to upload the stored screenshot image as to host.
+
+    Stored screenshots are PNGs, already optimized for PNG hosts, so those go out untouched. Any other format is
+    encoded in the image pool, falling back to the PNG if the encoder is unavailable or fails.
+    Raises ValueError when the result is over the host's max_size.
+    """
+    data = image_buffers.get(image)
+    filename = os.path.basename(image)
+    profile = get_encoder_profile(host)
+    if profile['format'] != 'png':
+        if profile['format'] not in image_encoders:
+            console.print(f"[yellow]Unknown image format {profile['format']} for {host}, uploading PNG")
+        else:
+            try:
+                data, extension = await image_pool.run(encode_image, data, profile)
+                filename = f"{os.path.splitext(filename)[0]}.{extension}"
+            except Exception as e:
+                console.print(f"[yellow]Encoding {filename} as {profile['format']} failed, uploading PNG: {e}")
+    if profile.get('max_size') and len(data) > int(profile['max_size']):
+        raise ValueError(f"{filename} is {len(data)} bytes, over the {profile['max_size']} byte limit of {host}")
+    return filename, data
 
 
 def optimize_image_task(image):
@@ -1027,3 +1390,70 @@ def optimize_image_task(image):
         console.print(f"[red]{error_message}[/red]")
         console.print(traceback.format_exc())  # Print detailed traceback
         return None
+
+
+async def benchmark_capture(path, num_screens=6, hdr_tonemap=False):
+    """Capture the same timestamps per frame and batched, reporting wall and CPU time of both."""
+    import tempfile
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    def child_cpu_time():
+        if resource is None:
+            return None
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+    mi = parse_mediainfo(path).data
+    video_track = next(track for track in mi['media']['track'] if track['@type'] == "Video")
+    length = float(video_track.get('Duration', mi['media']['track'][0]['Duration']))
+    width = float(video_track['Width'])
+    height = float(video_track['Height'])
+    frame_rate = float(video_track.get('FrameRate', 24.0))
+    ss_times = await valid_ss_time([], num_screens, length, frame_rate, exclusion_zone=500)
+
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mode in ("per frame", "batched"):
+            captures = [(i, ss_time, os.path.join(tmp_dir, f"{mode[0]}-{i}.png")) for i, ss_time in enumerate(ss_times)]
+            cpu_start = child_cpu_time()
+            start = time.time()
+            if mode == "batched":
+                results = await capture_screenshots_batched(path, captures, width, height, 1, 1, 'quiet', hdr_tonemap)
+            else:
+                results = await asyncio.gather(*[
+                    capture_screenshot((i, path, ss_time, image_path, width, height, 1, 1, 'quiet', hdr_tonemap))
+                    for i, ss_time, image_path in captures
+                ])
+            wall = time.time() - start
+            cpu = child_cpu_time() - cpu_start if cpu_start is not None else None
+            captured = len([r for r in results if isinstance(r, tuple) and r[1] is not None])
+            timings[mode] = wall
+            cpu_text = f", {cpu:.2f}s CPU" if cpu is not None else ""
+            console.print(f"{mode}: {captured}/{len(captures)} images in {wall:.2f}s wall{cpu_text}")
+
+    console.print(f"[green]Batched capture is {timings['per frame'] / timings['batched']:.2f}x the speed of per frame capture")
+
+    if hdr_tonemap:
+        lut_path = await get_tonemap_lut(path, desat=10.0, debug=True)
+        if not lut_path:
+            return
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            captures = [(i, ss_time, os.path.join(tmp_dir, f"l-{i}.png")) for i, ss_time in enumerate(ss_times)]
+            start = time.time()
+            await capture_screenshots_batched(path, captures, width, height, 1, 1, 'quiet', lut_path)
+            timings['lut'] = time.time() - start
+        console.print(f"batched with tonemap LUT: {timings['lut']:.2f}s wall, {timings['batched'] / timings['lut']:.2f}x the speed of the zscale chain")
+        for ss_time, mean_error, max_error in await compare_tonemap(path, ss_times, lut_path, desat=10.0):
+            console.print(f"LUT vs zscale at {ss_time:.2f}s: mean error {mean_error:.2f}, max error {max_error} (8 bit levels)")
+
+
+if __name__ == "__main__":
+    # python -m src.takescreens <video> [screens] [--tonemap]
+    if len(sys.argv) < 2:
+        console.print("Usage: python -m src.takescreens <video> [screens] [--tonemap]")
+        sys.exit(1)
+    benchmark_screens = int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[2].isdigit() else 6
+    asyncio.run(benchmark_capture(sys.argv[1], benchmark_screens, hdr_tonemap="--tonemap" in sys.argv))
@@ -1,6 +1,8 @@
 from src.console import console
 from src.imdb import get_imdb_aka_api, get_imdb_info_api
 from src.args import Args
+from src.metacache import metadata_cache
+from src.httpclient import http_service
 from data.config import config
 import tmdbsimple as tmdb
 import re
@@ -19,7 +21,8 @@ async def get_tmdb_from_imdb(meta, filename):
     if str(imdb_id)[:2].lower() != "tt":
         imdb_id = f"tt{imdb_id:07d}"
     find = tmdb.Find(id=imdb_id)
-    info = find.info(external_source="imdb_id")
+    info = await metadata_cache.fetch('tmdb', imdb_id, 'find/imdb_id', lambda: find.info(external_source="imdb_id"), meta,
+                                      should_cache=lambda r: bool(r.get('movie_results') or r.get('tv_results')))
     if len(info['movie_results']) >= 1:
         meta['category'] = "MOVIE"
         meta['tmdb_id'] = info['movie_results'][0]['id']
@@ -37,7 +40,8 @@ async def get_tmdb_from_imdb(meta, filename):
         tvdb_id = meta.get('tvdb_id')
         if tvdb_id:
             find_tvdb = tmdb.Find(id=str(tvdb_id))
-            info_tvdb = find_tvdb.info(external_source="tvdb_id")
+            info_tvdb = await metadata_cache.fetch('tmdb', tvdb_id, 'find/tvdb_id', lambda: find_tvdb.info(external_source="tvdb_id"), meta,
+                                                   should_cache=lambda r: bool(r.get('tv_results')))
             if meta['debug']:
                 console.print("TVDB INFO", info_tvdb)
 
@@ -75,13 +79,9 @@ async def get_tmdb_id(filename, search_year, meta, category, untouched_filename=
     search = tmdb.Search()
     try:
         # Primary search attempt
-        if category == "MOVIE":
-            search.movie(query=filename, year=search_year)
-        elif category == "TV":
-            search.tv(query=filename, first_air_date_year=search_year)
-
-        if search.results:
-            meta['tmdb_id'] = search.results[0]['id']
+        results = await search_tmdb(search, category, filename, search_year, meta)
+        if results:
+            meta['tmdb_id'] = results[0]['id']
             return meta  # Successful match, return immediately
 
     except Exception as e:
@@ -90,13 +90,9 @@ async def get_tmdb_id(filename, search_year, meta, category, untouched_filename=
     # Secondary attempt: Try searching without the year
     console.print("[yellow]Retrying without year...[/yellow]")
     try:
-        if category == "MOVIE":
-            search.movie(query=filename)
-        elif category == "TV":
-            search.tv(query=filename)
-
-        if search.results:
-            meta['tmdb_id'] = search.results[0]['id']
+        results = await search_tmdb(search, category, filename, None, meta)
+        if results:
+            meta['tmdb_id'] = results[0]['id']
             return meta  # Successful match, return immediately
 
     except Exception as e:
@@ -131,6 +127,36 @@ async def get_tmdb_id(filename, search_year, meta, category, untouched_filename=
     return meta
 
 
+async def search_tmdb(search, category, query, year, meta):
+    if category == "MOVIE":
+        loader = (lambda: search.movie(query=query, year=year)) if year else (lambda: search.movie(query=query))
+    elif category == "TV":
+        loader = (lambda: search.tv(query=query, first_air_date_year=year)) if year else (lambda: search.tv(query=query))
+    else:
+        return []
+    response = await metadata_cache.fetch('tmdb', f"{query}|{year or ''}", f"search/{category.lower()}", loader, meta,
+                                          should_cache=lambda r: bool(r.get('results')))
+    return response.get('results', []) if response else []
+
+
+async def get_tmdb_details(category, tmdb_id, meta):
+    """Fetch details plus all the sub resources tmdb_other_meta needs in a single request."""
+    kind = 'movie' if category == "MOVIE" else 'tv'
+
+    async def fetch_details():
+        response = await http_service.get(
+            f"https://api.themoviedb.org/3/{kind}/{tmdb_id}",
+            params={
+                'api_key': config['DEFAULT']['tmdb_api'],
+                'append_to_response': 'alternative_titles,external_ids,videos,keywords,credits',
+            }
+        )
+        response.raise_for_status()
+        return response.json()
+
+    return await metadata_cache.fetch('tmdb', f"{kind}/{tmdb_id}", 'details', fetch_details, meta)
+
+
 async def tmdb_other_meta(meta):
     if meta['tmdb_id'] == 0:
         try:
@@ -147,9 +173,17 @@ async def tmdb_other_meta(meta):
                 console.print("[bold red]Unable to find tmdb entry")
                 return meta
     if meta['category'] == "MOVIE":
-        movie = tmdb.Movies(meta['tmdb_id'])
-        response = movie.info()
-        alternate = movie.alternative_titles()
+        # The IMDb lookup does not depend on TMDb when the id is already known, so run it alongside
+        aka_task = None
+        if int(meta.get('imdb_id', 0)) != 0:
+            aka_task = asyncio.create_task(get_imdb_aka_api(int(meta['imdb_id']), meta))
+        try:
+            response = await get_tmdb_details("MOVIE", meta['tmdb_id'], meta)
+        except Exception:
+            if aka_task is not None:
+                aka_task.cancel()
+            raise
+        alternate = response.get('alternative_titles', {})
         if meta['debug']:
             console.print("ALTERNATE", alternate)
         if meta['debug']:
@@ -160,7 +194,7 @@ async def tmdb_other_meta(meta):
         else:
             console.print('[yellow]TMDB does not have a release date, using year from filename instead (if it exists)')
             meta['year'] = meta['search_year']
-        external = movie.external_ids()
+        external = response.get('external_ids', {})
         if meta.get('imdb_id', 0) == 0:
             imdb_id = external.get('imdb_id', None)
 
@@ -184,7 +218,7 @@ async def tmdb_other_meta(meta):
             if meta['tvdb_id'] in ["", " ", "None", None]:
                 meta['tvdb_id'] = 0
         try:
-            videos = movie.videos()
+            videos = response.get('videos', {})
             for each in videos.get('results', []):
                 if each.get('site', "") == 'YouTube' and each.get('type', "") == "Trailer":
                     meta['youtube'] = f"https://www.youtube.com/watch?v={each.get('key')}"
@@ -192,16 +226,19 @@ async def tmdb_other_meta(meta):
         except Exception:
             console.print('[yellow]Unable to grab videos from TMDb.')
 
-        meta['aka'], original_language = await get_imdb_aka_api(meta['imdb_id'], meta)
+        if aka_task is not None:
+            meta['aka'], original_language = await aka_task
+        else:
+            meta['aka'], original_language = await get_imdb_aka_api(meta['imdb_id'], meta)
         if original_language is not None:
             meta['original_language'] = original_language
         else:
             meta['original_language'] = response['original_language']
 
         meta['original_title'] = response.get('original_title', meta['title'])
-        meta['keywords'] = await get_keywords(movie)
+        meta['keywords'] = await get_keywords(response.get('keywords'))
         meta['genres'] = await get_genres(response)
-        meta['tmdb_directors'] = await get_directors(movie)
+        meta['tmdb_directors'] = await get_directors(response.get('credits'))
         if meta.get('anime', False) is False:
             meta['mal_id'], meta['aka'], meta['anime'], meta['demographic'] = await get_anime(response, meta)
         if meta.get('mal_manual') != 0:
@@ -212,9 +249,17 @@ async def tmdb_other_meta(meta):
         meta['tmdb_type'] = 'Movie'
         meta['runtime'] = response.get('episode_run_time', 60)
     elif meta['category'] == "TV":
-        tv = tmdb.TV(meta['tmdb_id'])
-        response = tv.info()
-        alternate = tv.alternative_titles()
+        # The IMDb lookup does not depend on TMDb when the id is already known, so run it alongside
+        aka_task = None
+        if int(meta.get('imdb_id', 0)) != 0:
+            aka_task = asyncio.create_task(get_imdb_aka_api(int(meta['imdb_id']), meta))
+        try:
+            response = await get_tmdb_details("TV", meta['tmdb_id'], meta)
+        except Exception:
+            if aka_task is not None:
+                aka_task.cancel()
+            raise
+        alternate = response.get('alternative_titles', {})
         if meta['debug']:
             console.print("ALTERNATE", alternate)
         if meta['debug']:
@@ -225,7 +270,7 @@ async def tmdb_other_meta(meta):
         else:
             console.print('[yellow]TMDB does not have a release date, using year from filename instead (if it exists)')
             meta['year'] = meta['search_year']
-        external = tv.external_ids()
+        external = response.get('external_ids', {})
         if meta.get('imdb_id', 0) == 0:
             imdb_id = external.get('imdb_id', None)
 
@@ -249,7 +294,7 @@ async def tmdb_other_meta(meta):
             if meta['tvdb_id'] in ["", " ", "None", None]:
                 meta['tvdb_id'] = 0
         try:
-            videos = tv.videos()
+            videos = response.get('videos', {})
             for each in videos.get('results', []):
                 if each.get('site', "") == 'YouTube' and each.get('type', "") == "Trailer":
                     meta['youtube'] = f"https://www.youtube.com/watch?v={each.get('key')}"
@@ -258,15 +303,18 @@ async def tmdb_other_meta(meta):
             console.print('[yellow]Unable to grab videos from TMDb.')
 
         # meta['aka'] = f" AKA {response['original_name']}"
-        meta['aka'], original_language = await get_imdb_aka_api(meta['imdb_id'], meta)
+        if aka_task is not None:
+            meta['aka'], original_language = await aka_task
+        else:
+            meta['aka'], original_language = await get_imdb_aka_api(meta['imdb_id'], meta)
         if original_language is not None:
             meta['original_language'] = original_language
         else:
             meta['original_language'] = response['original_language']
         meta['original_title'] = response.get('original_name', meta['title'])
-        meta['keywords'] = await get_keywords(tv)
+        meta['keywords'] = await get_keywords(response.get('keywords'))
         meta['genres'] = await get_genres(response)
-        meta['tmdb_directors'] = await get_directors(tv)
+        meta['tmdb_directors'] = await get_directors(response.get('credits'))
         meta['mal_id'], meta['aka'], meta['anime'], meta['demographic'] = await get_anime(response, meta)
         if meta.get('mal_manual') != 0:
             meta['mal_id'] = meta['mal_manual']
@@ -290,9 +338,8 @@ async def tmdb_other_meta(meta):
     return meta
 
 
-async def get_keywords(tmdb_info):
-    if tmdb_info is not None:
-        tmdb_keywords = tmdb_info.keywords()
+async def get_keywords(tmdb_keywords):
+    if tmdb_keywords is not None:
         if tmdb_keywords.get('keywords') is not None:
             keywords = [f"{keyword['name'].replace(',', ' ')}" for keyword in tmdb_keywords.get('keywords')]
         elif tmdb_keywords.get('results') is not None:
@@ -312,9 +359,8 @@ async def get_genres(tmdb_info):
         return ''
 
 
-async def get_directors(tmdb_info):
-    if tmdb_info is not None:
-        tmdb_credits = tmdb_info.credits()
+async def get_directors(tmdb_credits):
+    if tmdb_credits is not None:
         directors = []
         if tmdb_credits.get('cast', []) != []:
             for each in tmdb_credits['cast']:
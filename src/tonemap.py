@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+import array
+import asyncio
+import hashlib
+from fractions import Fraction
+import ffmpeg
+from src.console import console
+
+tonemap_cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'tonemap')
+
+# Hald CLUT level the LUTs are rendered from, giving a cube of level ** 2 points per axis
+hald_level = 8
+
+
+def tonemap_chain(ff, desat, peak=None, pix_fmt='rgb24'):
+    """The zscale/tonemap chain, used for screenshots without a LUT and as the reference LUTs are rendered from."""
+    tonemap_args = {'tonemap': 'mobius', 'desat': desat}
+    if peak:
+        tonemap_args['peak'] = peak
+    return (
+        ff
+        .filter('zscale', transfer='linear')
+        .filter('tonemap', **tonemap_args)
+        .filter('zscale', transfer='bt709')
+        .filter('format', pix_fmt)
+    )
+
+
+def lut_tonemap(ff, lut_path):
+    """Tonemap with a LUT from get_tonemap_lut, a cheap RGB conversion and one table lookup per pixel."""
+    return (
+        ff
+        .filter('scale', in_color_matrix='bt2020', out_range='pc')
+        .filter('format', 'rgb48le')
+        .filter('lut3d', file=lut_path, interp='tetrahedral')
+        .filter('format', 'rgb24')
+    )
+
+
+async def _run(command):
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode(errors='replace').strip())
+    return stdout
+
+
+async def probe_hdr_metadata(path):
+    """
+    Transfer, primaries and tonemap peak of the first video frame of path, or None if it is not PQ or HLG.
+
+    The peak follows ffmpeg's tonemap filter: MaxCLL, then the mastering display maximum, both in
+    units of 100 nits, and 10 when the frame has neither (the chain hands tonemap linear light).
+    """
+    stdout = await _run([
+        'ffprobe', '-v', 'error', '-select_streams', 'v:0', '-read_intervals', '%+#1',
+        '-show_frames', '-of', 'json', path
+    ])
+    frames = json.loads(stdout).get('frames', [])
+    if not frames:
+        return None
+    frame = frames[0]
+    transfer = frame.get('color_transfer')
+    if transfer not in ('smpte2084', 'arib-std-b67'):
+        return None
+
+    peak = 0
+    for side_data in frame.get('side_data_list', []):
+        if side_data.get('side_data_type') == 'Content light level metadata':
+            peak = float(side_data.get('max_content', 0)) / 100
+    if not peak:
+        for side_data in frame.get('side_data_list', []):
+            if side_data.get('side_data_type') == 'Mastering display metadata' and side_data.get('max_luminance'):
+                peak = float(Fraction(side_data['max_luminance'])) / 100
+    return {
+        'transfer': transfer,
+        'primaries': frame.get('color_primaries') or 'bt2020',
+        'peak': round(peak or 10.0, 4),
+    }
+
+
+async def build_tonemap_lut(lut_path, metadata, desat):
+    """Render an identity Hald CLUT tagged with metadata through tonemap_chain and save it as a .cube file."""
+    size = hald_level ** 2
+    side = hald_level ** 3
+    stream = (
+        ffmpeg.input(f"haldclutsrc=level={hald_level}", f='lavfi')
+        .filter('setparams', color_trc=metadata['transfer'], color_primaries=metadata['primaries'], colorspace='gbr', range='pc')
+    )
+    command = (
+        tonemap_chain(stream, desat, peak=metadata['peak'], pix_fmt='rgb48le')
+        .output('pipe:', format='rawvideo', pix_fmt='rgb48le', vframes=1)
+        .global_args('-loglevel', 'error')
+        .compile()
+    )
+    stdout = await _run(command)
+    if len(stdout) != side * side * 6:
+        raise RuntimeError(f"Expected a {side}x{side} Hald CLUT, got {len(stdout)} bytes")
+
+    values = array.array('H')
+    values.frombytes(stdout)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    # Hald CLUT pixels are in the same order as .cube entries, red changing fastest
+    lines = [f"TITLE \"mobius tonemap {metadata['transfer']} peak {metadata['peak']}\"", f"LUT_3D_SIZE {size}"]
+    for i in range(0, len(values), 3):
+        lines.append(f"{values[i] / 65535:.6f} {values[i + 1] / 65535:.6f} {values[i + 2] / 65535:.6f}")
+
+    os.makedirs(tonemap_cache_dir, exist_ok=True)
+    tmp_path = f"{lut_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, lut_path)
+
+
+async def get_tonemap_lut(path, desat, debug=False):
+    """
+    Path of the tonemap LUT for the HDR metadata of path, rendered once per metadata set and cached.
+
+    Returns None when path is not PQ/HLG or the LUT can not be built, callers then use tonemap_chain.
+    """
+    try:
+        metadata = await probe_hdr_metadata(path)
+        if not metadata:
+            return None
+        key = json.dumps({'level': hald_level, 'desat': desat, **metadata}, sort_keys=True)
+        lut_path = os.path.join(tonemap_cache_dir, f"{hashlib.sha1(key.encode()).hexdigest()}.cube")
+        if not os.path.exists(lut_path):
+            await build_tonemap_lut(lut_path, metadata, desat)
+            if debug:
+                console.print(f"[cyan]Built tonemap LUT for {metadata}")
+        elif debug:
+            console.print(f"[cyan]Using cached tonemap LUT for {metadata}")
+        return lut_path
+    except Exception as e:
+        console.print(f"[yellow]Could not build a tonemap LUT, using the zscale chain: {e}")
+        return None
+
+
+async def compare_tonemap(path, ss_times, lut_path, desat, width=640):
+    """
+    Difference between LUT and zscale chain screenshots of path at ss_times, both scaled to width.
+
+    Returns [(ss_time, mean absolute error, max absolute error)] in 8 bit levels.
+    """
+    results = []
+    for ss_time in ss_times:
+        frames = []
+        for tonemap in (lambda ff: tonemap_chain(ff, desat), lambda ff: lut_tonemap(ff, lut_path)):
+            command = (
+                tonemap(ffmpeg.input(path, ss=ss_time)['v:0'])
+                .filter('scale', width, -2)
+                .output('pipe:', format='rawvideo', pix_fmt='rgb24', vframes=1)
+                .global_args('-loglevel', 'error')
+                .compile()
+            )
+            frames.append(await _run(command))
+        reference, lut = frames
+        if not reference or len(reference) != len(lut):
+            continue
+        differences = [abs(a - b) for a, b in zip(reference, lut)]
+        results.append((ss_time, sum(differences) / len(differences), max(differences)))
+    return results
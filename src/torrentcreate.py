@@ -2,6 +2,7 @@ from datetime import datetime
 import torf
 from torf import Torrent
 import random
+import hashlib
 import math
 import os
 import re
@@ -11,6 +12,8 @@ import time
 import subprocess
 import sys
 from src.console import console
+from src.piecehasher import hash_torrent, get_hash_processes, get_piece_cache
+from data.config import config
 
 
 def calculate_piece_size(total_size, min_size, max_size, files, meta):
@@ -130,7 +133,6 @@ def create_torrent(meta, path, output_filename):
             cli_ui.info('--keep-folder was specified. Using complete folder for torrent creation.')
             path = path
         else:
-            os.chdir(path)
             globs = glob.glob1(path, "*.mkv") + glob.glob1(path, "*.mp4") + glob.glob1(path, "*.ts")
             no_sample_globs = [
                 os.path.abspath(f"{path}{os.sep}{file}") for file in globs
@@ -204,7 +206,11 @@ def create_torrent(meta, path, output_filename):
     )
 
     torrent.validate_piece_size(meta)
-    torrent.generate(callback=torf_cb, interval=5)
+    hash_processes = get_hash_processes(config)
+    if hash_processes > 1:
+        hash_torrent(torrent, hash_processes, callback=torf_cb, interval=5, cache=get_piece_cache(config))
+    else:
+        torrent.generate(callback=torf_cb, interval=5)
     torrent.write(f"{meta['base_dir']}/tmp/{meta['uuid']}/{output_filename}.torrent", overwrite=True)
     torrent.verify_filesize(path)
 
@@ -253,13 +259,74 @@ def torf_cb(torrent, filepath, pieces_done, pieces_total):
     cli_ui.info_progress(f"Hashing... {speed_str} | ETA: {eta}", int(percentage_done), 100)
 
 
+def _bencode_end(data, index):
+    """Return the index just past the bencoded value starting at index."""
+    token = data[index:index + 1]
+    if token == b'i':
+        return data.index(b'e', index) + 1
+    if token in (b'l', b'd'):
+        index += 1
+        while data[index:index + 1] != b'e':
+            index = _bencode_end(data, index)
+        return index + 1
+    colon = data.index(b':', index)
+    return colon + 1 + int(data[index:colon])
+
+
+def _bencode_dict_items(data, start):
+    """Yield (key, key start, value start, value end) for the dict starting at start."""
+    index = start + 1
+    while data[index:index + 1] != b'e':
+        key_start = index
+        colon = data.index(b':', index)
+        value_start = colon + 1 + int(data[index:colon])
+        key = data[colon + 1:value_start]
+        index = _bencode_end(data, value_start)
+        yield key, key_start, value_start, index
+
+
 def create_random_torrents(base_dir, uuid, num, path):
+    """
+    Write num copies of BASE.torrent, each with a different info['entropy'] and so a different infohash.
+
+    The base file is split once around the position of the entropy key, so every variant is just
+    the two untouched halves joined around a new entropy value, without re-encoding the pieces.
+    Returns a list of (torrent path, infohash).
+    """
     manual_name = re.sub(r"[^0-9a-zA-Z\[\]\'\-]+", ".", os.path.basename(path))
-    base_torrent = Torrent.read(f"{base_dir}/tmp/{uuid}/BASE.torrent")
-    for i in range(1, int(num) + 1):
-        new_torrent = base_torrent
-        new_torrent.metainfo['info']['entropy'] = random.randint(1, 999999)
-        Torrent.copy(new_torrent).write(f"{base_dir}/tmp/{uuid}/[RAND-{i}]{manual_name}.torrent", overwrite=True)
+    with open(f"{base_dir}/tmp/{uuid}/BASE.torrent", 'rb') as f:
+        data = f.read()
+
+    info_start = info_end = None
+    for key, key_start, value_start, value_end in _bencode_dict_items(data, 0):
+        if key == b'info':
+            info_start, info_end = value_start, value_end
+            break
+    if info_start is None:
+        raise ValueError("BASE.torrent has no info dictionary")
+
+    # Keys are sorted in bencode, so the entropy goes before the first key that sorts after it
+    insert_at = remove_end = info_end - 1
+    for key, key_start, value_start, value_end in _bencode_dict_items(data, info_start):
+        if key == b'entropy':
+            insert_at, remove_end = key_start, value_end
+            break
+        if key > b'entropy':
+            insert_at = remove_end = key_start
+            break
+
+    head, info_head, tail = data[:info_start], data[info_start:insert_at], data[remove_end:]
+    info_tail = data[remove_end:info_end]
+
+    created = []
+    for i, entropy in enumerate(random.sample(range(1, 999999), int(num)), start=1):
+        entropy_item = b'7:entropyi%de' % entropy
+        infohash = hashlib.sha1(info_head + entropy_item + info_tail).hexdigest()
+        torrent_path = f"{base_dir}/tmp/{uuid}/[RAND-{i}]{manual_name}.torrent"
+        with open(torrent_path, 'wb') as f:
+            f.write(b''.join((head, info_head, entropy_item, tail)))
+        created.append((torrent_path, infohash))
+    return created
 
 
 async def create_base_from_existing_torrent(torrentpath, base_dir, uuid):
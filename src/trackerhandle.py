@@ -1,12 +1,42 @@
 import asyncio
+import copy
+import time
 import traceback
 import requests
 import cli_ui
+from rich.table import Table
 from src.trackers.THR import THR
 from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP
 from src.trackers.COMMON import COMMON
 from src.manualpackage import package
+from src.rehostimages import plan_rehosts
+
+# Seconds to wait after uploading before adding the torrent to the client.
+# The tracker holds its own lock for the upload and the wait, so uploads to it are always spaced out.
+default_upload_delays = {
+    'SN': 16,
+    'PTP': 5,
+}
+tracker_locks = {}
+
+
+def get_upload_delays(config):
+    upload_delays = dict(default_upload_delays)
+    configured = config['DEFAULT'].get('tracker_upload_delays', {})
+    if isinstance(configured, dict):
+        for tracker, delay in configured.items():
+            try:
+                upload_delays[tracker.upper()] = max(0, float(delay))
+            except (TypeError, ValueError):
+                pass
+    return upload_delays
+
+
+def get_tracker_lock(tracker):
+    if tracker not in tracker_locks:
+        tracker_locks[tracker] = asyncio.Lock()
+    return tracker_locks[tracker]
 
 
 async def check_mod_q_and_draft(tracker_class, meta, debug, disctype):
@@ -39,7 +69,15 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
     tracker_setup = TRACKER_SETUP(config=config)
     enabled_trackers = tracker_setup.trackers_enabled(meta)
 
-    async def process_single_tracker(tracker):
+    upload_delays = get_upload_delays(config)
+
+    async def wait_after_upload(tracker):
+        delay = upload_delays.get(tracker, 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def process_single_tracker(tracker, meta):
+        """Upload to a single tracker, returning 'uploaded', 'skipped' or 'failed'."""
         if meta['name'].endswith('DUPE?'):
             meta['name'] = meta['name'].replace(' DUPE?', '')
 
@@ -63,7 +101,9 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 if draft == "Yes":
                     console.print(f"(draft: {draft})")
                 await tracker_class.upload(meta, disctype)
+                await wait_after_upload(tracker)
                 await client.add_to_client(meta, tracker_class.tracker)
+                return "uploaded"
 
         elif tracker in other_api_trackers:
             tracker_class = tracker_class_map[tracker](config=config)
@@ -75,9 +115,9 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 if tracker == "RTF":
                     await tracker_class.api_test(meta)
                 await tracker_class.upload(meta, disctype)
-                if tracker == 'SN':
-                    await asyncio.sleep(16)
+                await wait_after_upload(tracker)
                 await client.add_to_client(meta, tracker_class.tracker)
+                return "uploaded"
 
         elif tracker in http_trackers:
             tracker_class = tracker_class_map[tracker](config=config)
@@ -88,7 +128,10 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
             if upload_status:
                 if await tracker_class.validate_credentials(meta) is True:
                     await tracker_class.upload(meta, disctype)
+                    await wait_after_upload(tracker)
                     await client.add_to_client(meta, tracker_class.tracker)
+                    return "uploaded"
+                return "failed"
 
         elif tracker == "MANUAL":
             if meta['unattended']:
@@ -107,9 +150,11 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 url = await package(meta)
                 if url is False:
                     console.print(f"[yellow]Unable to upload prep files, they can be found at `tmp/{meta['uuid']}")
+                    return "failed"
                 else:
                     console.print(f"[green]{meta['name']}")
                     console.print(f"[green]Files can be found at: [yellow]{url}[/yellow]")
+                    return "uploaded"
 
         elif tracker == "THR":
             tracker_status = meta.get('tracker_status', {})
@@ -123,9 +168,12 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                         console.print("[yellow]Logging in to THR")
                         session = thr.login(session)
                         await thr.upload(session, meta, disctype)
+                        await wait_after_upload(tracker)
                         await client.add_to_client(meta, "THR")
+                        return "uploaded"
                 except Exception:
                     console.print(traceback.format_exc())
+                    return "failed"
 
         elif tracker == "PTP":
             tracker_status = meta.get('tracker_status', {})
@@ -137,9 +185,81 @@ async def process_trackers(meta, config, client, console, api_trackers, tracker_
                 groupID = meta.get('ptp_groupID', None)
                 ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                 await ptp.upload(meta, ptpUrl, ptpData, disctype)
-                await asyncio.sleep(5)
+                await wait_after_upload(tracker)
                 await client.add_to_client(meta, "PTP")
+                return "uploaded"
+
+        return "skipped"
 
-    # Process each tracker sequentially
+    # Trackers with image host rules get their screenshots rehosted in one round before any upload starts,
+    # so trackers that share an approved host share one upload instead of each running their own
+    rehost_trackers = {}
     for tracker in enabled_trackers:
-        await process_single_tracker(tracker)
+        tracker = tracker.replace(" ", "").upper().strip()
+        tracker_class = tracker_class_map.get(tracker)
+        if getattr(tracker_class, 'approved_image_hosts', None) and meta.get('tracker_status', {}).get(tracker, {}).get('upload', False):
+            rehost_trackers[tracker] = tracker_class
+    if len(rehost_trackers) > 1:
+        await plan_rehosts(meta, rehost_trackers)
+
+    upload_limit = meta.get('concurrent_uploads') or config['DEFAULT'].get('concurrent_uploads', 1)
+    try:
+        upload_limit = max(1, int(upload_limit))
+    except (TypeError, ValueError):
+        upload_limit = 1
+
+    if upload_limit == 1:
+        # Process each tracker sequentially
+        for tracker in enabled_trackers:
+            tracker = tracker.replace(" ", "").upper().strip()
+            async with get_tracker_lock(tracker):
+                await process_single_tracker(tracker, meta)
+        return
+
+    await process_trackers_concurrently(meta, enabled_trackers, upload_limit, process_single_tracker, console)
+
+
+async def process_trackers_concurrently(meta, enabled_trackers, upload_limit, process_single_tracker, console):
+    """
+    Upload to up to upload_limit trackers at once, each with its own copy of meta.
+
+    Every tracker runs as a task on the main loop, interleaving at its network awaits. The tracker
+    prompts (input and cli_ui) are synchronous calls on that loop, so while one tracker waits for an
+    answer no other tracker runs, and two questions can never be asked at the same time.
+    """
+    semaphore = asyncio.Semaphore(upload_limit)
+    results = {}
+
+    async def run_tracker(tracker):
+        local_meta = copy.deepcopy(meta)
+        start_time = time.time()
+        status, error = "failed", ""
+        async with semaphore:
+            async with get_tracker_lock(tracker):
+                try:
+                    status = await process_single_tracker(tracker, local_meta)
+                except Exception as e:
+                    error = str(e)
+                    console.print(f"[bold red]Upload to {tracker} failed: {e}")
+                    if meta['debug']:
+                        console.print(traceback.format_exc())
+        results[tracker] = (status, time.time() - start_time, error)
+
+    trackers = []
+    for tracker in enabled_trackers:
+        tracker = tracker.replace(" ", "").upper().strip()
+        if tracker not in trackers:
+            trackers.append(tracker)
+    await asyncio.gather(*[run_tracker(tracker) for tracker in trackers])
+
+    table = Table(title=f"Upload results: {meta['name']}")
+    table.add_column("Tracker")
+    table.add_column("Result")
+    table.add_column("Time", justify="right")
+    table.add_column("Error")
+    colors = {'uploaded': 'green', 'skipped': 'yellow', 'failed': 'red'}
+    for tracker in trackers:
+        status, elapsed, error = results.get(tracker, ("failed", 0, ""))
+        color = colors.get(status, 'red')
+        table.add_row(tracker, f"[{color}]{status}[/{color}]", f"{elapsed:.1f}s", error)
+    console.print(table)
@@ -1,17 +1,19 @@
 from src.console import console
 from src.trackers.COMMON import COMMON
 from data.config import config
-import aiohttp
+from src.httpclient import http_service
 import asyncio
 import sys
 from PIL import Image
-import io
 from io import BytesIO
 import os
 
 # Define expected amount of screenshots from the config
 expected_images = int(config['DEFAULT']['screens'])
 
+# Enough for PNG and WebP headers, and for JPEG frame headers that come after EXIF and ICC data
+image_header_bytes = 65536
+
 
 async def prompt_user_for_confirmation(message: str) -> bool:
     try:
@@ -24,6 +26,12 @@ async def prompt_user_for_confirmation(message: str) -> bool:
 
 
 async def check_images_concurrently(imagelist, meta):
+    """
+    Verify the images of an existing upload and keep the ones matching the release resolution.
+
+    Images are checked from their first bytes only, full images are downloaded just when there is
+    no local copy of the same size yet.
+    """
     # Ensure meta['image_sizes'] exists
     if 'image_sizes' not in meta:
         meta['image_sizes'] = {}
@@ -65,51 +73,60 @@ async def check_images_concurrently(imagelist, meta):
             image_dict['raw_url'] = img_url
             image_dict['web_url'] = img_url
 
-        # Verify the image link
-        if await check_image_link(img_url):
-            async with aiohttp.ClientSession() as session:
-                async with session.get(img_url) as response:
-                    if response.status == 200:
-                        image_content = await response.read()
-
-                        try:
-                            image = Image.open(BytesIO(image_content))
-                            vertical_resolution = image.height
-                            lower_bound = expected_vertical_resolution * 0.70
-                            upper_bound = expected_vertical_resolution * (1.30 if meta['is_disc'] == "DVD" else 1.00)
-
-                            if not (lower_bound <= vertical_resolution <= upper_bound):
-                                console.print(
-                                    f"[red]Image {img_url} resolution ({vertical_resolution}p) "
-                                    f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
-                                )
-                                return None
-
-                            # Save image
-                            os.makedirs(save_directory, exist_ok=True)
-                            image_filename = os.path.join(save_directory, os.path.basename(img_url))
-                            with open(image_filename, "wb") as f:
-                                f.write(image_content)
-
-                            console.print(f"Saved {img_url} as {image_filename}")
-
-                            meta['image_sizes'][img_url] = len(image_content)
-
-                            if meta['debug']:
-                                console.print(
-                                    f"Valid image {img_url} with resolution {image.width}x{image.height} "
-                                    f"and size {len(image_content) / 1024:.2f} KiB"
-                                )
-                        except Exception as e:
-                            console.print(f"[red]Failed to process image {img_url}: {e}")
-                            return None
-                    else:
-                        console.print(f"[red]Failed to fetch image {img_url}. Skipping.")
+        # Verify the image link from its header, before anything is downloaded
+        image_info = await probe_image(img_url)
+        if not image_info:
+            return None
 
-            return image_dict
-        else:
+        vertical_resolution = image_info['height']
+        lower_bound = expected_vertical_resolution * 0.70
+        upper_bound = expected_vertical_resolution * (1.30 if meta['is_disc'] == "DVD" else 1.00)
+
+        if not (lower_bound <= vertical_resolution <= upper_bound):
+            console.print(
+                f"[red]Image {img_url} resolution ({vertical_resolution}p) "
+                f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
+            )
             return None
 
+        image_size = image_info['size']
+        image_filename = os.path.join(save_directory, os.path.basename(img_url))
+        already_saved = os.path.exists(image_filename) and (not image_size or os.path.getsize(image_filename) == image_size)
+        if not already_saved:
+            response = await http_service.get(img_url, follow_redirects=True)
+            if response.status_code == 200:
+                image_content = response.content
+
+                try:
+                    Image.open(BytesIO(image_content)).verify()
+
+                    # Save image
+                    os.makedirs(save_directory, exist_ok=True)
+                    with open(image_filename, "wb") as f:
+                        f.write(image_content)
+
+                    console.print(f"Saved {img_url} as {image_filename}")
+                    image_size = len(image_content)
+                except Exception as e:
+                    console.print(f"[red]Failed to process image {img_url}: {e}")
+                    return None
+            else:
+                console.print(f"[red]Failed to fetch image {img_url}. Skipping.")
+        elif already_saved:
+            image_size = os.path.getsize(image_filename)
+
+        if image_size:
+            meta['image_sizes'][img_url] = image_size
+
+        if meta['debug']:
+            size_text = f"{image_size / 1024:.2f} KiB" if image_size else "unknown size"
+            console.print(
+                f"Valid image {img_url} with resolution {image_info['width']}x{image_info['height']} "
+                f"and size {size_text}"
+            )
+
+        return image_dict
+
     # Run image verification concurrently
     tasks = [check_and_collect(image_dict) for image_dict in imagelist]
     results = await asyncio.gather(*tasks)
@@ -122,31 +139,40 @@ async def check_images_concurrently(imagelist, meta):
     return valid_images
 
 
-async def check_image_link(url):
-    async with aiohttp.ClientSession() as session:
+async def probe_image(url):
+    """
+    Format, dimensions and size of the image at url, read from its first bytes with a range request.
+
+    Returns None, after printing why, when url does not serve a readable image.
+    """
+    try:
+        response, image_header = await http_service.get_prefix(url, image_header_bytes, follow_redirects=True)
+        if response.status_code not in (200, 206):
+            console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status_code})[/red]")
+            return None
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'image' not in content_type:
+            console.print(f"[red]Content type is not an image: {url}[/red]")
+            return None
         try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    if 'image' in content_type:
-                        # Attempt to load the image
-                        image_data = await response.read()
-                        try:
-                            image = Image.open(io.BytesIO(image_data))
-                            image.verify()  # This will check if the image is broken
-                            return True
-                        except (IOError, SyntaxError) as e:  # noqa #F841
-                            console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
-                            return False
-                    else:
-                        console.print(f"[red]Content type is not an image: {url}[/red]")
-                        return False
-                else:
-                    console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
-                    return False
-        except Exception as e:
-            console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
-            return False
+            # Only the header is parsed, the pixel data is not needed for the format and dimensions
+            image = Image.open(BytesIO(image_header))
+        except (IOError, SyntaxError):
+            console.print(f"[red]Image verification failed (corrupt image): {url}[/red]")
+            return None
+
+        # bytes 0-65535/1234567 for a range response, the whole body otherwise
+        content_range = response.headers.get('Content-Range', '')
+        size = content_range.rsplit('/', 1)[-1] if response.status_code == 206 else response.headers.get('Content-Length', '')
+        return {
+            'format': image.format,
+            'width': image.width,
+            'height': image.height,
+            'size': int(size) if str(size).isdigit() else None,
+        }
+    except Exception as e:
+        console.print(f"[red]Exception occurred while checking image: {url} - {str(e)}[/red]")
+        return None
 
 
 async def update_meta_with_unit3d_data(meta, tracker_data, tracker_name):
@@ -6,6 +6,7 @@ import os
 import platform
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 import bencodepy
 import httpx
 
@@ -21,6 +22,7 @@ class ACM():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'ACM'
         self.source_flag = 'AsianCinema'
         self.upload_url = 'https://eiga.moi/api/torrents/upload'
@@ -282,7 +284,7 @@ class ACM():
         }
         # Adding Name to search seems to override tmdb
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
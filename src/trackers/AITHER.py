@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import re
 import os
@@ -10,6 +9,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class AITHER():
@@ -22,6 +22,7 @@ class AITHER():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'AITHER'
         self.source_flag = 'Aither'
         self.search_url = 'https://aither.cc/api/torrents/filter'
@@ -111,7 +112,7 @@ class AITHER():
             data['season_number'] = meta.get('season_int', '0')
             data['episode_number'] = meta.get('episode_int', '0')
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(self.upload_url, files=files, data=data, headers=headers, params=params, timeout=60.0)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -257,7 +258,7 @@ class AITHER():
             params['name'] = params['name'] + f" {meta['edition']}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -9,6 +9,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class AL():
@@ -22,6 +23,7 @@ class AL():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'AL'
         self.source_flag = 'AnimeLovers'
         self.upload_url = 'https://animelovers.club/api/torrents/upload'
@@ -176,7 +178,7 @@ class AL():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -10,6 +10,7 @@ from pymediainfo import MediaInfo
 from pathlib import Path
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 from src.torrentcreate import create_torrent
 
 
@@ -24,6 +25,7 @@ class ANT():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'ANT'
         self.source_flag = 'ANT'
         self.search_url = 'https://anthelion.me/api.php'
@@ -158,7 +160,7 @@ class ANT():
             params['imdb'] = meta['imdb_id']
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url='https://anthelion.me/api', params=params)
                 if response.status_code == 200:
                     try:
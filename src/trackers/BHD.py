@@ -10,6 +10,7 @@ import httpx
 import re
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 from src.rehostimages import check_hosts
 
 
@@ -21,8 +22,20 @@ class BHD():
         Set type/category IDs
         Upload
     """
+    # Image hosts accepted for screenshots, and the URL host names they are served from
+    approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bhd', 'bam']
+    url_host_mapping = {
+        "ibb.co": "imgbb",
+        "ptpimg.me": "ptpimg",
+        "pixhost.to": "pixhost",
+        "imgbox.com": "imgbox",
+        "beyondhd.co": "bhd",
+        "imagebam.com": "bam",
+    }
+
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'BHD'
         self.source_flag = 'BHD'
         self.upload_url = 'https://beyond-hd.me/api/upload/'
@@ -32,17 +45,8 @@ class BHD():
 
     async def upload(self, meta, disctype):
         common = COMMON(config=self.config)
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "pixhost.to": "pixhost",
-            "imgbox.com": "imgbox",
-            "beyondhd.co": "bhd",
-            "imagebam.com": "bam",
-        }
 
-        approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bhd', 'bam']
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         await common.edit_torrent(meta, self.tracker, self.source_flag)
         cat_id = await self.get_cat_id(meta['category'])
         source_id = await self.get_source(meta['source'])
@@ -302,7 +306,7 @@ class BHD():
 
         url = f"https://beyond-hd.me/api/torrents/{self.config['TRACKERS']['BHD']['api_key'].strip()}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.post(url, params=data)
                 if response.status_code == 200:
                     data = response.json()
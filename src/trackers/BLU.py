@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import os
 import glob
@@ -9,6 +8,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class BLU():
@@ -21,6 +21,7 @@ class BLU():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'BLU'
         self.source_flag = 'BLU'
         self.search_url = 'https://blutopia.cc/api/torrents/filter'
@@ -123,7 +124,7 @@ class BLU():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(self.upload_url, files=files, data=data, headers=headers, params=params, timeout=60.0)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -223,7 +224,7 @@ class BLU():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -9,6 +9,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class CBR():
@@ -21,6 +22,7 @@ class CBR():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'CBR'
         self.source_flag = 'CapybaraBR'
         self.search_url = 'https://capybarabr.com/api/torrents/filter'
@@ -173,7 +175,7 @@ class CBR():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -11,7 +11,7 @@ from pymediainfo import MediaInfo
 from src.bbcode import BBCODE
 from src.console import console
 from src.uploadscreens import upload_screens
-from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
+from src.takescreens import disc_screenshots, dvd_screenshots, screenshots, capture_playlist_screenshots
 
 
 class COMMON():
@@ -101,6 +101,15 @@ class COMMON():
                         if 'retry_count' not in meta:
                             meta['retry_count'] = 0
 
+                        # Capture every playlist still missing screenshots at once, uploads stay in order below
+                        pending_playlists = [
+                            (i, each[key]) for i, key in enumerate(bdinfo_keys[1:], start=1)
+                            if not meta.get(f'new_images_playlist_{i}')
+                            and not glob.glob1(f"{meta['base_dir']}/tmp/{meta['uuid']}", f"PLAYLIST_{i}-*.png")
+                        ]
+                        if len(pending_playlists) > 1 and not meta.get('vapoursynth', False):
+                            await capture_playlist_screenshots(meta, pending_playlists, multi_screens)
+
                         for i, key in enumerate(bdinfo_keys[1:], start=1):  # Skip the first bdinfo
                             new_images_key = f'new_images_playlist_{i}'
                             bdinfo = each[key]
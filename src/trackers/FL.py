@@ -12,12 +12,14 @@ import httpx
 from src.trackers.COMMON import COMMON
 from src.exceptions import *  # noqa F403
 from src.console import console
+from src.httpclient import http_service
 
 
 class FL():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'FL'
         self.source_flag = 'FL'
         self.username = config['TRACKERS'][self.tracker].get('username', '').strip()
@@ -215,7 +217,7 @@ class FL():
             }
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with self.http.session(cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url, params=params)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
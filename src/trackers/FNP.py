@@ -9,6 +9,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class FNP():
@@ -22,6 +23,7 @@ class FNP():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'FNP'
         self.source_flag = 'FnP'
         self.upload_url = 'https://fearnopeer.com/api/torrents/upload'
@@ -168,7 +170,7 @@ class FNP():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
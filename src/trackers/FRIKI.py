@@ -6,6 +6,7 @@ import platform
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class FRIKI():
@@ -19,6 +20,7 @@ class FRIKI():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'FRIKI'
         self.source_flag = 'frikibar.com'
         self.upload_url = 'https://frikibar.com/api/torrents/upload'
@@ -159,7 +161,7 @@ class FRIKI():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -5,12 +5,14 @@ import os
 from pathlib import Path
 import json
 import glob
+import fnmatch
 import httpx
 from unidecode import unidecode
 from urllib.parse import urlparse, quote
 from src.trackers.COMMON import COMMON
 from src.exceptions import *  # noqa F403
 from src.console import console
+from src.httpclient import http_service
 from datetime import datetime
 from torf import Torrent
 from src.torrentcreate import CustomTorrent, torf_cb
@@ -20,6 +22,7 @@ class HDB():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'HDB'
         self.source_flag = 'HDBits'
         self.username = config['TRACKERS']['HDB'].get('username', '').strip()
@@ -339,7 +342,7 @@ class HDB():
 
         try:
             # Send POST request with JSON body
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.post(url, json=data)
 
                 if response.status_code == 200:
@@ -480,14 +483,10 @@ class HDB():
             descfile.close()
 
     async def hdbimg_upload(self, meta):
-        image_glob = glob.glob("*.png")
+        image_glob = glob.glob(os.path.join(meta['base_dir'], 'tmp', meta['uuid'], '*.png'))
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
-        unwanted_files = set()
-        for pattern in unwanted_patterns:
-            unwanted_files.update(glob.glob(pattern))
-
-        image_glob = [file for file in image_glob if file not in unwanted_files]
-        images = list(set(image_glob))
+        image_glob = [file for file in image_glob if not any(fnmatch.fnmatch(os.path.basename(file), pattern) for pattern in unwanted_patterns)]
+        images = sorted(set(image_glob))
         url = "https://img.hdbits.org/upload_api.php"
 
         data = {
@@ -9,11 +9,13 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class HHD():
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'HHD'
         self.source_flag = 'HHD'
         self.upload_url = 'https://homiehelpdesk.net/api/torrents/upload'
@@ -165,7 +167,7 @@ class HHD():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -9,6 +9,7 @@ import cli_ui
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 from src.rehostimages import check_hosts
 
 
@@ -20,8 +21,19 @@ class HUNO():
         Set type/category IDs
         Upload
     """
+    # Image hosts accepted for screenshots, and the URL host names they are served from
+    approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bam']
+    url_host_mapping = {
+        "ibb.co": "imgbb",
+        "ptpimg.me": "ptpimg",
+        "pixhost.to": "pixhost",
+        "imgbox.com": "imgbox",
+        "imagebam.com": "bam",
+    }
+
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'HUNO'
         self.source_flag = 'HUNO'
         self.search_url = 'https://hawke.uno/api/torrents/filter'
@@ -37,15 +49,7 @@ class HUNO():
             console.print("[bold red]Skipping upload to HUNO due to missing audio language")
             return
 
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "pixhost.to": "pixhost",
-            "imgbox.com": "imgbox",
-            "imagebam.com": "bam",
-        }
-        approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb', 'pixhost', 'bam']
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         if 'HUNO_images_key' in meta:
             image_list = meta['HUNO_images_key']
         else:
@@ -355,7 +359,7 @@ class HUNO():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -6,6 +6,7 @@ import platform
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class JPTV():
@@ -19,6 +20,7 @@ class JPTV():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'JPTV'
         self.source_flag = 'jptv.club'
         self.torrent_url = 'https://jptv.club/api/torrents/'
@@ -169,7 +171,7 @@ class JPTV():
             console.log("[cyan]Dupe Search Parameters")
             console.log(params)
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -8,6 +8,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class LCD():
@@ -20,6 +21,7 @@ class LCD():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'LCD'
         self.source_flag = 'LOCADORA'
         self.search_url = 'https://locadora.cc/api/torrents/filter'
@@ -174,7 +176,7 @@ class LCD():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 # import discord
 import asyncio
-import requests
 import platform
 import os
 import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class LST():
@@ -21,6 +21,7 @@ class LST():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'LST'
         self.source_flag = 'LST.GG'
         self.upload_url = 'https://lst.gg/api/torrents/upload'
@@ -152,7 +153,7 @@ class LST():
         }
 
         if meta['debug'] is False:
-            response = requests.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
+            response = await self.http.post(self.upload_url, files=files, data=data, headers=headers, params=params, timeout=60.0)
             try:
                 console.print(response.json())
                 # adding torrent link to comment of torrent file
@@ -205,7 +206,7 @@ class LST():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -1,6 +1,7 @@
 import requests
 import asyncio
 from src.console import console
+from src.httpclient import http_service
 import traceback
 from torf import Torrent
 import httpx
@@ -24,9 +25,17 @@ class MTV():
         Set type/category IDs
         Upload
     """
+    # Image hosts accepted for screenshots, and the URL host names they are served from
+    approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb']
+    url_host_mapping = {
+        "ibb.co": "imgbb",
+        "ptpimg.me": "ptpimg",
+        "imgbox.com": "imgbox",
+    }
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'MTV'
         self.source_flag = 'MTV'
         self.upload_url = 'https://www.morethantv.me/upload.php'
@@ -86,14 +95,7 @@ class MTV():
                     return
             await common.edit_torrent(meta, self.tracker, self.source_flag, torrent_filename=torrent_filename)
 
-        approved_image_hosts = ['ptpimg', 'imgbox', 'imgbb']
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "imgbox.com": "imgbox",
-        }
-
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         cat_id = await self.get_cat_id(meta)
         resolution_id = await self.get_res_id(meta['resolution'])
         source_id = await self.get_source_id(meta)
@@ -549,7 +551,7 @@ class MTV():
             params['q'] = meta['title'].replace(': ', ' ').replace('’', '').replace("'", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
 
                 if response.status_code == 200 and response.text:
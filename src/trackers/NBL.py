@@ -5,6 +5,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class NBL():
@@ -17,6 +18,7 @@ class NBL():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'NBL'
         self.source_flag = 'NBL'
         self.upload_url = 'https://nebulance.io/upload.php'
@@ -109,7 +111,7 @@ class NBL():
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.post(self.search_url, json=payload)
                 if response.status_code == 200:
                     try:
@@ -9,6 +9,7 @@ import cli_ui
 from src.bbcode import BBCODE
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 import httpx
 
 
@@ -22,6 +23,7 @@ class OE():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'OE'
         self.source_flag = 'OE'
         self.search_url = 'https://onlyencodes.cc/api/torrents/filter'
@@ -346,7 +348,7 @@ class OE():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
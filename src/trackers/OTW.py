@@ -8,6 +8,7 @@ import glob
 import requests
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 from src.rehostimages import check_hosts
 
 
@@ -19,9 +20,18 @@ class OTW():
         Set type/category IDs
         Upload
     """
+    # Image hosts accepted for screenshots, and the URL host names they are served from
+    approved_image_hosts = ['imgbox', 'imgbb', 'pixhost', 'bam']
+    url_host_mapping = {
+        "ibb.co": "imgbb",
+        "pixhost.to": "pixhost",
+        "imgbox.com": "imgbox",
+        "imagebam.com": "bam",
+    }
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'OTW'
         self.source_flag = 'OTW'
         self.upload_url = 'https://oldtoons.world/api/torrents/upload'
@@ -79,17 +89,10 @@ class OTW():
 
     async def upload(self, meta, disctype):
         common = COMMON(config=self.config)
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "pixhost.to": "pixhost",
-            "imgbox.com": "imgbox",
-            "imagebam.com": "bam",
-        }
 
         otw_name = await self.edit_name(meta)
 
-        approved_image_hosts = ['imgbox', 'imgbb', 'pixhost', 'bam']
-        await check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=approved_image_hosts)
+        await check_hosts(meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
         if 'OTW_images_key' in meta:
             image_list = meta['OTW_images_key']
         else:
@@ -211,7 +214,7 @@ class OTW():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
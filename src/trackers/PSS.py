@@ -8,6 +8,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class PSS():
@@ -21,6 +22,7 @@ class PSS():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'PSS'
         self.source_flag = 'PSS'
         self.upload_url = 'https://privatesilverscreen.cc/api/torrents/upload'
@@ -171,7 +173,7 @@ class PSS():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
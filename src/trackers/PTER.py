@@ -12,12 +12,14 @@ from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
 from src.exceptions import *  # noqa E403
 from src.console import console
+from src.httpclient import http_service
 
 
 class PTER():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'PTER'
         self.source_flag = 'PTER'
         self.passkey = str(config['TRACKERS']['PTER'].get('passkey', '')).strip()
@@ -72,7 +74,7 @@ class PTER():
         search_url = f"https://pterclub.com/torrents.php?search={imdb}&incldead=0&search_mode=0&source{source}=1"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with self.http.session(cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url)
 
                 if response.status_code == 200:
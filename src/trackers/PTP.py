@@ -15,6 +15,7 @@ from src.trackers.COMMON import COMMON
 from src.bbcode import BBCODE
 from src.exceptions import *  # noqa F403
 from src.console import console
+from src.httpclient import http_service
 from torf import Torrent
 from datetime import datetime
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
@@ -26,6 +27,7 @@ class PTP():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'PTP'
         self.source_flag = 'PTP'
         self.api_user = config['TRACKERS']['PTP'].get('ApiUser', '').strip()
@@ -347,7 +349,7 @@ class PTP():
         url = 'https://passthepopcorn.me/torrents.php'
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(url, headers=headers, params=params)
                 await asyncio.sleep(1)  # Mimic server-friendly delay
                 if response.status_code == 200:
@@ -9,6 +9,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class R4E():
@@ -21,6 +22,7 @@ class R4E():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'R4E'
         self.source_flag = 'R4E'
         # self.signature = f"\n[center][url=https://github.com/L4GSP1KE/Upload-Assistant]Created by L4G's Upload Assistant[/url][/center]"
@@ -162,7 +164,7 @@ class R4E():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=url, params=params)
                 if response.status_code == 200:
                     data = response.json()
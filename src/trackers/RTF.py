@@ -9,6 +9,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class RTF():
@@ -21,6 +22,7 @@ class RTF():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'RTF'
         self.source_flag = 'sunshine'
         self.upload_url = 'https://retroflix.club/api/upload'
@@ -117,7 +119,7 @@ class RTF():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
@@ -167,7 +169,7 @@ class RTF():
         config_path = f"{base_dir}/data/config.py"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self.http.session() as client:
                 response = await client.post('https://retroflix.club/api/login', headers=headers, json=json_data)
 
             if response.status_code == 201:
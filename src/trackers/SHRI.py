@@ -10,6 +10,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class SHRI():
@@ -22,6 +23,7 @@ class SHRI():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'SHRI'
         self.source_flag = 'Shareisland'
         self.search_url = 'https://shareisland.org/api/torrents/filter'
@@ -243,7 +245,7 @@ class SHRI():
             params['name'] = params['name'] + f" {meta['edition']}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
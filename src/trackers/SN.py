@@ -5,6 +5,7 @@ import httpx
 
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class SN():
@@ -17,6 +18,7 @@ class SN():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'SN'
         self.source_flag = 'Swarmazon'
         self.upload_url = 'https://swarmazon.club/api/upload.php'
@@ -165,7 +167,7 @@ class SN():
                 params['filter'] = meta['resolution']
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
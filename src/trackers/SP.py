@@ -8,6 +8,7 @@ import re
 import os
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class SP():
@@ -21,6 +22,7 @@ class SP():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'SP'
         self.source_flag = 'seedpool.org'
         self.upload_url = 'https://seedpool.org/api/torrents/upload'
@@ -216,7 +218,7 @@ class SP():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -4,6 +4,7 @@ import asyncio
 from torf import Torrent
 import requests
 from src.console import console
+from src.httpclient import http_service
 from pprint import pprint
 import base64
 import shutil
@@ -18,6 +19,7 @@ class SPD():
     def __init__(self, config):
         self.url = "https://speedapp.io"
         self.config = config
+        self.http = http_service
         self.tracker = 'SPD'
         self.source_flag = 'speedapp.io'
         self.search_url = 'https://speedapp.io/api/torrent'
@@ -147,7 +149,7 @@ class SPD():
             params['search'] = meta['title'].replace(':', '').replace("'", '').replace(",", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
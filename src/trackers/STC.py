@@ -7,6 +7,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class STC():
@@ -19,6 +20,7 @@ class STC():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'STC'
         self.source_flag = 'STC'
         self.upload_url = 'https://skipthecommericals.xyz/api/torrents/upload'
@@ -183,7 +185,7 @@ class STC():
         if meta.get('edition', "") != "":
             params['name'] + meta['edition']
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -12,6 +12,7 @@ import httpx
 from bs4 import BeautifulSoup
 from unidecode import unidecode
 from src.console import console
+from src.httpclient import http_service
 
 
 class THR():
@@ -24,6 +25,7 @@ class THR():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.username = config['TRACKERS']['THR'].get('username')
         self.password = config['TRACKERS']['THR'].get('password')
         self.banned_groups = [""]
@@ -196,10 +198,8 @@ class THR():
             desc.write("[/quote]")
             desc.write(base)
             # REHOST IMAGES
-            os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
-            image_glob = glob.glob("*.png")
-            if 'POSTER.png' in image_glob:
-                image_glob.remove('POSTER.png')
+            image_glob = glob.glob(os.path.join(meta['base_dir'], 'tmp', meta['uuid'], '*.png'))
+            image_glob = [image for image in image_glob if os.path.basename(image) != 'POSTER.png']
             image_list = []
             for image in image_glob:
                 url = "https://img2.torrenthr.org/api/1/upload"
@@ -264,7 +264,7 @@ class THR():
         console.print("[yellow]Searching for existing torrents on THR...")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http.session(timeout=10.0) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
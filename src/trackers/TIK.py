@@ -12,6 +12,7 @@ import click
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class TIK():
@@ -25,6 +26,7 @@ class TIK():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'TIK'
         self.source_flag = 'TIK'
         self.search_url = 'https://cinematik.net/api/torrents/filter'
@@ -581,7 +583,7 @@ class TIK():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -11,12 +11,14 @@ from urllib.parse import urlparse
 from src.trackers.COMMON import COMMON
 from src.exceptions import *  # noqa #F405
 from src.console import console
+from src.httpclient import http_service
 
 
 class TTG():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'TTG'
         self.source_flag = 'TTG'
         self.username = str(config['TRACKERS']['TTG'].get('username', '')).strip()
@@ -201,7 +203,7 @@ class TTG():
         search_url = f"https://totheglory.im/browse.php?search_field= {imdb} {res_type}"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with self.http.session(cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
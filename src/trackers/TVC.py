@@ -10,6 +10,7 @@ import json
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class TVC():
@@ -23,6 +24,7 @@ class TVC():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'TVC'
         self.source_flag = 'TVCHAOS'
         self.upload_url = 'https://tvchaosuk.com/api/torrents/upload'
@@ -306,7 +308,7 @@ class TVC():
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -6,6 +6,7 @@ import platform
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class UNIT3D_TEMPLATE():
@@ -25,6 +26,7 @@ class UNIT3D_TEMPLATE():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'Abbreviated'
         self.source_flag = 'Source flag for .torrent'
         self.upload_url = 'https://domain.tld/api/torrents/upload'
@@ -169,7 +171,7 @@ class UNIT3D_TEMPLATE():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -8,6 +8,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class UTP():
@@ -20,6 +21,7 @@ class UTP():
     """
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'UTP'
         self.source_flag = 'UTOPIA'
         self.search_url = 'https://utp.to/api/torrents/filter'
@@ -165,7 +167,7 @@ class UTP():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -8,6 +8,7 @@ import glob
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class YOINK():
@@ -21,6 +22,7 @@ class YOINK():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'YOINK'
         self.source_flag = 'YOiNKED'
         self.upload_url = 'https://yoinked.org/api/torrents/upload'
@@ -169,7 +171,7 @@ class YOINK():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
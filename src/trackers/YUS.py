@@ -5,6 +5,7 @@ import platform
 import httpx
 from src.trackers.COMMON import COMMON
 from src.console import console
+from src.httpclient import http_service
 
 
 class YUS():
@@ -18,6 +19,7 @@ class YUS():
 
     def __init__(self, config):
         self.config = config
+        self.http = http_service
         self.tracker = 'YUS'
         self.source_flag = 'YuScene'
         self.upload_url = 'https://yu-scene.net/api/torrents/upload'
@@ -159,7 +161,7 @@ class YUS():
         if meta.get('edition', "") != "":
             params['name'] = params['name'] + f" {meta['edition']}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self.http.session(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -44,6 +44,7 @@ from src.trackers.HHD import HHD
 from src.trackers.SP import SP
 from src.trackers.YUS import YUS
 from src.console import console
+from src.httpclient import http_service
 import httpx
 import os
 import json
@@ -100,7 +101,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with http_service.session(timeout=5.0) as client:
             while True:
                 try:
                     # Add query parameters for pagination
@@ -306,7 +307,7 @@ class TRACKER_SETUP:
         all_data = []
         next_cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with http_service.session(timeout=5.0) as client:
             while True:
                 try:
                     # Add query parameters for pagination
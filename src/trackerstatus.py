@@ -23,23 +23,46 @@ async def process_all_trackers(meta):
     helper = UploadHelper()
     meta_lock = asyncio.Lock()  # noqa F841
 
-    async def process_single_tracker(tracker_name, shared_meta):
-        nonlocal successful_trackers
+    def copy_meta(shared_meta):
         local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
+        if local_meta['name'].endswith('DUPE?'):
+            local_meta['name'] = local_meta['name'].replace(' DUPE?', '')
+        return local_meta
+
+    async def prefetch_tracker(tracker_name, shared_meta):
+        """
+        Run the network bound checks for one tracker ahead of the interactive pass.
+
+        Trackers that may prompt before searching (credential checks, IMDb id for THR/PTP) are left alone.
+        """
+        local_meta = copy_meta(shared_meta)
+        tracker_class = tracker_class_map[tracker_name](config=config)
+        prefetched = {'meta': local_meta, 'tracker_class': tracker_class}
+        try:
+            if tracker_name in ("AITHER", "LST"):
+                await tracker_setup.get_banned_groups(local_meta, tracker_name)
+            if tracker_name == "AITHER":
+                prefetched['claimed'] = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+            prefetched['dupes'] = await tracker_class.search_existing(local_meta, local_meta.get('disctype', None))
+        except Exception as e:
+            console.print(f"[yellow]Prefetching {tracker_name} failed, it will be checked again: {e}")
+        return tracker_name, prefetched
+
+    async def process_single_tracker(tracker_name, shared_meta, prefetched=None):
+        nonlocal successful_trackers
+        prefetched = prefetched or {}
+        local_meta = prefetched.get('meta') or copy_meta(shared_meta)
         local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False}
         disctype = local_meta.get('disctype', None)
         tracker_name = tracker_name.replace(" ", "").upper().strip()
         console.print(f"\n[bold yellow]Processing Tracker: {tracker_name}[/bold yellow]")
 
-        if local_meta['name'].endswith('DUPE?'):
-            local_meta['name'] = local_meta['name'].replace(' DUPE?', '')
-
         if tracker_name == "MANUAL":
             local_tracker_status['upload'] = True
             successful_trackers += 1
 
         if tracker_name in tracker_class_map:
-            tracker_class = tracker_class_map[tracker_name](config=config)
+            tracker_class = prefetched.get('tracker_class') or tracker_class_map[tracker_name](config=config)
             if tracker_name in http_trackers:
                 await tracker_class.validate_credentials(meta)
             if tracker_name in {"THR", "PTP"}:
@@ -77,12 +100,15 @@ async def process_all_trackers(meta):
 
             if not local_tracker_status['banned']:
                 if tracker_name == "AITHER":
-                    if await tracker_setup.get_torrent_claims(local_meta, tracker_name):
+                    claimed = prefetched['claimed'] if 'claimed' in prefetched else await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+                    if claimed:
                         local_tracker_status['skipped'] = True
                     else:
                         local_tracker_status['skipped'] = False
 
-                if tracker_name not in {"THR", "PTP", "TL"}:
+                if 'dupes' in prefetched:
+                    dupes = prefetched['dupes']
+                elif tracker_name not in {"THR", "PTP", "TL"}:
                     dupes = await tracker_class.search_existing(local_meta, disctype)
                 elif tracker_name == "PTP":
                     dupes = await ptp.search_existing(groupID, local_meta, disctype)
@@ -150,8 +176,17 @@ async def process_all_trackers(meta):
         for tracker_name, status in results:
             tracker_status[tracker_name] = status
     else:
+        # Searches run concurrently up front, only the questions are asked one tracker at a time
+        prefetch_names = []
+        for tracker_name in meta['trackers']:
+            tracker_name = tracker_name.replace(" ", "").upper().strip()
+            if tracker_name in tracker_class_map and tracker_name not in http_trackers and tracker_name not in {"THR", "PTP", "TL"}:
+                prefetch_names.append(tracker_name)
+        prefetch_results = await asyncio.gather(*[prefetch_tracker(tracker_name, meta) for tracker_name in prefetch_names])
+        prefetched = dict(prefetch_results)
+
         for tracker_name in meta['trackers']:
-            tracker_name, status = await process_single_tracker(tracker_name, meta)
+            tracker_name, status = await process_single_tracker(tracker_name, meta, prefetched.get(tracker_name.replace(" ", "").upper().strip()))
             tracker_status[tracker_name] = status
 
     if meta['debug']:
@@ -1,4 +1,5 @@
 from src.console import console
+from src.metacache import metadata_cache
 import requests
 import json
 
@@ -102,6 +103,12 @@ async def search_tvmaze(filename, year, imdbID, tvdbID, meta):
 
 
 async def _make_tvmaze_request(url, params, meta):
+    endpoint = url.replace("https://api.tvmaze.com/", "")
+    key = "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+    return await metadata_cache.fetch('tvmaze', key, endpoint, lambda: _fetch_tvmaze(url, params, meta), meta)
+
+
+async def _fetch_tvmaze(url, params, meta):
     if meta['debug']:
         print(f"Requesting TVmaze API: {url} with params: {params}")
     try:
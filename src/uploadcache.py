@@ -0,0 +1,56 @@
+import os
+import json
+import time
+import hashlib
+from src.imagebuffers import image_buffers
+from data.config import config
+
+upload_cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'uploads')
+
+# Remember uploads by image content and host, so the same screenshot is never uploaded to a host twice
+use_upload_cache = config['DEFAULT'].get('image_upload_cache', True)
+try:
+    # Some hosts prune images nobody looks at, so old entries are uploaded again
+    upload_cache_days = float(config['DEFAULT'].get('image_upload_cache_days', 30))
+except (TypeError, ValueError):
+    upload_cache_days = 30.0
+
+
+def image_digest(image):
+    """SHA-256 of the stored screenshot bytes, from image_buffers when they are still in memory."""
+    return hashlib.sha256(image_buffers.get(image)).hexdigest()
+
+
+def _entry_path(host, digest):
+    return os.path.join(upload_cache_dir, host, digest[:2], f"{digest}.json")
+
+
+def get_cached_upload(host, digest):
+    """The {img_url, raw_url, web_url, size} an image with digest was uploaded to host as, or None."""
+    try:
+        with open(_entry_path(host, digest), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if upload_cache_days and time.time() - entry.get('uploaded', 0) > upload_cache_days * 86400:
+        return None
+    if not all(entry.get(key) for key in ('img_url', 'raw_url', 'web_url')):
+        return None
+    return entry
+
+
+def store_upload(host, digest, upload, size):
+    """Record a successful upload of the image with digest to host."""
+    path = _entry_path(host, digest)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {
+        'img_url': upload['img_url'],
+        'raw_url': upload['raw_url'],
+        'web_url': upload['web_url'],
+        'size': size,
+        'uploaded': time.time(),
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
@@ -1,11 +1,15 @@
 import vapoursynth as vs
-from awsmfunc import ScreenGen, DynamicTonemap, zresize
+from awsmfunc import DynamicTonemap, zresize
 import random
 import os
+import hashlib
 from functools import partial
 
 core = vs.core
 
+# Source indexes, shared by every upload of the same unchanged file
+index_cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'vsindex')
+
 # core.std.LoadPlugin(path="/usr/local/lib/vapoursynth/libffms2.so")
 # core.std.LoadPlugin(path="/usr/local/lib/vapoursynth/libsub.so")
 # core.std.LoadPlugin(path="/usr/local/lib/vapoursynth/libimwri.so")
@@ -22,6 +26,67 @@ def CustomFrameInfo(clip, text):
     return core.std.FrameEval(clip, partial(FrameProps, clip=clip), prop_src=clip)
 
 
+def index_cache_path(source, extension):
+    """Index file for source, keyed by its path, size and mtime so a changed file is indexed again."""
+    stat = os.stat(source)
+    key = f"{os.path.abspath(source)}|{stat.st_size}|{stat.st_mtime_ns}"
+    os.makedirs(index_cache_dir, exist_ok=True)
+    return os.path.join(index_cache_dir, f"{hashlib.sha1(key.encode('utf-8', 'surrogateescape')).hexdigest()}.{extension}")
+
+
+def load_source(source):
+    """Open source with LSMASHSource (m2ts) or ffms2, reusing a cached index when there is one."""
+    if str(source).endswith(".m2ts"):
+        cachefile = index_cache_path(source, "lwi")
+        if not os.path.exists(cachefile):
+            print(f"Indexing {source} with LSMASHSource... This may take a while.")
+        try:
+            return core.lsmas.LWLibavSource(source, cachefile=cachefile)
+        except vs.Error:
+            # Older L-SMASH-Works without cachefile, the index goes next to the source
+            return core.lsmas.LWLibavSource(source)
+
+    cachefile = index_cache_path(source, "ffindex")
+    if not os.path.exists(cachefile):
+        print(f"Indexing {source} with ffms2... This may take a while.")
+    try:
+        src = core.ffms2.Source(source, cachefile=cachefile)
+    except vs.Error as e:
+        print(f"Error during indexing: {str(e)}")
+        raise
+    if os.path.exists(cachefile):
+        print(f"Indexing completed and cached at: {cachefile}")
+    else:
+        print("Indexing did not complete as expected.")
+    return src
+
+
+def render_frames(clip, frames, dir, suffix):
+    """
+    Write frames of clip as {number:02d}{suffix}.png into dir.
+
+    Every frame gets its own writer and all of them are requested at once, so VapourSynth renders
+    them in parallel on its own thread pool instead of one after another.
+    """
+    if clip.format.color_family != vs.RGB:
+        clip = clip.resize.Spline36(format=vs.RGB24, matrix_in_s="709", dither_type="error_diffusion")
+    elif clip.format.id != vs.RGB24:
+        clip = clip.resize.Spline36(format=vs.RGB24, dither_type="error_diffusion")
+
+    writers = []
+    for number, frame in enumerate(frames, start=1):
+        path = os.path.join(dir, f"{str(number).zfill(2)}{suffix}.png")
+        writers.append(clip[frame].imwri.Write("PNG", path.replace("%", "%%"), overwrite=True))
+    try:
+        futures = [writer.get_frame_async(0) for writer in writers]
+        for future in futures:
+            future.result()
+    except TypeError:
+        # VapourSynth before R58 has no future returning get_frame_async
+        for writer in writers:
+            writer.get_frame(0)
+
+
 def optimize_images(image, config):
     import platform  # Ensure platform is imported here
     if config.get('optimize_images', True):
@@ -57,22 +122,7 @@ def vs_screengn(source, encode=None, filter_b_frames=False, num=5, dir=".", conf
         frames = []
 
     # Indexing the source using ffms2 or lsmash for m2ts files
-    if str(source).endswith(".m2ts"):
-        print(f"Indexing {source} with LSMASHSource... This may take a while.")
-        src = core.lsmas.LWLibavSource(source)
-    else:
-        cachefile = f"{os.path.abspath(dir)}{os.sep}ffms2.ffms2"
-        if not os.path.exists(cachefile):
-            print(f"Indexing {source} with ffms2... This may take a while.")
-        try:
-            src = core.ffms2.Source(source, cachefile=cachefile)
-        except vs.Error as e:
-            print(f"Error during indexing: {str(e)}")
-            raise
-        if os.path.exists(cachefile):
-            print(f"Indexing completed and cached at: {cachefile}")
-        else:
-            print("Indexing did not complete as expected.")
+    src = load_source(source)
 
     # Check if encode is provided
     if encode:
@@ -91,11 +141,10 @@ def vs_screengn(source, encode=None, filter_b_frames=False, num=5, dir=".", conf
         for _ in range(num):
             frames.append(random.randint(start, end))
         frames = sorted(frames)
-        frames = [f"{x}\n" for x in frames]
 
         # Write the frame numbers to a file for reuse
         with open(screens_file, "w") as txt:
-            txt.writelines(frames)
+            txt.writelines(f"{x}\n" for x in frames)
         print(f"Generated and saved new frame numbers to {screens_file}")
 
     # If an encode exists and is provided, crop and resize
@@ -125,10 +174,10 @@ def vs_screengn(source, encode=None, filter_b_frames=False, num=5, dir=".", conf
         src = CustomFrameInfo(src, "Tonemapped")
 
     # Generate screenshots
-    ScreenGen(src, dir, "a")
+    render_frames(src, frames, dir, "a")
     if encode:
         enc = CustomFrameInfo(enc, "Encode (Tonemapped)")
-        ScreenGen(enc, dir, "b")
+        render_frames(enc, frames, dir, "b")
 
     # Optimize images
     for i in range(1, num + 1):
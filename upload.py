@@ -20,8 +20,12 @@ from packaging import version
 from src.trackersetup import tracker_class_map, api_trackers, other_api_trackers, http_trackers
 from src.trackerhandle import process_trackers
 from src.queuemanage import handle_queue
+from src.queuepipeline import run_queue_pipeline, get_stage_limits, get_prompt_stages
+from src.httpclient import http_service
+from src.imagepool import image_pool, vs_pool
 from src.console import console
 from src.torrentcreate import create_torrent, create_random_torrents, create_base_from_existing_torrent
+from src.piecehasher import purge_piece_cache
 from src.uphelper import UploadHelper
 from src.trackerstatus import process_all_trackers
 from src.takescreens import disc_screenshots, dvd_screenshots, screenshots
@@ -57,7 +61,8 @@ async def merge_meta(meta, saved_meta, path):
             'trackers', 'dupe', 'debug', 'anon', 'category', 'type', 'screens', 'nohash', 'manual_edition', 'imdb', 'tmdb_manual', 'mal', 'manual',
             'hdb', 'ptp', 'blu', 'no_season', 'no_aka', 'no_year', 'no_dub', 'no_tag', 'no_seed', 'client', 'desclink', 'descfile', 'desc', 'draft',
             'modq', 'region', 'freeleech', 'personalrelease', 'unattended', 'manual_season', 'manual_episode', 'torrent_creation', 'qbit_tag', 'qbit_cat',
-            'skip_imghost_upload', 'imghost', 'manual_source', 'webdv', 'hardcoded-subs', 'dual_audio', 'manual_type', 'tvmaze_manual'
+            'skip_imghost_upload', 'imghost', 'manual_source', 'webdv', 'hardcoded-subs', 'dual_audio', 'manual_type', 'tvmaze_manual',
+            'no_cache', 'refresh_cache', 'concurrent_uploads'
         ]
         sanitized_saved_meta = {}
         for key, value in saved_meta.items():
@@ -76,8 +81,8 @@ async def merge_meta(meta, saved_meta, path):
     return sanitized_saved_meta
 
 
-async def process_meta(meta, base_dir):
-    """Process the metadata for each queued path."""
+async def gather_meta(meta, base_dir):
+    """Gather metadata, confirm it with the user and run the tracker checks."""
 
     if meta['imghost'] is None:
         meta['imghost'] = config['DEFAULT']['img_host_1']
@@ -130,133 +135,164 @@ async def process_meta(meta, base_dir):
         meta['skip_uploading'] = int(config['DEFAULT'].get('tracker_pass_checks', 1))
     if successful_trackers < meta['skip_uploading'] and not meta['debug']:
         console.print(f"[red]Not enough successful trackers ({successful_trackers}/{meta['skip_uploading']}). EXITING........[/red]")
+        return False
+
+    meta['we_are_uploading'] = True
+    return True
+
+
+async def capture_screens(meta, base_dir):
+    """Take the screenshots needed for the description."""
+    filename = meta.get('title', None)
+    bdmv_filename = meta.get('filename', None)
+    bdinfo = meta.get('bdinfo', None)
+    videopath = meta.get('filelist', [None])
+    videopath = videopath[0] if videopath else None
+    console.print(f"Processing {filename} for upload")
+    if 'manual_frames' not in meta:
+        meta['manual_frames'] = {}
+    manual_frames = meta['manual_frames']
+    # Take Screenshots
+    try:
+        if meta['is_disc'] == "BDMV":
+            use_vs = meta.get('vapoursynth', False)
+            try:
+                await disc_screenshots(
+                    meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
+                    meta.get('image_list', []), meta.get('ffdebug', False), None
+                )
+            except asyncio.CancelledError:
+                console.print("[red]Screenshot capture was cancelled. Cleaning up...[/red]")
+                await cleanup_screenshot_temp_files(meta)  # Cleanup only on cancellation
+                raise  # Ensure cancellation propagates properly
+            except Exception as e:
+                console.print(f"[red]Error during BDMV screenshot capture: {e}[/red]", highlight=False)
+                await cleanup_screenshot_temp_files(meta)  # Cleanup only on error
 
-    else:
-        meta['we_are_uploading'] = True
-        filename = meta.get('title', None)
-        bdmv_filename = meta.get('filename', None)
-        bdinfo = meta.get('bdinfo', None)
-        videopath = meta.get('filelist', [None])
-        videopath = videopath[0] if videopath else None
-        console.print(f"Processing {filename} for upload")
-        if 'manual_frames' not in meta:
-            meta['manual_frames'] = {}
-        manual_frames = meta['manual_frames']
-        # Take Screenshots
-        try:
-            if meta['is_disc'] == "BDMV":
-                use_vs = meta.get('vapoursynth', False)
-                try:
-                    await disc_screenshots(
-                        meta, bdmv_filename, bdinfo, meta['uuid'], base_dir, use_vs,
-                        meta.get('image_list', []), meta.get('ffdebug', False), None
-                    )
-                except asyncio.CancelledError:
-                    console.print("[red]Screenshot capture was cancelled. Cleaning up...[/red]")
-                    await cleanup_screenshot_temp_files(meta)  # Cleanup only on cancellation
-                    raise  # Ensure cancellation propagates properly
-                except Exception as e:
-                    console.print(f"[red]Error during BDMV screenshot capture: {e}[/red]", highlight=False)
-                    await cleanup_screenshot_temp_files(meta)  # Cleanup only on error
-
-            elif meta['is_disc'] == "DVD":
-                try:
-                    await dvd_screenshots(
-                        meta, 0, None, None
-                    )
-                except asyncio.CancelledError:
-                    console.print("[red]DVD screenshot capture was cancelled. Cleaning up...[/red]")
-                    await cleanup_screenshot_temp_files(meta)
-                    raise
-                except Exception as e:
-                    console.print(f"[red]Error during DVD screenshot capture: {e}[/red]", highlight=False)
-                    await cleanup_screenshot_temp_files(meta)
+        elif meta['is_disc'] == "DVD":
+            try:
+                await dvd_screenshots(
+                    meta, 0, None, None
+                )
+            except asyncio.CancelledError:
+                console.print("[red]DVD screenshot capture was cancelled. Cleaning up...[/red]")
+                await cleanup_screenshot_temp_files(meta)
+                raise
+            except Exception as e:
+                console.print(f"[red]Error during DVD screenshot capture: {e}[/red]", highlight=False)
+                await cleanup_screenshot_temp_files(meta)
 
-            else:
-                try:
-                    if meta['debug']:
-                        console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
-
-                    await screenshots(
-                        videopath, filename, meta['uuid'], base_dir, meta,
-                        manual_frames=manual_frames  # Pass additional kwargs directly
-                    )
-                except asyncio.CancelledError:
-                    console.print("[red]Generic screenshot capture was cancelled. Cleaning up...[/red]")
-                    await cleanup_screenshot_temp_files(meta)
-                    raise
-                except Exception as e:
-                    console.print(f"[red]Error during generic screenshot capture: {e}[/red]", highlight=False)
-                    await cleanup_screenshot_temp_files(meta)
+        else:
+            try:
+                if meta['debug']:
+                    console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
 
+                await screenshots(
+                    videopath, filename, meta['uuid'], base_dir, meta,
+                    manual_frames=manual_frames  # Pass additional kwargs directly
+                )
+            except asyncio.CancelledError:
+                console.print("[red]Generic screenshot capture was cancelled. Cleaning up...[/red]")
+                await cleanup_screenshot_temp_files(meta)
+                raise
+            except Exception as e:
+                console.print(f"[red]Error during generic screenshot capture: {e}[/red]", highlight=False)
+                await cleanup_screenshot_temp_files(meta)
+
+    except asyncio.CancelledError:
+        console.print("[red]Process was cancelled. Performing cleanup...[/red]")
+        await cleanup_screenshot_temp_files(meta)
+        raise
+    except Exception as e:
+        console.print(f"[red]Unexpected error occurred: {e}[/red]")
+        await cleanup_screenshot_temp_files(meta)
+    finally:
+        await asyncio.sleep(0.1)
+        reset_terminal()
+        gc.collect()
+    return True
+
+
+async def upload_images(meta):
+    """Upload the screenshots to the image host. Returns False if the upload was interrupted."""
+    meta['cutoff'] = int(config['DEFAULT'].get('cutoff_screens', 1))
+    if len(meta.get('image_list', [])) < meta.get('cutoff') and meta.get('skip_imghost_upload', False) is False:
+        if 'image_list' not in meta:
+            meta['image_list'] = []
+        return_dict = {}
+        try:
+            new_images, dummy_var = await upload_screens(
+                meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict
+            )
         except asyncio.CancelledError:
-            console.print("[red]Process was cancelled. Performing cleanup...[/red]")
-            await cleanup_screenshot_temp_files(meta)
-            raise
+            console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
+            return False
         except Exception as e:
-            console.print(f"[red]Unexpected error occurred: {e}[/red]")
-            await cleanup_screenshot_temp_files(meta)
+            console.print(f"\n[red]Unexpected error during upload: {e}[/red]")
         finally:
-            await asyncio.sleep(0.1)
             reset_terminal()
+            console.print("[yellow]Cleaning up resources...[/yellow]")
             gc.collect()
 
-        meta['cutoff'] = int(config['DEFAULT'].get('cutoff_screens', 1))
-        if len(meta.get('image_list', [])) < meta.get('cutoff') and meta.get('skip_imghost_upload', False) is False:
-            if 'image_list' not in meta:
-                meta['image_list'] = []
-            return_dict = {}
-            try:
-                new_images, dummy_var = await upload_screens(
-                    meta, meta['screens'], 1, 0, meta['screens'], [], return_dict=return_dict
-                )
-            except asyncio.CancelledError:
-                console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
-                return
-            except Exception as e:
-                console.print(f"\n[red]Unexpected error during upload: {e}[/red]")
-            finally:
-                reset_terminal()
-                console.print("[yellow]Cleaning up resources...[/yellow]")
-                gc.collect()
+    elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
+        meta['image_list'] = []
 
-        elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
-            meta['image_list'] = []
+    with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
+        json.dump(meta, f, indent=4)
+    return True
+
+
+async def create_torrents(meta):
+    """Create (or reuse) BASE.torrent, the randomized torrents and the description."""
+    if not meta['mkbrr']:
+        meta['mkbrr'] = int(config['DEFAULT'].get('mkbrr', False))
+    torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+    if not os.path.exists(torrent_path):
+        reuse_torrent = None
+        if meta.get('rehash', False) is False:
+            reuse_torrent = await client.find_existing_torrent(meta)
+            if reuse_torrent is not None:
+                await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+
+        if meta['nohash'] is False and reuse_torrent is None:
+            # Hash in a worker thread so other queue items keep moving
+            await asyncio.to_thread(create_torrent, meta, Path(meta['path']), "BASE")
+        if meta['nohash']:
+            meta['client'] = "none"
+
+    elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
+        await asyncio.to_thread(create_torrent, meta, Path(meta['path']), "BASE")
+
+    if int(meta.get('randomized', 0)) >= 1:
+        for torrent_path, infohash in create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path']):
+            console.print(f"[cyan]{os.path.basename(torrent_path)}: {infohash}")
 
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
+    prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    meta = await prep.gen_desc(meta)
 
-        if not meta['mkbrr']:
-            meta['mkbrr'] = int(config['DEFAULT'].get('mkbrr', False))
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+    if meta.get('description') in ('None', '', ' '):
+        meta['description'] = None
 
-            if meta['nohash'] is False and reuse_torrent is None:
-                create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
+    with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
+        json.dump(meta, f, indent=4)
+    return True
 
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            create_torrent(meta, Path(meta['path']), "BASE")
 
-        if int(meta.get('randomized', 0)) >= 1:
-            create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+async def upload_to_trackers(meta):
+    """Upload to every tracker that passed its checks."""
+    await process_trackers(meta, config, client, console, api_trackers, tracker_class_map, http_trackers, other_api_trackers)
+    return True
 
-        if 'saved_description' in meta and meta['saved_description'] is False:
-            meta = await prep.gen_desc(meta)
-        else:
-            meta = await prep.gen_desc(meta)
 
-        if meta.get('description') in ('None', '', ' '):
-            meta['description'] = None
+async def process_meta(meta, base_dir):
+    """Process the metadata for each queued path."""
+    if not await gather_meta(meta, base_dir):
+        return
 
-        with open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as f:
-            json.dump(meta, f, indent=4)
+    await capture_screens(meta, base_dir)
+    if not await upload_images(meta):
+        return
+    await create_torrents(meta)
 
 
 async def cleanup_screenshot_temp_files(meta):
@@ -302,6 +338,86 @@ async def save_processed_file(log_file, file_path):
         json.dump(list(processed_files), f, indent=4)
 
 
+async def load_queue_item(path, base_meta, base_dir):
+    """Build the meta for a single queued path, merging any saved meta.json."""
+    meta = base_meta.copy()
+    try:
+        meta['path'] = path
+        meta['uuid'] = None
+
+        if not path:
+            raise ValueError("The 'path' variable is not defined or is empty.")
+
+        meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+
+        if meta.get('delete_meta') and os.path.exists(meta_file):
+            os.remove(meta_file)
+            console.print("[bold red]Successfully deleted meta.json")
+
+        if os.path.exists(meta_file):
+            with open(meta_file, "r") as f:
+                saved_meta = json.load(f)
+                console.print("[yellow]Existing metadata file found, it holds cached values")
+                meta.update(await merge_meta(meta, saved_meta, path))
+        else:
+            if meta['debug']:
+                console.print(f"[yellow]No metadata file found at {meta_file}")
+
+    except Exception as e:
+        console.print(f"[red]Failed to load metadata for path '{path}': {e}")
+        reset_terminal()
+
+    return meta
+
+
+async def process_queue_pipelined(queue, base_meta, log_file, base_dir):
+    """Run the queue with prep, screenshots, image upload, hashing and tracker upload overlapping between items."""
+    if base_meta.get('limit_queue', 0) and base_meta['limit_queue'] > 0:
+        queue = queue[:base_meta['limit_queue']]
+    total_files = len(queue)
+    stage_limits = get_stage_limits(config, base_meta)
+    max_in_flight = int(base_meta['queue_pipeline'])
+    console.print(f"[cyan]Pipelined queue: {max_in_flight} item(s) in flight, stage limits {stage_limits}")
+
+    items = []
+    for path in queue:
+        items.append(await load_queue_item(path, base_meta, base_dir))
+
+    async def prep_stage(meta):
+        console.print(f"[green]Gathering info for {os.path.basename(meta['path'])}")
+        return await gather_meta(meta, base_dir)
+
+    async def screens_stage(meta):
+        return await capture_screens(meta, base_dir)
+
+    stages = [
+        ('prep', prep_stage),
+        ('screens', screens_stage),
+        ('images', upload_images),
+        ('hash', create_torrents),
+        ('upload', upload_to_trackers),
+    ]
+
+    processed_files_count = 0
+
+    async def item_done(index, meta, completed):
+        nonlocal processed_files_count
+        if 'we_are_uploading' not in meta:
+            console.print(f"we are not uploading....... ({os.path.basename(meta['path'])})")
+        if not completed:
+            return
+        if 'queue' in meta and meta.get('queue') is not None:
+            processed_files_count += 1
+            console.print(f"[cyan]Processed {processed_files_count}/{total_files} files.")
+            if not meta['debug'] and log_file:
+                await save_processed_file(log_file, meta['path'])
+
+    start_time = time.time()
+    await run_queue_pipeline(items, stages, stage_limits, max_in_flight, item_done, debug=base_meta.get('debug', False), prompt_stages=get_prompt_stages(base_meta))
+    if base_meta.get('debug'):
+        console.print(f"Pipelined queue processed in {time.time() - start_time:.4f} seconds")
+
+
 def reset_terminal():
     """Reset the terminal while allowing the script to continue running (Linux/macOS only)."""
 
@@ -423,6 +539,8 @@ async def do_the_thing(base_dir):
         if meta.get('cleanup') and os.path.exists(f"{base_dir}/tmp"):
             shutil.rmtree(f"{base_dir}/tmp")
             console.print("[bold green]Successfully emptied tmp directory")
+        if meta.get('cleanup') and purge_piece_cache():
+            console.print("[bold green]Successfully emptied piece hash cache")
 
         if not meta.get('path'):
             exit(0)
@@ -436,34 +554,14 @@ async def do_the_thing(base_dir):
 
         processed_files_count = 0
         base_meta = {k: v for k, v in meta.items()}
-        for path in queue:
-            total_files = len(queue)
-            try:
-                meta = base_meta.copy()
-                meta['path'] = path
-                meta['uuid'] = None
-
-                if not path:
-                    raise ValueError("The 'path' variable is not defined or is empty.")
-
-                meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
 
-                if meta.get('delete_meta') and os.path.exists(meta_file):
-                    os.remove(meta_file)
-                    console.print("[bold red]Successfully deleted meta.json")
+        if meta.get('queue_pipeline') and len(queue) > 1:
+            await process_queue_pipelined(queue, base_meta, log_file, base_dir)
+            return
 
-                if os.path.exists(meta_file):
-                    with open(meta_file, "r") as f:
-                        saved_meta = json.load(f)
-                        console.print("[yellow]Existing metadata file found, it holds cached values")
-                        meta.update(await merge_meta(meta, saved_meta, path))
-                else:
-                    if meta['debug']:
-                        console.print(f"[yellow]No metadata file found at {meta_file}")
-
-            except Exception as e:
-                console.print(f"[red]Failed to load metadata for path '{path}': {e}")
-                reset_terminal()
+        for path in queue:
+            total_files = len(queue)
+            meta = await load_queue_item(path, base_meta, base_dir)
 
             if meta['debug']:
                 start_time = time.time()
@@ -547,6 +645,13 @@ async def cleanup():
             except Exception:
                 pass
 
+    # Close pooled HTTP connections
+    await http_service.close()
+
+    # Stop the shared image optimization and VapourSynth workers
+    await asyncio.to_thread(image_pool.shutdown)
+    await asyncio.to_thread(vs_pool.shutdown)
+
     # Give some time for subprocess transport cleanup
     await asyncio.sleep(0.1)
 